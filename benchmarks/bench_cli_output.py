@@ -0,0 +1,37 @@
+"""Compare the Rich table output of ``phonetic WORD`` with the plain formats.
+
+Run with ``python benchmarks/bench_cli_output.py``.
+"""
+
+import io
+import timeit
+from contextlib import redirect_stdout
+
+from rich.console import Console
+
+from nato_phonetic import cli
+
+WORD = "N123AB"
+
+
+def _per_call(func, number: int = 500) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main() -> None:
+    sink = io.StringIO()
+    cli._console = Console(file=sink, force_terminal=True, width=80)
+    table = _per_call(lambda: cli.spell_word_command(WORD, "table"))
+    print(f"{'format':<8} {'µs/word':>9} {'vs table':>9}")
+    print(f"{'table':<8} {table:>9.1f} {'1.0x':>9}")
+    for fmt in ("plain", "tsv", "json", "csv"):
+        with redirect_stdout(sink):
+            cost = _per_call(lambda: cli.spell_word_command(WORD, fmt), number=5000)
+        print(f"{fmt:<8} {cost:>9.1f} {table / cost:>8.0f}x")
+        sink.seek(0)
+        sink.truncate()
+
+
+if __name__ == "__main__":
+    main()
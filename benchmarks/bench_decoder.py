@@ -0,0 +1,53 @@
+"""Measure exact and fuzzy decoding throughput.
+
+Run with ``python benchmarks/bench_decoder.py``.
+"""
+
+import random
+import time
+
+from nato_phonetic.core import NATO_PHONETIC_ALPHABET, spell_string
+from nato_phonetic.decoder import decode
+from nato_phonetic.fuzzy import edit_distance
+
+NOISE = {"Charlie": "Charly", "Kilo": "Kilow", "November": "Novembre", "Foxtrot": "Fox trot"}
+WORDS = [w.casefold() for w in NATO_PHONETIC_ALPHABET.values()]
+
+
+def _transcripts(count: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(0)
+    chars = list(NATO_PHONETIC_ALPHABET)
+    clean, noisy = [], []
+    for _ in range(count):
+        text = spell_string("".join(rng.choices(chars, k=12)))
+        clean.append(text)
+        for word, miss in NOISE.items():
+            text = text.replace(word, miss)
+        noisy.append(text)
+    return clean, noisy
+
+
+def naive_match(token: str) -> str:
+    """Compare a token against every vocabulary word."""
+    return min(WORDS, key=lambda w: edit_distance(token.casefold(), w))
+
+
+def _rate(label: str, func, items: list[str]) -> None:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<22} {len(items) / elapsed:>10,.0f} transcripts/s")
+
+
+def main() -> None:
+    clean, noisy = _transcripts(5_000)
+    print(f"{len(clean):,} transcripts of 12 words")
+    _rate("exact", decode, clean)
+    _rate("fuzzy (clean input)", lambda t: decode(t, fuzzy=True), clean)
+    _rate("fuzzy (noisy input)", lambda t: decode(t, fuzzy=True), noisy)
+    _rate("naive compare-all", lambda t: [naive_match(w) for w in t.split()], noisy[:500])
+
+
+if __name__ == "__main__":
+    main()
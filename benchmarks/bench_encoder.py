@@ -0,0 +1,86 @@
+"""Compare the precompiled encoder against the original per-character loop.
+
+Run with ``python benchmarks/bench_encoder.py``.
+"""
+
+import timeit
+
+from nato_phonetic.core import (
+    NATO_PHONETIC_ALPHABET,
+    spell_many,
+    spell_string,
+    spell_word,
+)
+
+INPUTS = {
+    "callsign": "N123AB",
+    "order-id": "ORD-2024-000187",
+    "sentence": "The quick brown fox jumps over the lazy dog 0123456789" * 4,
+}
+
+
+def loop_spell_word(word: str) -> list[tuple[str, str]]:
+    """The pre-encoder implementation of ``spell_word``, kept as a baseline."""
+    result = []
+    for char in word.upper():
+        if char.isalnum():
+            phonetic = NATO_PHONETIC_ALPHABET.get(char)
+            if phonetic:
+                result.append((char, phonetic))
+            else:
+                result.append((char, "Unknown"))
+        elif char.isspace():
+            result.append((char, "Space"))
+        else:
+            result.append((char, "Special"))
+    return result
+
+
+def loop_spell_string(word: str) -> str:
+    return " ".join(phonetic for _, phonetic in loop_spell_word(word))
+
+
+def _per_call(func, arg: str, number: int) -> float:
+    best = min(timeit.repeat(lambda: func(arg), number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main() -> None:
+    print(f"{'input':<10} {'output':<7} {'loop µs':>9} {'encoder µs':>11} {'speedup':>8}")
+    for name, word in INPUTS.items():
+        number = max(1000, 200_000 // len(word))
+        for label, baseline, fast in (
+            ("tuples", loop_spell_word, spell_word),
+            ("string", loop_spell_string, spell_string),
+        ):
+            before = _per_call(baseline, word, number)
+            after = _per_call(fast, word, number)
+            print(f"{name:<10} {label:<7} {before:>9.2f} {after:>11.2f} {before / after:>7.1f}x")
+
+    batch = [f"ORD-{i:06d}" for i in range(100_000)]
+    print(f"\nbatch of {len(batch):,} ids")
+    for label, func in (
+        ("loop spell_word", lambda: [spell_word(w) for w in batch]),
+        ("spell_many tuples", lambda: spell_many(batch)),
+        ("spell_many strings", lambda: spell_many(batch, output="strings")),
+        ("spell_many flat", lambda: spell_many(batch, output="flat")),
+    ):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"  {label:<20} {seconds * 1000:>8.1f} ms")
+
+    names = ["Müller", "Ørsted", "Zoë", "Łukasz", "Дмитрий", "Σοφία", "Smith"] * 10_000
+    print(f"\nbatch of {len(names):,} international names")
+    for label, func in (
+        ("spell_many strings", lambda: spell_many(names, output="strings")),
+        (
+            "+ transliterate",
+            lambda: spell_many(names, output="strings", transliterate=True),
+        ),
+        ("ascii baseline", lambda: spell_many(["Muller"] * len(names), output="strings")),
+    ):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"  {label:<20} {seconds * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare in-process and process-pool spelling of a large corpus.
+
+Run with ``python benchmarks/bench_parallel.py``. Speed-ups need as many
+free CPU cores as workers; on a single core the pool only adds overhead.
+"""
+
+import io
+import os
+import time
+
+from nato_phonetic.core import spell_lines, spell_many
+from nato_phonetic.formats import write_records
+from nato_phonetic.parallel import format_lines
+
+WORDS = [f"N{i}AB-{i % 97} Flight {i * 7919 % 10000}" for i in range(500_000)]
+LINES = [f"{word}\n" for word in WORDS]
+
+
+def _time(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:6.2f}s  {len(WORDS) / elapsed:>12,.0f} words/s")
+
+
+def main() -> None:
+    print(f"{len(WORDS):,} words, {os.cpu_count()} CPUs")
+    _time("spell_many flat, in-process", lambda: spell_many(WORDS, output="flat"))
+    for workers in (2, 4, 8):
+        _time(
+            f"spell_many flat, {workers} workers",
+            lambda: spell_many(WORDS, output="flat", workers=workers),
+        )
+    _time("encode tsv, in-process", lambda: write_records(spell_lines(LINES), io.StringIO(), "tsv"))
+    for workers in (2, 4, 8):
+        _time(
+            f"encode tsv, {workers} workers",
+            lambda: io.StringIO().writelines(format_lines(LINES, "tsv", workers)),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Load-test ``phonetic http`` over keep-alive connections on localhost.
+
+Run with ``python benchmarks/http_load.py`` to start a server in a child
+process, or pass ``--port`` to hit one that is already running.
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+
+PATHS = (
+    "/spell?text=N123AB",
+    "/spell?text=N123AB&format=plain",
+    "/decode?text=Hotel+Echo+Lima",
+    "/alphabet",
+)
+
+
+async def _client(port: int, requests: int, path: bytes) -> int:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = b"GET " + path + b" HTTP/1.1\r\nHost: localhost\r\n\r\n"
+    ok = 0
+    for _ in range(requests):
+        writer.write(request)
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in head.split(b"\r\n"):
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":", 1)[1])
+        await reader.readexactly(length)
+        ok += head.startswith(b"HTTP/1.1 200")
+    writer.close()
+    await writer.wait_closed()
+    return ok
+
+
+async def _load(port: int, connections: int, requests: int, path: str) -> None:
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_client(port, requests, path.encode()) for _ in range(connections))
+    )
+    elapsed = time.perf_counter() - start
+    total = connections * requests
+    print(
+        f"{path}: {total:,} requests over {connections} connections in "
+        f"{elapsed:.2f}s = {total / elapsed:,.0f} req/s ({sum(results):,} OK)"
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise SystemExit(f"server on port {port} did not come up")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test phonetic http.")
+    parser.add_argument("--port", type=int, help="Port of a running server.")
+    parser.add_argument("-c", "--connections", type=int, default=64)
+    parser.add_argument("-n", "--requests", type=int, default=500, help="Per connection.")
+    args = parser.parse_args()
+
+    child = None
+    port = args.port
+    if port is None:
+        port = _free_port()
+        child = subprocess.Popen(
+            [sys.executable, "-m", "nato_phonetic", "http", "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        _wait_for(port)
+        for path in PATHS:
+            asyncio.run(_load(port, args.connections, args.requests, path))
+    finally:
+        if child is not None:
+            child.terminate()
+            child.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Time the core, CLI, asset and build paths and compare against a baseline.
+
+Run with ``python benchmarks/run.py``. Each case reports the best
+per-call time over several repeats. ``--save-baseline`` stores the run in
+``benchmarks/baseline.json``; later runs compare against it and exit with
+status 1 if any case is more than ``--threshold`` slower. Baselines are
+only comparable on the same machine and Python version.
+
+The build cases need the ``build`` extra and are skipped without it.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import timeit
+from contextlib import ExitStack, redirect_stdout
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+# ``scripts.build_assets`` is imported from the checkout, not the package.
+sys.path.insert(0, str(ROOT))
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.3
+
+INPUTS = {
+    "short": "N123AB",
+    "long": "The quick brown fox jumps over the lazy dog 0123456789" * 20,
+    "unicode": "Ærøskøbing – Ünïcödé Straße 東京 Жжж",
+}
+
+Case = tuple[str, Callable[[], object]]
+
+
+def core_cases() -> Iterator[Case]:
+    from nato_phonetic.core import get_full_alphabet, lookup_letter, spell_word
+
+    for name, text in INPUTS.items():
+        yield f"core.spell_word[{name}]", partial(spell_word, text)
+    yield "core.spell_word[unicode,transliterate]", partial(
+        spell_word, INPUTS["unicode"], transliterate=True
+    )
+    yield "core.lookup_letter", partial(lookup_letter, "q")
+    yield "core.get_full_alphabet", get_full_alphabet
+
+
+def cli_cases() -> Iterator[Case]:
+    from rich.console import Console
+
+    from nato_phonetic import cli
+
+    sink = io.StringIO()
+    cli._console = Console(file=sink, force_terminal=True, width=80)
+
+    def render(fmt: str) -> None:
+        with redirect_stdout(sink):
+            cli.spell_word_command(INPUTS["short"], fmt)
+        sink.seek(0)
+        sink.truncate()
+
+    yield "cli.spell_word_command[table]", partial(render, "table")
+    yield "cli.spell_word_command[plain]", partial(render, "plain")
+    command = [sys.executable, "-m", "nato_phonetic", INPUTS["short"]]
+    yield "cli.cold_start", partial(subprocess.run, command, stdout=subprocess.DEVNULL, check=True)
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def asset_cases(stack: ExitStack) -> Iterator[Case]:
+    from rich.console import Console
+
+    from nato_phonetic import assets
+
+    tmp = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+    os.environ["XDG_CACHE_HOME"] = str(tmp / "cache")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=str(ROOT)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stack.callback(server.server_close)
+    stack.callback(server.shutdown)
+    # Serve the assets from the checkout instead of Codeberg.
+    assets.RAW_BASE = f"http://127.0.0.1:{server.server_port}/"
+
+    console = Console(file=io.StringIO())
+    download = partial(assets.download_asset, "pdf", tmp / "out", console=console)
+    yield "assets.download_asset[fetch]", partial(download, force=True)
+    yield "assets.download_asset[cached]", download
+
+
+def build_cases(stack: ExitStack) -> Iterator[Case]:
+    from scripts.build_assets import graph
+    from scripts.build_assets.cards import build_html, build_svg
+
+    out = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+    for target in graph.TARGETS:
+        label = f"{target.module}{'-landscape' if target.args == (True,) else ''}"
+        yield f"build.{label}", partial(target.build, out / target.filename)
+    yield "build.html", partial(build_html, out / "card.html")
+    yield "build.svg", partial(build_svg, out / "card.svg")
+
+
+def cases(stack: ExitStack) -> Iterator[Case]:
+    yield from core_cases()
+    yield from cli_cases()
+    yield from asset_cases(stack)
+    try:
+        import docx, ebooklib, reportlab  # noqa: E401, F401
+    except ImportError:
+        print("build extra not installed; skipping build cases", file=sys.stderr)
+        return
+    yield from build_cases(stack)
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict:
+    """Return the best and median per-call time of ``func`` in microseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = sorted(t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number))
+    return {"best_us": round(times[0], 3), "median_us": round(times[len(times) // 2], 3)}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return a message for every case more than ``threshold`` slower than ``baseline``."""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before and result["best_us"] > before["best_us"] * (1 + threshold):
+            ratio = result["best_us"] / before["best_us"]
+            regressions.append(
+                f"{name}: {before['best_us']:.1f} -> {result['best_us']:.1f} µs ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="Only run cases whose name contains this.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Timing repeats per case.")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file.")
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE, help=f"Baseline file (default: {BASELINE.name})."
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store this run as the baseline."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction (default: %(default)s).",
+    )
+    args = parser.parse_args()
+
+    baseline: dict = {}
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+
+    results = {}
+    print(f"{'case':<42} {'best µs':>11} {'median µs':>11} {'vs base':>8}")
+    with ExitStack() as stack:
+        for name, func in cases(stack):
+            if args.filter not in name:
+                continue
+            results[name] = result = measure(func, args.repeat)
+            before: Optional[dict] = baseline.get(name)
+            ratio = f"{result['best_us'] / before['best_us']:.2f}x" if before else "new"
+            print(f"{name:<42} {result['best_us']:>11.1f} {result['median_us']:>11.1f} {ratio:>8}")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    for path in (args.json, args.baseline if args.save_baseline else None):
+        if path is not None:
+            path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            print(f"wrote {path}")
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regressed by more than {args.threshold:.0%}:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
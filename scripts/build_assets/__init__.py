@@ -1,7 +1,36 @@
-"""Generators for the printable NATO phonetic alphabet assets."""
+"""Generators for the printable NATO phonetic alphabet assets.
 
-from .docx import build_docx
-from .epub import build_epub
-from .pdf import build_pdf
+The generators are imported on first use, so that checking whether anything
+needs rebuilding does not pay for loading reportlab, python-docx and ebooklib.
+The HTML, SVG and Markdown cards need only the standard library.
+"""
 
-__all__ = ["build_pdf", "build_docx", "build_epub"]
+from importlib import import_module
+
+from .manifest import write_manifest
+
+__all__ = [
+    "build_pdf",
+    "build_docx",
+    "build_epub",
+    "build_html",
+    "build_svg",
+    "build_markdown",
+    "write_manifest",
+]
+
+_BUILDERS = {
+    "build_pdf": ".pdf",
+    "build_docx": ".docx",
+    "build_epub": ".epub",
+    "build_html": ".cards",
+    "build_svg": ".cards",
+    "build_markdown": ".cards",
+}
+
+
+def __getattr__(name: str):
+    module = _BUILDERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
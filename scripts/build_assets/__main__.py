@@ -1,9 +1,9 @@
-"""CLI entry: `python -m scripts.build_assets [--out DIR]`."""
+"""CLI entry: `python -m scripts.build_assets [--out DIR] [--force] [--jobs N] [--manifest-only]`."""
 
 import argparse
 from pathlib import Path
 
-from . import build_docx, build_epub, build_pdf, config
+from . import config, graph, write_manifest
 
 
 def main() -> None:
@@ -14,19 +14,50 @@ def main() -> None:
         default=Path.cwd(),
         help="Destination directory (default: current working directory).",
     )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=config.MANIFEST_PATH,
+        help="Where to write the checksum manifest (default: the package's asset_manifest.json).",
+    )
+    parser.add_argument(
+        "--manifest-only",
+        action="store_true",
+        help="Only rewrite the manifest from the assets already in --out.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every asset, even if its inputs are unchanged.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Assets to build in parallel (default: one per CPU).",
+    )
     args = parser.parse_args()
     out = args.out
     out.mkdir(parents=True, exist_ok=True)
 
-    targets = [
-        (out / config.PDF_PORTRAIT_NAME, lambda d: build_pdf(False, d)),
-        (out / config.PDF_LANDSCAPE_NAME, lambda d: build_pdf(True, d)),
-        (out / config.DOCX_NAME, build_docx),
-        (out / config.EPUB_NAME, build_epub),
-    ]
-    for dest, builder in targets:
-        builder(dest)
-        print(f"wrote {dest}")
+    if not args.manifest_only:
+        state_path = out / graph.STATE_NAME
+        state = graph.load_state(state_path)
+        stale = graph.stale_targets(out, state, force=args.force)
+        rebuilt = {target.filename for target, _ in stale}
+        for target in graph.TARGETS:
+            if target.filename not in rebuilt:
+                print(f"up to date {out / target.filename}")
+        try:
+            graph.build(
+                stale, out, state, jobs=args.jobs, on_built=lambda dest: print(f"wrote {dest}")
+            )
+        finally:
+            graph.save_state(state_path, state)
+
+    write_manifest([out / target.filename for target in graph.TARGETS], args.manifest)
+    print(f"wrote {args.manifest}")
 
 
 if __name__ == "__main__":
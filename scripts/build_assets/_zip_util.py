@@ -1,27 +1,63 @@
-"""Make zip-based outputs (DOCX, EPub) byte-deterministic."""
+"""Write zip-based outputs (DOCX, EPub) byte-deterministically in one pass."""
 
+import shutil
 import zipfile
+from contextlib import contextmanager
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import IO, Callable, Iterator, Mapping, Optional
 
 _FIXED_DATETIME = (2024, 1, 1, 0, 0, 0)
+_CHUNK = 64 * 1024
+# Archives the libraries write stay in memory up to this size, then spill
+# to a temporary file.
+_SPOOL_LIMIT = 8 * 1024 * 1024
 
+_MIMETYPE = "mimetype"
 
-def normalize_zip(path: Path) -> None:
-    """Rewrite ``path`` so every member has the same fixed mtime.
 
-    DOCX and EPub files are zip archives. python-docx and ebooklib write
-    members with the current timestamp, which makes byte-deterministic
-    output impossible. This rewrites the archive in place with a fixed
-    epoch on every member so subsequent builds produce identical bytes.
+@contextmanager
+def deterministic_zip(
+    dest: Path, transforms: Optional[Mapping[str, Callable[[bytes], bytes]]] = None
+) -> Iterator[IO[bytes]]:
+    """Yield a buffer to write an archive into, then copy it to ``dest`` with :func:`copy_zip`.
+
+    python-docx and ebooklib write members with the current timestamp,
+    which makes byte-deterministic output impossible, so they write into the
+    buffer and the final archive is produced from it in a single pass.
+    """
+    with SpooledTemporaryFile(max_size=_SPOOL_LIMIT) as buffer:
+        yield buffer
+        buffer.seek(0)
+        copy_zip(buffer, dest, transforms)
+
+
+def copy_zip(
+    source: IO[bytes],
+    dest: Path,
+    transforms: Optional[Mapping[str, Callable[[bytes], bytes]]] = None,
+) -> None:
+    """Copy the archive ``source`` to ``dest`` with a fixed mtime on every member.
+
+    Members are streamed one at a time, keeping their order, compression
+    and attributes, except that a ``mimetype`` member is written first and
+    stored uncompressed as EPub requires. ``transforms`` maps a filename
+    suffix (e.g. ``".opf"``) to a function applied to matching members on
+    the way through; only those members are read into memory.
     """
-    with zipfile.ZipFile(path, "r") as src:
-        members = [
-            (info.filename, src.read(info.filename), info.compress_type, info.external_attr)
-            for info in src.infolist()
-        ]
-    with zipfile.ZipFile(path, "w") as dst:
-        for filename, data, compress_type, external_attr in members:
-            zi = zipfile.ZipInfo(filename, date_time=_FIXED_DATETIME)
-            zi.compress_type = compress_type
-            zi.external_attr = external_attr
-            dst.writestr(zi, data)
+    transforms = transforms or {}
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(dest, "w") as dst:
+        infos = src.infolist()
+        infos.sort(key=lambda info: info.filename != _MIMETYPE)
+        for info in infos:
+            zi = zipfile.ZipInfo(info.filename, date_time=_FIXED_DATETIME)
+            zi.compress_type = zipfile.ZIP_STORED if info.filename == _MIMETYPE else info.compress_type
+            zi.external_attr = info.external_attr
+            transform = next(
+                (fn for suffix, fn in transforms.items() if info.filename.endswith(suffix)), None
+            )
+            if transform is not None:
+                dst.writestr(zi, transform(src.read(info)))
+                continue
+            with src.open(info) as member, dst.open(zi, "w") as out:
+                shutil.copyfileobj(member, out, _CHUNK)
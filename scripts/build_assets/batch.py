@@ -0,0 +1,204 @@
+"""Render personalised cheat sheets by the thousand.
+
+CLI entry: `python -m scripts.build_assets.batch VARIANTS.json --out DIR|FILE.zip [-f FORMAT]...`
+
+Each worker process prepares the per-format templates (registered fonts,
+paragraph styles, CSS, embedded font and badge bytes, the blank DOCX) once
+in its initializer, then renders variants against them. Outputs are
+written straight into a directory, or streamed into a single zip archive
+as they arrive.
+"""
+
+import argparse
+import json
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from importlib import import_module
+from io import BytesIO
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+from nato_phonetic.alphabets import get_alphabet
+
+from ._zip_util import _FIXED_DATETIME
+from .sheet import Sheet
+
+# Output suffix, generator module and template arguments per format.
+FORMATS: dict[str, tuple[str, str, tuple]] = {
+    "pdf": (".pdf", "pdf", (False,)),
+    "pdf-landscape": ("-landscape.pdf", "pdf", (True,)),
+    "docx": (".docx", "docx", ()),
+    "epub": (".epub", "epub", ()),
+    "html": (".html", "cards", ("html",)),
+    "svg": (".svg", "cards", ("svg",)),
+    "md": (".md", "cards", ("md",)),
+}
+
+# Archives are stored as they are; the formats are compressed already.
+_STORED = frozenset({"docx", "epub"})
+
+
+@dataclass(frozen=True)
+class Variant:
+    """One personalised sheet: ``name`` is the output file stem, e.g. ``"team-blue"``."""
+
+    name: str
+    sheet: Sheet
+
+    def __post_init__(self) -> None:
+        if not self.name or self.name.startswith(".") or "/" in self.name or "\\" in self.name:
+            raise ValueError(f"Invalid variant name {self.name!r}")
+
+
+def load_variants(path: Path) -> list[Variant]:
+    """Read variants from a JSON list of objects.
+
+    Each object has a ``name`` and optionally a ``title``, an ``alphabet``
+    (a registered alphabet name or a letter-to-word mapping) and
+    ``extra_rows`` as ``[label, word]`` pairs.
+    """
+    variants = []
+    for entry in json.loads(path.read_text(encoding="utf-8")):
+        alphabet = entry.get("alphabet", "nato")
+        if isinstance(alphabet, str):
+            alphabet = get_alphabet(alphabet).letters
+        sheet = Sheet(
+            title=entry.get("title", Sheet.title),
+            alphabet=alphabet,
+            extra_rows=tuple((str(label), str(word)) for label, word in entry.get("extra_rows", ())),
+        )
+        variants.append(Variant(entry["name"], sheet))
+    return variants
+
+
+def _template(fmt: str):
+    _, module, args = FORMATS[fmt]
+    return import_module(f".{module}", __package__).template(*args)
+
+
+def _prepare(formats: Sequence[str]) -> None:
+    for fmt in formats:
+        _template(fmt)
+
+
+def _filename(variant: Variant, fmt: str) -> str:
+    return variant.name + FORMATS[fmt][0]
+
+
+def _render_file(variant: Variant, fmt: str, out: Path) -> str:
+    name = _filename(variant, fmt)
+    _template(fmt).render(variant.sheet, out / name)
+    return name
+
+
+def _render_bytes(variant: Variant, fmt: str) -> tuple[str, bytes]:
+    buffer = BytesIO()
+    _template(fmt).render(variant.sheet, buffer)
+    return _filename(variant, fmt), buffer.getvalue()
+
+
+def generate(
+    variants: Iterable[Variant],
+    out: Path,
+    *,
+    formats: Sequence[str] = ("pdf",),
+    jobs: Optional[int] = None,
+    on_output: Callable[[str], None] = lambda name: None,
+) -> int:
+    """Render every variant in every format; return the number of files written.
+
+    Args:
+        variants: The sheets to render; consumed lazily
+        out: A directory, or a path ending in ``.zip`` to write one archive
+        formats: Keys of :data:`FORMATS`
+        jobs: Worker processes (default: one per CPU); 1 renders in this process
+        on_output: Called with each file name as it is written
+
+    Raises:
+        ValueError: If a format is unknown
+    """
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown format {unknown[0]!r}. Valid formats: {', '.join(FORMATS)}")
+    tasks = ((variant, fmt) for variant in variants for fmt in formats)
+    jobs = jobs or os.cpu_count() or 1
+
+    if out.suffix == ".zip":
+        out.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with zipfile.ZipFile(out, "w") as archive:
+            for name, data in _run(_render_bytes, tasks, (), formats, jobs):
+                info = zipfile.ZipInfo(name, date_time=_FIXED_DATETIME)
+                stored = any(name.endswith(FORMATS[fmt][0]) for fmt in _STORED)
+                info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+                archive.writestr(info, data)
+                on_output(name)
+                count += 1
+        return count
+
+    out.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for name in _run(_render_file, tasks, (out,), formats, jobs):
+        on_output(name)
+        count += 1
+    return count
+
+
+def _run(render, tasks, extra: tuple, formats: Sequence[str], jobs: int) -> Iterator:
+    """Yield ``render(variant, fmt, *extra)`` for every task, in order.
+
+    At most ``2 * jobs`` renders are in flight, so memory stays bounded
+    however many variants there are.
+    """
+    if jobs == 1:
+        _prepare(formats)
+        for variant, fmt in tasks:
+            yield render(variant, fmt, *extra)
+        return
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_prepare, initargs=(tuple(formats),)) as pool:
+        while True:
+            for variant, fmt in islice(tasks, 2 * jobs - len(pending)):
+                pending.append(pool.submit(render, variant, fmt, *extra))
+            if not pending:
+                return
+            yield pending.popleft().result()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate personalised NATO alphabet sheets.")
+    parser.add_argument("variants", type=Path, help="JSON file listing the variants.")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        required=True,
+        help="Destination directory, or a .zip file to write one archive.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="formats",
+        action="append",
+        choices=list(FORMATS),
+        help="Output format; repeatable (default: pdf).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU).",
+    )
+    args = parser.parse_args()
+    count = generate(
+        load_variants(args.variants), args.out, formats=args.formats or ["pdf"], jobs=args.jobs
+    )
+    print(f"wrote {count} files to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
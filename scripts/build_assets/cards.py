@@ -0,0 +1,45 @@
+"""HTML, SVG and Markdown cards: the stdlib renderers from ``nato_phonetic.cards``."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Union
+
+from nato_phonetic.cards import RENDERERS
+
+from .sheet import DEFAULT_SHEET, Sheet
+
+
+class CardTemplate:
+    """Writes a sheet as a text card in one of :data:`~nato_phonetic.cards.FORMATS`."""
+
+    def __init__(self, fmt: str) -> None:
+        self.renderer = RENDERERS[fmt]
+
+    def render(self, sheet: Sheet, dest: Union[Path, IO[bytes]]) -> None:
+        """Write ``sheet`` as UTF-8 to a path or binary file."""
+        data = self.renderer(sheet.rows(), sheet.title).encode("utf-8")
+        if isinstance(dest, Path):
+            dest.write_bytes(data)
+        else:
+            dest.write(data)
+
+
+@lru_cache(maxsize=None)
+def template(fmt: str) -> CardTemplate:
+    """Return the shared :class:`CardTemplate` for ``fmt``."""
+    return CardTemplate(fmt)
+
+
+def build_html(dest: Path, sheet: Sheet = DEFAULT_SHEET) -> None:
+    """Generate a standalone HTML page of the NATO phonetic alphabet."""
+    template("html").render(sheet, dest)
+
+
+def build_svg(dest: Path, sheet: Sheet = DEFAULT_SHEET) -> None:
+    """Generate an SVG card of the NATO phonetic alphabet."""
+    template("svg").render(sheet, dest)
+
+
+def build_markdown(dest: Path, sheet: Sheet = DEFAULT_SHEET) -> None:
+    """Generate a Markdown table of the NATO phonetic alphabet."""
+    template("md").render(sheet, dest)
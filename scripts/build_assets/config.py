@@ -2,26 +2,31 @@
 
 from pathlib import Path
 
+# The layout is shared with the stdlib HTML/SVG/Markdown cards in the package.
+from nato_phonetic.cards import (  # noqa: F401
+    AUTHOR_URL,
+    BODY_FONT_SIZE,
+    GRID_COLOR,
+    HEADER_FONT_NAME,
+    HEADER_FONT_SIZE,
+    LICENSE_TEXT,
+    LICENSE_URL,
+    LINK_COLOR,
+    PROJECT_URL,
+    ROW_HEIGHT,
+    TITLE,
+    ZEBRA_COLOR,
+)
+
 PROJECT_ROOT = Path(__file__).resolve().parent
 FONT_PATH = PROJECT_ROOT / "fonts" / "SourceCodePro-Regular.ttf"
 CC_ICON_PATH = PROJECT_ROOT / "assets" / "cc-by-sa.png"
 
-TITLE = "Nato Phonetic Alphabet"
-
-HEADER_FONT_NAME = "SourceCodePro"
-HEADER_FONT_SIZE = 32
-BODY_FONT_SIZE = 14
-ROW_HEIGHT = 28
-GRID_COLOR = "#cccccc"
-ZEBRA_COLOR = "#f4f4f4"
-LINK_COLOR = "#1f88c5"
-
-LICENSE_TEXT = "© 2024 by Matt Troutman is licensed under CC BY-SA 4.0"
-PROJECT_URL = "https://trtmn.io/nato-phonetic-alphabet"
-AUTHOR_URL = "https://trtmn.io"
-LICENSE_URL = "https://creativecommons.org/licenses/by-sa/4.0/"
-
 PDF_PORTRAIT_NAME = "Nato Phonetic Alphabet - PDF.pdf"
 PDF_LANDSCAPE_NAME = "Nato Phonetic Alphabet (Landscape) - PDF.pdf"
 DOCX_NAME = "Nato Phonetic Alphabet - Microsoft Word.docx"
 EPUB_NAME = "Nato Phonetic Alphabet - EPub.epub"
+
+# Sizes and hashes of the built assets, shipped with the package so that
+# downloads can be verified.
+MANIFEST_PATH = PROJECT_ROOT.parents[1] / "src" / "nato_phonetic" / "asset_manifest.json"
@@ -1,7 +1,10 @@
 """DOCX generator: matches the PDF's two-column layout where DOCX allows."""
 
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from typing import IO, Union
 
 from docx import Document
 from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
@@ -10,10 +13,9 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from docx.shared import Pt, RGBColor
 
-from nato_phonetic.core import NATO_PHONETIC_ALPHABET
-
 from . import config
-from ._zip_util import normalize_zip
+from ._zip_util import deterministic_zip
+from .sheet import DEFAULT_SHEET, Sheet
 
 
 def _set_cell_shading(cell, hex_color: str) -> None:
@@ -28,55 +30,76 @@ def _set_cell_shading(cell, hex_color: str) -> None:
 _DETERMINISTIC_EPOCH = datetime(2024, 1, 1, 0, 0, 0)
 
 
-def build_docx(dest: Path) -> None:
+class DocxTemplate:
+    """The blank document and run formatting, prepared once for every sheet."""
+
+    def __init__(self) -> None:
+        blank = BytesIO()
+        Document().save(blank)
+        self.blank = blank.getvalue()
+        self.header_size = Pt(config.HEADER_FONT_SIZE)
+        self.body_size = Pt(config.BODY_FONT_SIZE)
+        self.footer_size = Pt(10)
+        self.footer_color = RGBColor(0x33, 0x33, 0x33)
+
+    def render(self, sheet: Sheet, dest: Union[Path, IO[bytes]]) -> None:
+        """Write ``sheet`` as a DOCX to a path or seekable binary file."""
+        doc = Document(BytesIO(self.blank))
+        doc.core_properties.author = "Matt Troutman"
+        doc.core_properties.created = _DETERMINISTIC_EPOCH
+        doc.core_properties.modified = _DETERMINISTIC_EPOCH
+        doc.core_properties.last_modified_by = "build_assets"
+        doc.core_properties.revision = 1
+
+        title = doc.add_paragraph()
+        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        run = title.add_run(sheet.title)
+        run.font.name = "Source Code Pro"
+        run.font.size = self.header_size
+
+        doc.add_paragraph()
+
+        pairs = sheet.pairs()
+        table = doc.add_table(rows=len(pairs), cols=4)
+        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        table.style = "Table Grid"
+
+        for i, values in enumerate(pairs):
+            row = table.rows[i]
+            cells = row.cells
+            for col_idx, value in enumerate(values):
+                cell = cells[col_idx]
+                cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+                cell.text = ""
+                paragraph = cell.paragraphs[0]
+                paragraph.alignment = (
+                    WD_ALIGN_PARAGRAPH.LEFT if col_idx % 2 == 0 else WD_ALIGN_PARAGRAPH.CENTER
+                )
+                run = paragraph.add_run(value)
+                run.font.name = "Source Code Pro"
+                run.font.size = self.body_size
+                if i % 2 == 1:
+                    _set_cell_shading(cell, config.ZEBRA_COLOR)
+
+        doc.add_paragraph()
+
+        footer = doc.add_paragraph()
+        footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        footer_run = footer.add_run(f"{config.TITLE} {config.LICENSE_TEXT}")
+        footer_run.font.name = "Source Code Pro"
+        footer_run.font.size = self.footer_size
+        footer_run.font.color.rgb = self.footer_color
+
+        with deterministic_zip(dest) as buffer:
+            doc.save(buffer)
+
+
+@lru_cache(maxsize=None)
+def template() -> DocxTemplate:
+    """Return the shared :class:`DocxTemplate`."""
+    return DocxTemplate()
+
+
+def build_docx(dest: Path, sheet: Sheet = DEFAULT_SHEET) -> None:
     """Generate a printable DOCX of the NATO phonetic alphabet."""
-    doc = Document()
-    doc.core_properties.author = "Matt Troutman"
-    doc.core_properties.created = _DETERMINISTIC_EPOCH
-    doc.core_properties.modified = _DETERMINISTIC_EPOCH
-    doc.core_properties.last_modified_by = "build_assets"
-    doc.core_properties.revision = 1
-
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = title.add_run(config.TITLE)
-    run.font.name = "Source Code Pro"
-    run.font.size = Pt(config.HEADER_FONT_SIZE)
-
-    doc.add_paragraph()
-
-    letters = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
-    table = doc.add_table(rows=13, cols=4)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.style = "Table Grid"
-
-    for i in range(13):
-        left, right = letters[i], letters[i + 13]
-        row = table.rows[i]
-        cells = row.cells
-        values = [left, NATO_PHONETIC_ALPHABET[left], right, NATO_PHONETIC_ALPHABET[right]]
-        for col_idx, value in enumerate(values):
-            cell = cells[col_idx]
-            cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-            cell.text = ""
-            paragraph = cell.paragraphs[0]
-            paragraph.alignment = (
-                WD_ALIGN_PARAGRAPH.LEFT if col_idx % 2 == 0 else WD_ALIGN_PARAGRAPH.CENTER
-            )
-            run = paragraph.add_run(value)
-            run.font.name = "Source Code Pro"
-            run.font.size = Pt(config.BODY_FONT_SIZE)
-            if i % 2 == 1:
-                _set_cell_shading(cell, config.ZEBRA_COLOR)
-
-    doc.add_paragraph()
-
-    footer = doc.add_paragraph()
-    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    footer_run = footer.add_run(f"{config.TITLE} {config.LICENSE_TEXT}")
-    footer_run.font.name = "Source Code Pro"
-    footer_run.font.size = Pt(10)
-    footer_run.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-
-    doc.save(str(dest))
-    normalize_zip(dest)
+    template().render(sheet, dest)
@@ -1,15 +1,17 @@
 """EPub generator using ebooklib."""
 
 import re
-import zipfile
+from functools import lru_cache
 from pathlib import Path
+from typing import IO, Union
+from xml.sax.saxutils import escape
 
 from ebooklib import epub
 
-from nato_phonetic.core import NATO_PHONETIC_ALPHABET
-
 from . import config
-from ._zip_util import normalize_zip
+from ._zip_util import deterministic_zip
+from .fonts import subset_font
+from .sheet import DEFAULT_SHEET, Sheet
 
 _FIXED_MODIFIED = b"2024-01-01T00:00:00Z"
 _MODIFIED_RE = re.compile(
@@ -52,51 +54,34 @@ footer .badge {{
 """
 
 
-def _row_html(letter: str) -> str:
+def _row_html(label: str, word: str) -> str:
     return (
-        f'<tr><td class="letter"><b>{letter}</b></td>'
-        f"<td>{NATO_PHONETIC_ALPHABET[letter]}</td></tr>"
+        f'<tr><td class="letter"><b>{escape(label)}</b></td>'
+        f"<td>{escape(word)}</td></tr>"
     )
 
 
-def build_epub(dest: Path) -> None:
-    book = epub.EpubBook()
-    book.set_identifier("trtmn.nato-phonetic-alphabet")
-    book.set_title(config.TITLE)
-    book.set_language("en")
-    book.add_author("Matt Troutman")
-    book.add_metadata(None, "meta", "2024-01-01T00:00:00Z", {"property": "dcterms:modified"})
-
-    font_bytes = config.FONT_PATH.read_bytes()
-    book.add_item(
-        epub.EpubItem(
-            uid="font_scp",
-            file_name="fonts/SourceCodePro-Regular.ttf",
-            media_type="font/ttf",
-            content=font_bytes,
-        )
-    )
+class EpubTemplate:
+    """The badge and stylesheet, read once and embedded in every book.
 
-    icon_bytes = config.CC_ICON_PATH.read_bytes()
-    book.add_item(
-        epub.EpubItem(
-            uid="cc_icon",
-            file_name="images/cc-by-sa.png",
-            media_type="image/png",
-            content=icon_bytes,
-        )
-    )
+    Each book embeds the font subset to the glyphs its text uses.
+    """
 
-    style = epub.EpubItem(
-        uid="style",
-        file_name="css/style.css",
-        media_type="text/css",
-        content=_CSS,
-    )
-    book.add_item(style)
+    def __init__(self) -> None:
+        self.icon_bytes = config.CC_ICON_PATH.read_bytes()
+        self.css = _CSS
 
-    rows = "\n".join(_row_html(chr(c)) for c in range(ord("A"), ord("Z") + 1))
-    body = f"""<h1>{config.TITLE}</h1>
+    def render(self, sheet: Sheet, dest: Union[Path, IO[bytes]]) -> None:
+        """Write ``sheet`` as an EPub to a path or seekable binary file."""
+        book = epub.EpubBook()
+        book.set_identifier("trtmn.nato-phonetic-alphabet")
+        book.set_title(sheet.title)
+        book.set_language("en")
+        book.add_author("Matt Troutman")
+        book.add_metadata(None, "meta", "2024-01-01T00:00:00Z", {"property": "dcterms:modified"})
+
+        rows = "\n".join(_row_html(label, word) for label, word in sheet.rows())
+        body = f"""<h1>{escape(sheet.title)}</h1>
 <table>
 {rows}
 </table>
@@ -107,35 +92,56 @@ def build_epub(dest: Path) -> None:
     <img class="badge" src="images/cc-by-sa.png" alt="CC BY-SA 4.0" width="88" height="31" />
 </footer>
 """
-    chapter = epub.EpubHtml(title=config.TITLE, file_name="alphabet.xhtml", lang="en")
-    chapter.content = body
-    chapter.add_link(href="css/style.css", rel="stylesheet", type="text/css")
-    book.add_item(chapter)
-    book.toc = (chapter,)
-    book.add_item(epub.EpubNcx())
-    book.add_item(epub.EpubNav())
-    book.spine = ["nav", chapter]
 
-    epub.write_epub(str(dest), book)
-    _force_fixed_modified(dest)
-    normalize_zip(dest)
+        book.add_item(
+            epub.EpubItem(
+                uid="font_scp",
+                file_name="fonts/SourceCodePro-Regular.ttf",
+                media_type="font/ttf",
+                content=subset_font(body),
+            )
+        )
 
+        book.add_item(
+            epub.EpubItem(
+                uid="cc_icon",
+                file_name="images/cc-by-sa.png",
+                media_type="image/png",
+                content=self.icon_bytes,
+            )
+        )
 
-def _force_fixed_modified(epub_path: Path) -> None:
+        style = epub.EpubItem(
+            uid="style",
+            file_name="css/style.css",
+            media_type="text/css",
+            content=self.css,
+        )
+        book.add_item(style)
+
+        chapter = epub.EpubHtml(title=sheet.title, file_name="alphabet.xhtml", lang="en")
+        chapter.content = body
+        chapter.add_link(href="css/style.css", rel="stylesheet", type="text/css")
+        book.add_item(chapter)
+        book.toc = (chapter,)
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        book.spine = ["nav", chapter]
+
+        with deterministic_zip(dest, {".opf": _force_fixed_modified}) as buffer:
+            epub.write_epub(buffer, book)
+
+
+@lru_cache(maxsize=None)
+def template() -> EpubTemplate:
+    """Return the shared :class:`EpubTemplate`."""
+    return EpubTemplate()
+
+
+def build_epub(dest: Path, sheet: Sheet = DEFAULT_SHEET) -> None:
+    template().render(sheet, dest)
+
+
+def _force_fixed_modified(opf: bytes) -> bytes:
     """Override the dcterms:modified value ebooklib injects with our fixed epoch."""
-    with zipfile.ZipFile(epub_path, "r") as src:
-        members = [
-            (info, src.read(info.filename))
-            for info in src.infolist()
-        ]
-    rewritten = []
-    for info, data in members:
-        if info.filename.endswith(".opf"):
-            data = _MODIFIED_RE.sub(
-                rb"\g<1>" + _FIXED_MODIFIED + rb"\g<2>",
-                data,
-            )
-        rewritten.append((info, data))
-    with zipfile.ZipFile(epub_path, "w") as dst:
-        for info, data in rewritten:
-            dst.writestr(info, data)
+    return _MODIFIED_RE.sub(rb"\g<1>" + _FIXED_MODIFIED + rb"\g<2>", opf)
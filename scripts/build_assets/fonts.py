@@ -0,0 +1,71 @@
+"""Subset the embedded font to the glyphs a document uses.
+
+Subsetting takes far longer than rendering a sheet, so subsets are cached
+in memory and under ``$XDG_CACHE_HOME/phonetic/fonts``, keyed by the hash
+of the font file, the glyph set, the subsetter options and the fontTools
+version; repeated builds reuse them.
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+
+from nato_phonetic.assets import cache_dir
+
+from . import config
+
+# fontTools subset.Options; part of the cache key.
+_OPTIONS = {
+    "name_IDs": ["*"],  # keep the copyright and licence records
+    "notdef_outline": True,
+}
+
+
+@lru_cache(maxsize=None)
+def _font(path: Path) -> tuple[bytes, str]:
+    data = path.read_bytes()
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def subset_font(text: str, path: Path = config.FONT_PATH) -> bytes:
+    """Return the font at ``path`` reduced to the glyphs needed to set ``text``."""
+    return _subset(path, tuple(sorted({ord(char) for char in text} | {ord(" ")})))
+
+
+@lru_cache(maxsize=256)
+def _subset(path: Path, codepoints: tuple[int, ...]) -> bytes:
+    import fontTools
+
+    data, font_hash = _font(path)
+    key = json.dumps([fontTools.version, _OPTIONS, codepoints], sort_keys=True)
+    key_hash = hashlib.sha256(key.encode()).hexdigest()
+    cached = cache_dir() / "fonts" / f"{font_hash[:16]}-{key_hash[:16]}{path.suffix}"
+    try:
+        return cached.read_bytes()
+    except OSError:
+        pass
+
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options(**_OPTIONS)
+    # recalcTimestamp=False keeps head.modified, so the output is deterministic.
+    font = TTFont(BytesIO(data), recalcTimestamp=False)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    out = BytesIO()
+    font.save(out)
+    result = out.getvalue()
+
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(result)
+        os.replace(tmp, cached)
+    except OSError:
+        pass  # a read-only cache only costs speed
+    return result
@@ -0,0 +1,156 @@
+"""Build graph: fingerprint each target's inputs and rebuild only what changed."""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from nato_phonetic import cards
+from nato_phonetic.core import NATO_PHONETIC_ALPHABET
+
+from . import config
+from .manifest import file_digest
+
+STATE_NAME = ".build-state.json"
+
+_HERE = Path(__file__).resolve().parent
+# Sources every generator depends on besides its own module, including
+# the package's card layout that ``config`` and ``sheet`` import.
+_SHARED_SOURCES = (
+    *(_HERE / name for name in ("config.py", "sheet.py", "fonts.py", "_zip_util.py")),
+    Path(cards.__file__),
+)
+
+
+@dataclass(frozen=True)
+class Target:
+    """An output file and the generator call that writes it."""
+
+    filename: str
+    module: str
+    builder: str
+    args: tuple = ()
+
+    def build(self, dest: Path) -> dict:
+        """Run the generator and return the size and SHA-256 of ``dest``."""
+        builder = getattr(import_module(f".{self.module}", __package__), self.builder)
+        builder(*self.args, dest)
+        return file_digest(dest)
+
+
+TARGETS = (
+    Target(config.PDF_PORTRAIT_NAME, "pdf", "build_pdf", (False,)),
+    Target(config.PDF_LANDSCAPE_NAME, "pdf", "build_pdf", (True,)),
+    Target(config.DOCX_NAME, "docx", "build_docx"),
+    Target(config.EPUB_NAME, "epub", "build_epub"),
+)
+
+
+def _config_values() -> dict[str, str]:
+    # Paths are made relative so the fingerprint does not depend on where
+    # the repository is checked out.
+    values = {}
+    for name, value in vars(config).items():
+        if name.isupper():
+            if isinstance(value, Path):
+                value = os.path.relpath(value, config.PROJECT_ROOT)
+            values[name] = repr(value)
+    return values
+
+
+def fingerprint(target: Target) -> str:
+    """Hash everything ``target`` is built from.
+
+    That is the alphabet, the ``config`` values, the font and icon bytes,
+    and the source of the generator and the modules it shares.
+    """
+    digest = hashlib.sha256()
+
+    def add(label: str, data: bytes) -> None:
+        digest.update(f"{label}:{len(data)}:".encode())
+        digest.update(data)
+
+    add("target", repr((target.module, target.builder, target.args)).encode())
+    add("alphabet", json.dumps(NATO_PHONETIC_ALPHABET, sort_keys=True).encode())
+    add("config", json.dumps(_config_values(), sort_keys=True).encode())
+    for path in (config.FONT_PATH, config.CC_ICON_PATH):
+        add(path.name, path.read_bytes())
+    for path in (_HERE / f"{target.module}.py", *_SHARED_SOURCES):
+        add(f"{path.parent.name}/{path.name}", path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_state(path: Path) -> dict[str, dict]:
+    """Read the build-state file: ``{filename: {fingerprint, size, sha256}}``."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(path: Path, state: dict[str, dict]) -> None:
+    path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def stale_targets(
+    out: Path,
+    state: dict[str, dict],
+    targets: Iterable[Target] = TARGETS,
+    *,
+    force: bool = False,
+) -> list[tuple[Target, str]]:
+    """Return the targets to rebuild, each with its current fingerprint.
+
+    A target is up to date if its fingerprint matches the build state and
+    the output file is still the one that build wrote.
+    """
+    stale = []
+    for target in targets:
+        current = fingerprint(target)
+        recorded = state.get(target.filename, {})
+        dest = out / target.filename
+        if (
+            force
+            or recorded.get("fingerprint") != current
+            or not dest.is_file()
+            or file_digest(dest) != {k: recorded.get(k) for k in ("size", "sha256")}
+        ):
+            stale.append((target, current))
+    return stale
+
+
+def build(
+    stale: list[tuple[Target, str]],
+    out: Path,
+    state: dict[str, dict],
+    *,
+    jobs: Optional[int] = None,
+    on_built: Callable[[Path], None] = lambda dest: None,
+) -> None:
+    """Build ``stale`` targets in a process pool, recording each in ``state``.
+
+    A single target is built in this process, which avoids starting a pool.
+    """
+    if not stale:
+        return
+    targets = [target for target, _ in stale]
+    dests = [out / target.filename for target in targets]
+    if len(stale) == 1:
+        results: Iterable[dict] = [targets[0].build(dests[0])]
+        _record(stale, dests, results, state, on_built)
+        return
+    workers = jobs or min(len(stale), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        _record(stale, dests, pool.map(Target.build, targets, dests), state, on_built)
+
+
+def _record(stale, dests, results, state, on_built) -> None:
+    # Results arrive in order; each is recorded as soon as it is done, so a
+    # failing target does not lose the state of the ones built before it.
+    for (target, current), dest, digest in zip(stale, dests, results):
+        state[target.filename] = {"fingerprint": current, **digest}
+        on_built(dest)
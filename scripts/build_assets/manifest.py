@@ -0,0 +1,29 @@
+"""Write the checksum manifest the downloader verifies assets against."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable
+
+_CHUNK = 64 * 1024
+
+
+def file_digest(path: Path) -> dict:
+    """Return the size and SHA-256 of ``path``, reading it in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    with path.open("rb") as fh:
+        while chunk := fh.read(_CHUNK):
+            digest.update(chunk)
+            size += len(chunk)
+    return {"size": size, "sha256": digest.hexdigest()}
+
+
+def write_manifest(paths: Iterable[Path], dest: Path) -> None:
+    """Record the size and SHA-256 of each file in ``paths``, keyed by filename.
+
+    The output is sorted and newline-terminated so that rebuilding identical
+    assets leaves the manifest byte-for-byte unchanged.
+    """
+    manifest = {path.name: file_digest(path) for path in sorted(paths)}
+    dest.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
@@ -1,6 +1,9 @@
 """PDF generator: portrait or landscape, two-column zebra-striped table."""
 
+from functools import lru_cache
 from pathlib import Path
+from typing import IO, Union
+from xml.sax.saxutils import escape
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import LETTER, landscape as _landscape
@@ -18,9 +21,8 @@ from reportlab.platypus import (
     TableStyle,
 )
 
-from nato_phonetic.core import NATO_PHONETIC_ALPHABET
-
 from . import config
+from .sheet import DEFAULT_SHEET, Sheet
 
 _FONT_REGISTERED = False
 
@@ -33,120 +35,115 @@ def _ensure_font_registered() -> None:
     _FONT_REGISTERED = True
 
 
-def _alphabet_pairs() -> list[tuple[str, str, str, str]]:
-    """Return 13 rows of (letter, word, letter, word) for the A-M / N-Z split."""
-    letters = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
-    rows: list[tuple[str, str, str, str]] = []
-    for i in range(13):
-        left = letters[i]
-        right = letters[i + 13]
-        rows.append(
-            (left, NATO_PHONETIC_ALPHABET[left], right, NATO_PHONETIC_ALPHABET[right])
+class PdfTemplate:
+    """Page layout and paragraph styles, built once and reused for every sheet."""
+
+    def __init__(self, landscape: bool) -> None:
+        _ensure_font_registered()
+        self.page_size = _landscape(LETTER) if landscape else LETTER
+        self.col_widths = [0.6 * inch, 2.4 * inch, 0.6 * inch, 2.4 * inch]
+        self.row_height = config.ROW_HEIGHT
+        if landscape:
+            self.col_widths = [0.7 * inch, 3.5 * inch, 0.7 * inch, 3.5 * inch]
+            self.row_height = config.ROW_HEIGHT - 6
+
+        styles = getSampleStyleSheet()
+        self.title_style = ParagraphStyle(
+            "Title",
+            parent=styles["Title"],
+            fontName=config.HEADER_FONT_NAME,
+            fontSize=config.HEADER_FONT_SIZE,
+            leading=config.HEADER_FONT_SIZE * 1.2,
+            alignment=1,
+            spaceAfter=0.5 * inch,
         )
-    return rows
 
+        self.footer_style = ParagraphStyle(
+            "Footer",
+            parent=styles["Normal"],
+            fontName=config.HEADER_FONT_NAME,
+            fontSize=10,
+            alignment=1,
+            leading=14,
+        )
 
-def build_pdf(landscape: bool, dest: Path) -> None:
-    """Generate a printable PDF of the NATO phonetic alphabet."""
-    _ensure_font_registered()
-
-    page_size = _landscape(LETTER) if landscape else LETTER
-    doc = SimpleDocTemplate(
-        str(dest),
-        pagesize=page_size,
-        leftMargin=0.75 * inch,
-        rightMargin=0.75 * inch,
-        topMargin=0.75 * inch,
-        bottomMargin=0.75 * inch,
-        title=config.TITLE,
-        author="Matt Troutman",
-    )
-
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        "Title",
-        parent=styles["Title"],
-        fontName=config.HEADER_FONT_NAME,
-        fontSize=config.HEADER_FONT_SIZE,
-        leading=config.HEADER_FONT_SIZE * 1.2,
-        alignment=1,
-        spaceAfter=0.5 * inch,
-    )
-
-    footer_style = ParagraphStyle(
-        "Footer",
-        parent=styles["Normal"],
-        fontName=config.HEADER_FONT_NAME,
-        fontSize=10,
-        alignment=1,
-        leading=14,
-    )
-
-    letter_style = ParagraphStyle(
-        "LetterCell",
-        parent=styles["Normal"],
-        fontName=config.HEADER_FONT_NAME,
-        fontSize=config.BODY_FONT_SIZE,
-        alignment=0,  # left
-        leftIndent=4,
-    )
-    word_style = ParagraphStyle(
-        "WordCell",
-        parent=styles["Normal"],
-        fontName=config.HEADER_FONT_NAME,
-        fontSize=config.BODY_FONT_SIZE,
-        alignment=1,  # center
-    )
-
-    table_data = _alphabet_pairs()
-    table_rows = [
-        [
-            Paragraph(left, letter_style),
-            Paragraph(left_word, word_style),
-            Paragraph(right, letter_style),
-            Paragraph(right_word, word_style),
+        self.letter_style = ParagraphStyle(
+            "LetterCell",
+            parent=styles["Normal"],
+            fontName=config.HEADER_FONT_NAME,
+            fontSize=config.BODY_FONT_SIZE,
+            alignment=0,  # left
+            leftIndent=4,
+        )
+        self.word_style = ParagraphStyle(
+            "WordCell",
+            parent=styles["Normal"],
+            fontName=config.HEADER_FONT_NAME,
+            fontSize=config.BODY_FONT_SIZE,
+            alignment=1,  # center
+        )
+
+        self.grid_color = colors.HexColor(config.GRID_COLOR)
+        self.zebra_color = colors.HexColor(config.ZEBRA_COLOR)
+        self.footer_html = (
+            f'<a href="{config.PROJECT_URL}" color="{config.LINK_COLOR}"><u>{config.TITLE}</u></a> '
+            f'© 2024 by <a href="{config.AUTHOR_URL}" color="{config.LINK_COLOR}"><u>Matt Troutman</u></a> '
+            f'is licensed under <a href="{config.LICENSE_URL}" color="{config.LINK_COLOR}"><u>CC BY-SA 4.0</u></a>'
+        )
+
+    def render(self, sheet: Sheet, dest: Union[Path, IO[bytes]]) -> None:
+        """Write ``sheet`` as a PDF to a path or binary file."""
+        doc = SimpleDocTemplate(
+            str(dest) if isinstance(dest, Path) else dest,
+            pagesize=self.page_size,
+            leftMargin=0.75 * inch,
+            rightMargin=0.75 * inch,
+            topMargin=0.75 * inch,
+            bottomMargin=0.75 * inch,
+            title=sheet.title,
+            author="Matt Troutman",
+        )
+
+        letter_style, word_style = self.letter_style, self.word_style
+        table_rows = [
+            [
+                Paragraph(escape(left), letter_style),
+                Paragraph(escape(left_word), word_style),
+                Paragraph(escape(right), letter_style),
+                Paragraph(escape(right_word), word_style),
+            ]
+            for left, left_word, right, right_word in sheet.pairs()
+        ]
+
+        table = Table(table_rows, colWidths=self.col_widths, rowHeights=self.row_height)
+        style_cmds: list[tuple] = [
+            ("GRID", (0, 0), (-1, -1), 0.5, self.grid_color),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
         ]
-        for left, left_word, right, right_word in table_data
-    ]
-
-    col_widths = [0.6 * inch, 2.4 * inch, 0.6 * inch, 2.4 * inch]
-    row_height = config.ROW_HEIGHT
-    if landscape:
-        col_widths = [0.7 * inch, 3.5 * inch, 0.7 * inch, 3.5 * inch]
-        row_height = config.ROW_HEIGHT - 6
-
-    table = Table(table_rows, colWidths=col_widths, rowHeights=row_height)
-    style_cmds: list[tuple] = [
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor(config.GRID_COLOR)),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-    ]
-    for row_idx in range(len(table_rows)):
-        if row_idx % 2 == 1:
-            style_cmds.append(
-                (
-                    "BACKGROUND",
-                    (0, row_idx),
-                    (-1, row_idx),
-                    colors.HexColor(config.ZEBRA_COLOR),
-                )
-            )
-    table.setStyle(TableStyle(style_cmds))
-
-    footer_html = (
-        f'<a href="{config.PROJECT_URL}" color="{config.LINK_COLOR}"><u>{config.TITLE}</u></a> '
-        f'© 2024 by <a href="{config.AUTHOR_URL}" color="{config.LINK_COLOR}"><u>Matt Troutman</u></a> '
-        f'is licensed under <a href="{config.LICENSE_URL}" color="{config.LINK_COLOR}"><u>CC BY-SA 4.0</u></a>'
-    )
-
-    story = [
-        Paragraph(config.TITLE, title_style),
-        table,
-        Spacer(1, 0.4 * inch),
-        Paragraph(footer_html, footer_style),
-        Spacer(1, 0.1 * inch),
-        Image(str(config.CC_ICON_PATH), width=88, height=31, hAlign="CENTER"),
-    ]
-    doc.build(story, canvasmaker=_invariant_canvas)
+        for row_idx in range(1, len(table_rows), 2):
+            style_cmds.append(("BACKGROUND", (0, row_idx), (-1, row_idx), self.zebra_color))
+        table.setStyle(TableStyle(style_cmds))
+
+        story = [
+            Paragraph(escape(sheet.title), self.title_style),
+            table,
+            Spacer(1, 0.4 * inch),
+            Paragraph(self.footer_html, self.footer_style),
+            Spacer(1, 0.1 * inch),
+            Image(str(config.CC_ICON_PATH), width=88, height=31, hAlign="CENTER"),
+        ]
+        doc.build(story, canvasmaker=_invariant_canvas)
+
+
+@lru_cache(maxsize=None)
+def template(landscape: bool) -> PdfTemplate:
+    """Return the shared :class:`PdfTemplate` for an orientation."""
+    return PdfTemplate(landscape)
+
+
+def build_pdf(landscape: bool, dest: Path, sheet: Sheet = DEFAULT_SHEET) -> None:
+    """Generate a printable PDF of the NATO phonetic alphabet."""
+    template(landscape).render(sheet, dest)
 
 
 def _invariant_canvas(filename, *args, **kwargs):
@@ -0,0 +1,34 @@
+"""The content of a cheat sheet, independent of the output format."""
+
+from dataclasses import dataclass, field
+from typing import Mapping
+
+from nato_phonetic.cards import split_columns
+from nato_phonetic.core import NATO_PHONETIC_ALPHABET
+
+from . import config
+
+
+@dataclass(frozen=True)
+class Sheet:
+    """What a generated cheat sheet shows.
+
+    ``alphabet`` contributes its letters (digits and symbols are left out),
+    in its own order, followed by ``extra_rows`` as ``(label, word)`` pairs.
+    """
+
+    title: str = config.TITLE
+    alphabet: Mapping[str, str] = field(default_factory=lambda: NATO_PHONETIC_ALPHABET)
+    extra_rows: tuple[tuple[str, str], ...] = ()
+
+    def rows(self) -> list[tuple[str, str]]:
+        """Return every ``(label, word)`` row in display order."""
+        letters = [(char, word) for char, word in self.alphabet.items() if char.isalpha()]
+        return letters + [(label, word) for label, word in self.extra_rows]
+
+    def pairs(self) -> list[tuple[str, str, str, str]]:
+        """Return the rows split into two columns, e.g. A-M beside N-Z."""
+        return split_columns(self.rows())
+
+
+DEFAULT_SHEET = Sheet()
@@ -1,19 +1,52 @@
 """NATO Phonetic Alphabet CLI package."""
 
-from importlib.metadata import PackageNotFoundError, version as _pkg_version
-
-try:
-    __version__ = _pkg_version("phonetic-nato")
-except PackageNotFoundError:
-    __version__ = "0.0.0+local"
-
 __author__ = "trtmn"
 __email__ = "trtmn@trtmn.io"
 
-from .core import NATO_PHONETIC_ALPHABET, lookup_letter, spell_word
+from .alphabets import alphabet_names, register_alphabet
+from .core import (
+    NATO_PHONETIC_ALPHABET,
+    lookup_letter,
+    spell_compact,
+    spell_many,
+    spell_string,
+    spell_word,
+)
+
+# Resolved on first access so that importing the package (and therefore
+# every ``phonetic`` invocation) skips importlib.metadata and the decoder.
+_LAZY_ATTRIBUTES = {
+    "DecodeError": ".decoder",
+    "decode": ".decoder",
+}
 
 __all__ = [
     "NATO_PHONETIC_ALPHABET",
+    "DecodeError",
+    "alphabet_names",
+    "decode",
     "lookup_letter",
+    "register_alphabet",
+    "spell_compact",
+    "spell_many",
+    "spell_string",
     "spell_word",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("phonetic-nato")
+        except PackageNotFoundError:
+            value = "0.0.0+local"
+    elif name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
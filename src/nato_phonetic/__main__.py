@@ -1,23 +1,112 @@
 #!/usr/bin/env python3
-"""Main entry point for the phonetic CLI."""
+"""Main entry point for the phonetic CLI.
 
+Spelling a word is by far the most common invocation, so this module only
+imports Click and Rich (via ``cli``) when a subcommand or the Rich table is
+actually needed.
+"""
+
+import os
 import sys
-from .cli import spell_word_command, main as cli_main
+from typing import List, Optional
+
+from .alphabets import DEFAULT_ALPHABET
+from .formats import WORD_FORMATS
+
+FORMAT_CHOICES = ("table", *WORD_FORMATS)
+
+# Must match the subcommands registered on ``cli.main``.
+COMMANDS = frozenset(
+    {"interactive", "list", "encode", "decode", "serve", "http", "export", "open", "download"}
+)
+
+
+def _pop_option(argv: List[str], *names: str) -> tuple[Optional[str], List[str]]:
+    """Split ``NAME X`` / ``NAME=X`` for any of ``names`` out of ``argv``."""
+    value = None
+    rest: List[str] = []
+    args = iter(argv)
+    for arg in args:
+        if arg in names:
+            value = next(args, "")
+        elif arg.partition("=")[0] in names:
+            value = arg.partition("=")[2]
+        else:
+            rest.append(arg)
+    return value, rest
+
+
+def _run_cli() -> None:
+    from .cli import main as cli_main
+
+    cli_main()
+
 
 def main() -> None:
     """Main entry point that handles direct word input."""
     argv = sys.argv[1:]
 
     if not argv:
-        cli_main()
+        _run_cli()
         return
 
-    if argv[0].startswith('-') or argv[0] in cli_main.commands:
-        cli_main()
+    fmt, rest = _pop_option(argv, "--format")
+    alphabet, rest = _pop_option(rest, "-a", "--alphabet")
+    transliterate = any(arg in ("-t", "--transliterate") for arg in rest)
+    rest = [arg for arg in rest if arg not in ("-t", "--transliterate")]
+    if not rest or rest[0].startswith('-') or rest[0] in COMMANDS:
+        _run_cli()
         return
 
+    if fmt is not None and fmt not in FORMAT_CHOICES:
+        sys.exit(f"Error: Invalid --format {fmt!r}. Choose from: {', '.join(FORMAT_CHOICES)}")
+    if alphabet is None:
+        alphabet = DEFAULT_ALPHABET
+    else:
+        from .alphabets import alphabet_names, get_alphabet
+
+        try:
+            alphabet = get_alphabet(alphabet).name
+        except ValueError:
+            sys.exit(
+                f"Error: Invalid --alphabet {alphabet!r}. "
+                f"Choose from: {', '.join(alphabet_names())}"
+            )
+
     # Otherwise, treat as a word to spell
-    spell_word_command(argv[0])
+    word = rest[0]
+    if transliterate:
+        from .alphabets import get_encoder
+
+        word = get_encoder(alphabet).transliterate(word)
+    tty = sys.stdout.isatty()
+    if fmt is None:
+        fmt = "table" if tty else "plain"
+
+    # Hand off to a warm ``phonetic serve`` process when one is running.
+    from .daemon import request
+
+    try:
+        width = os.get_terminal_size().columns if tty else 80
+    except OSError:
+        width = 80
+    color = tty and "NO_COLOR" not in os.environ
+    output = request(word, fmt, width=width, color=color, alphabet=alphabet)
+    if output is not None:
+        sys.stdout.write(output)
+        return
+
+    if fmt == "table":
+        from .cli import spell_word_command
+
+        spell_word_command(word, fmt, alphabet)
+        return
+
+    from .core import spell_word
+    from .formats import render_word
+
+    sys.stdout.write(render_word(word, spell_word(word, alphabet), fmt))
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
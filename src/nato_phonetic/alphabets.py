@@ -0,0 +1,385 @@
+"""Registry of spelling alphabets and their compiled tables.
+
+Each alphabet maps uppercase characters to phonetic words. Its encoder and
+decoder are compiled the first time the alphabet is used and then reused,
+so selecting an alphabet per call costs one dict lookup.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, NamedTuple, Optional
+
+from .encoder import Encoder
+
+if TYPE_CHECKING:
+    from .decoder import Decoder
+
+DEFAULT_ALPHABET = "nato"
+
+_DIGITS = {
+    "0": "Zero",
+    "1": "One",
+    "2": "Two",
+    "3": "Three",
+    "4": "Four",
+    "5": "Five",
+    "6": "Six",
+    "7": "Seven",
+    "8": "Eight",
+    "9": "Nine",
+}
+
+# NATO Phonetic Alphabet mapping
+NATO_PHONETIC_ALPHABET: Dict[str, str] = {
+    "A": "Alpha",
+    "B": "Bravo",
+    "C": "Charlie",
+    "D": "Delta",
+    "E": "Echo",
+    "F": "Foxtrot",
+    "G": "Golf",
+    "H": "Hotel",
+    "I": "India",
+    "J": "Juliet",
+    "K": "Kilo",
+    "L": "Lima",
+    "M": "Mike",
+    "N": "November",
+    "O": "Oscar",
+    "P": "Papa",
+    "Q": "Quebec",
+    "R": "Romeo",
+    "S": "Sierra",
+    "T": "Tango",
+    "U": "Uniform",
+    "V": "Victor",
+    "W": "Whiskey",
+    "X": "X-ray",
+    "Y": "Yankee",
+    "Z": "Zulu",
+    **_DIGITS,
+}
+
+# Spoken names for punctuation and symbols, compiled into the same
+# per-character tables as the letters. Multi-word names are hyphenated so
+# that each decodes as a single token.
+SYMBOLS: Dict[str, str] = {
+    "-": "Dash",
+    ".": "Dot",
+    "@": "At",
+    "/": "Slash",
+    "\\": "Backslash",
+    "_": "Underscore",
+    ":": "Colon",
+    ";": "Semicolon",
+    ",": "Comma",
+    "!": "Exclamation",
+    "?": "Question",
+    "#": "Hash",
+    "$": "Dollar",
+    "%": "Percent",
+    "&": "Ampersand",
+    "*": "Asterisk",
+    "+": "Plus",
+    "=": "Equals",
+    "~": "Tilde",
+    "^": "Caret",
+    "|": "Pipe",
+    "`": "Backtick",
+    "'": "Apostrophe",
+    '"': "Quote",
+    "(": "Open-Paren",
+    ")": "Close-Paren",
+    "[": "Open-Bracket",
+    "]": "Close-Bracket",
+    "{": "Open-Brace",
+    "}": "Close-Brace",
+    "<": "Less-Than",
+    ">": "Greater-Than",
+}
+
+# Other names the decoders of the English alphabets accept for symbols.
+SYMBOL_VARIANTS: Dict[str, tuple[str, ...]] = {
+    "-": ("Hyphen", "Minus"),
+    ".": ("Period", "Point"),
+    "!": ("Bang",),
+    "#": ("Pound",),
+}
+
+# Spellings the NATO decoder accepts in addition to its own words: the
+# ICAO/ITU forms, common misspellings and the ICAO radiotelephony numerals.
+NATO_VARIANTS: Dict[str, tuple[str, ...]] = {
+    "A": ("Alfa",),
+    "J": ("Juliett",),
+    "W": ("Whisky",),
+    "X": ("Xray", "X-ray"),
+    "3": ("Tree",),
+    "5": ("Fife",),
+    "9": ("Niner",),
+    **SYMBOL_VARIANTS,
+}
+
+# ICAO/ITU radiotelephony spelling, including its numerals.
+ICAO_ALPHABET: Dict[str, str] = {
+    **NATO_PHONETIC_ALPHABET,
+    "A": "Alfa",
+    "J": "Juliett",
+    "3": "Tree",
+    "5": "Fife",
+    "9": "Niner",
+}
+
+ICAO_VARIANTS: Dict[str, tuple[str, ...]] = {
+    "A": ("Alpha",),
+    "J": ("Juliet",),
+    "W": ("Whisky",),
+    "X": ("Xray",),
+    "3": ("Three",),
+    "5": ("Five",),
+    "9": ("Nine",),
+    **SYMBOL_VARIANTS,
+}
+
+# LAPD / APCO Project 14 spelling used by US police radio.
+LAPD_ALPHABET: Dict[str, str] = {
+    "A": "Adam",
+    "B": "Boy",
+    "C": "Charles",
+    "D": "David",
+    "E": "Edward",
+    "F": "Frank",
+    "G": "George",
+    "H": "Henry",
+    "I": "Ida",
+    "J": "John",
+    "K": "King",
+    "L": "Lincoln",
+    "M": "Mary",
+    "N": "Nora",
+    "O": "Ocean",
+    "P": "Paul",
+    "Q": "Queen",
+    "R": "Robert",
+    "S": "Sam",
+    "T": "Tom",
+    "U": "Union",
+    "V": "Victor",
+    "W": "William",
+    "X": "X-ray",
+    "Y": "Young",
+    "Z": "Zebra",
+    **_DIGITS,
+}
+
+# German DIN 5009:2022 (city names). The umlaut words are hyphenated so
+# that each decodes as a single token.
+DIN_5009_ALPHABET: Dict[str, str] = {
+    "A": "Aachen",
+    "B": "Berlin",
+    "C": "Chemnitz",
+    "D": "Düsseldorf",
+    "E": "Essen",
+    "F": "Frankfurt",
+    "G": "Goslar",
+    "H": "Hamburg",
+    "I": "Ingelheim",
+    "J": "Jena",
+    "K": "Köln",
+    "L": "Leipzig",
+    "M": "München",
+    "N": "Nürnberg",
+    "O": "Offenbach",
+    "P": "Potsdam",
+    "Q": "Quickborn",
+    "R": "Rostock",
+    "S": "Salzwedel",
+    "T": "Tübingen",
+    "U": "Unna",
+    "V": "Völklingen",
+    "W": "Wuppertal",
+    "X": "Xanten",
+    "Y": "Ypsilon",
+    "Z": "Zwickau",
+    "Ä": "Umlaut-Aachen",
+    "Ö": "Umlaut-Offenbach",
+    "Ü": "Umlaut-Unna",
+    "0": "Null",
+    "1": "Eins",
+    "2": "Zwei",
+    "3": "Drei",
+    "4": "Vier",
+    "5": "Fünf",
+    "6": "Sechs",
+    "7": "Sieben",
+    "8": "Acht",
+    "9": "Neun",
+}
+
+DIN_5009_SYMBOLS: Dict[str, str] = {
+    "-": "Bindestrich",
+    ".": "Punkt",
+    "@": "At",
+    "/": "Schrägstrich",
+    "\\": "Backslash",
+    "_": "Unterstrich",
+    ":": "Doppelpunkt",
+    ";": "Semikolon",
+    ",": "Komma",
+    "!": "Ausrufezeichen",
+    "?": "Fragezeichen",
+    "#": "Raute",
+    "$": "Dollar",
+    "%": "Prozent",
+    "&": "Und-Zeichen",
+    "*": "Stern",
+    "+": "Plus",
+    "=": "Gleich",
+}
+
+
+class Alphabet(NamedTuple):
+    """A registered alphabet: letters, symbol names and extra decoder spellings."""
+
+    name: str
+    title: str
+    letters: Dict[str, str]
+    variants: Dict[str, tuple[str, ...]]
+    symbols: Dict[str, str]
+
+
+_REGISTRY: Dict[str, Alphabet] = {}
+_ALIASES: Dict[str, str] = {}
+_ENCODERS: Dict[str, Encoder] = {}
+_DECODERS: Dict[str, "Decoder"] = {}
+
+
+def register_alphabet(
+    name: str,
+    letters: Mapping[str, str],
+    *,
+    title: Optional[str] = None,
+    variants: Optional[Mapping[str, Iterable[str]]] = None,
+    symbols: Optional[Mapping[str, str]] = None,
+    aliases: Iterable[str] = (),
+    replace: bool = False,
+) -> Alphabet:
+    """
+    Register an alphabet so it can be selected by name.
+
+    Args:
+        name: Name used to select the alphabet (case-insensitive)
+        letters: Mapping of single characters to phonetic words; keys are
+            uppercased
+        title: Display name, e.g. ``"NATO"`` (default: ``name``)
+        variants: Extra spellings the decoder accepts for each character
+        symbols: Spoken names for punctuation and symbols (default:
+            :data:`SYMBOLS`); pass ``{}`` to spell every symbol ``"Special"``
+        aliases: Other names that select the same alphabet
+        replace: Allow replacing an alphabet that is already registered
+
+    Returns:
+        The registered :class:`Alphabet`
+
+    Raises:
+        ValueError: If the name is taken (and ``replace`` is False) or a key
+            is not a single character
+    """
+    key = name.casefold()
+    names = [key, *(alias.casefold() for alias in aliases)]
+    if not replace:
+        taken = [n for n in names if n in _REGISTRY or n in _ALIASES]
+        if taken:
+            raise ValueError(f"Alphabet {taken[0]!r} is already registered")
+    table: Dict[str, str] = {}
+    for char, word in letters.items():
+        if len(char) != 1 or not word:
+            raise ValueError(f"Invalid alphabet entry {char!r}: {word!r}")
+        table[char.upper()] = word
+    symbol_names = dict(SYMBOLS if symbols is None else symbols)
+    for char, word in symbol_names.items():
+        if len(char) != 1 or char.isalnum() or char.isspace() or not word:
+            raise ValueError(f"Invalid symbol entry {char!r}: {word!r}")
+    alphabet = Alphabet(
+        key,
+        title or name,
+        table,
+        {char.upper(): tuple(words) for char, words in (variants or {}).items()},
+        symbol_names,
+    )
+    _ALIASES.pop(key, None)
+    _REGISTRY[key] = alphabet
+    for alias in names[1:]:
+        _REGISTRY.pop(alias, None)
+        _ALIASES[alias] = key
+    # Anything compiled under the old definition is stale.
+    _ENCODERS.clear()
+    _DECODERS.clear()
+    return alphabet
+
+
+def get_alphabet(name: str = DEFAULT_ALPHABET) -> Alphabet:
+    """
+    Look up a registered alphabet.
+
+    Args:
+        name: Alphabet name or alias (case-insensitive)
+
+    Raises:
+        ValueError: If no such alphabet is registered
+    """
+    key = name.casefold()
+    alphabet = _REGISTRY.get(_ALIASES.get(key, key))
+    if alphabet is None:
+        raise ValueError(
+            f"Unknown alphabet {name!r}. Valid alphabets: {', '.join(alphabet_names())}"
+        )
+    return alphabet
+
+
+def alphabet_names() -> List[str]:
+    """Return the names of all registered alphabets (without aliases)."""
+    return list(_REGISTRY)
+
+
+def get_encoder(name: str = DEFAULT_ALPHABET) -> Encoder:
+    """Return the compiled :class:`Encoder` for an alphabet, building it once."""
+    try:
+        return _ENCODERS[name]
+    except KeyError:
+        pass
+    alphabet = get_alphabet(name)
+    encoder = _ENCODERS.get(alphabet.name)
+    if encoder is None:
+        encoder = _ENCODERS[alphabet.name] = Encoder(alphabet.letters, alphabet.symbols)
+    _ENCODERS[name] = encoder
+    return encoder
+
+
+def get_decoder(name: str = DEFAULT_ALPHABET) -> "Decoder":
+    """Return the compiled :class:`Decoder` for an alphabet, building it once."""
+    try:
+        return _DECODERS[name]
+    except KeyError:
+        pass
+    from .decoder import Decoder
+
+    alphabet = get_alphabet(name)
+    decoder = _DECODERS.get(alphabet.name)
+    if decoder is None:
+        decoder = _DECODERS[alphabet.name] = Decoder(
+            {**alphabet.symbols, **alphabet.letters}, alphabet.variants
+        )
+    _DECODERS[name] = decoder
+    return decoder
+
+
+register_alphabet("nato", NATO_PHONETIC_ALPHABET, title="NATO", variants=NATO_VARIANTS)
+register_alphabet(
+    "icao", ICAO_ALPHABET, title="ICAO", variants=ICAO_VARIANTS, aliases=("itu",)
+)
+register_alphabet("lapd", LAPD_ALPHABET, title="LAPD", aliases=("apco",))
+register_alphabet(
+    "din5009",
+    DIN_5009_ALPHABET,
+    title="DIN 5009",
+    symbols=DIN_5009_SYMBOLS,
+    aliases=("din",),
+)
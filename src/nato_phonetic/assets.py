@@ -2,32 +2,96 @@
 
 from __future__ import annotations
 
+import hashlib
+import http.client
+import json
 import os
-import platform
-import subprocess
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    DownloadColumn,
-    Progress,
-    TextColumn,
-    TimeRemainingColumn,
-    TransferSpeedColumn,
+from typing import (
+    TYPE_CHECKING,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
 )
-from rich.table import Table
-from rich.box import ROUNDED
 
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
 
-RAW_BASE = "https://codeberg.org/trtmn/nato-phonetic-alphabet/raw/branch/main/"
+    from rich.console import Console
+    from rich.progress import Progress
+
+
+REPO_URL = "https://codeberg.org/trtmn/nato-phonetic-alphabet/"
+MAIN_BASE = f"{REPO_URL}raw/branch/main/"
+
+
+def release_base(version: str) -> str:
+    """Return the raw-file URL for the assets released as ``version``.
+
+    Released versions read from their immutable ``v<version>`` tag, so the
+    files always match the manifest shipped in the same release. Development
+    builds (a local version or none) follow ``main``.
+    """
+    if "+" in version or version.startswith("0.0.0"):
+        return MAIN_BASE
+    return f"{REPO_URL}raw/tag/v{version}/"
+
+
+def _installed_version() -> str:
+    from . import __version__
+
+    # Resolved by the package's module __getattr__, which mypy types as object.
+    return str(__version__)
+
+
+RAW_BASE = release_base(_installed_version())
+# Tried after every mirror has failed. A build whose manifest was regenerated
+# without a version bump no longer matches its tag, but does match ``main``.
+FALLBACK_BASE: Optional[str] = MAIN_BASE if RAW_BASE != MAIN_BASE else None
 DEFAULT_SLUG = "pdf"
 
+# Concurrent downloads for ``download_assets``.
+DEFAULT_WORKERS = 4
+
+# Extra mirrors tried before ``RAW_BASE`` (base URLs or local directories,
+# separated by whitespace or commas).
+MIRRORS_ENV = "PHONETIC_MIRRORS"
+# Set to 1 to use only local copies of the assets, with no network access.
+OFFLINE_ENV = "PHONETIC_OFFLINE"
+# A directory pre-seeded with asset files, used offline or when every
+# mirror fails. Files bundled in the wheel are the last resort.
+ASSET_DIR_ENV = "PHONETIC_ASSET_DIR"
+BUNDLED_DIR = "bundled"
+
+_CHUNK = 64 * 1024
+_TIMEOUT = 30.0
+_MAX_REDIRECTS = 5
+_REDIRECTS = frozenset({301, 302, 303, 307, 308})
+_PROBE_TIMEOUT = 5.0
+
+# Sizes and SHA-256 hashes of the published assets, keyed by filename;
+# written by ``python -m scripts.build_assets``.
+MANIFEST_NAME = "asset_manifest.json"
+
+# Partial downloads are written next to the destination with this suffix
+# and renamed into place only once complete.
+PART_SUFFIX = ".part"
+
+_INDEX_LOCK = threading.Lock()
+
+# Mirror order chosen by probing, per configured list of mirrors.
+_RANKINGS: dict[tuple[str, ...], list[str]] = {}
+_RANKINGS_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class Asset:
@@ -47,21 +111,156 @@ ASSETS: dict[str, Asset] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _manifest() -> dict[str, dict]:
+    from importlib.resources import files
+
+    try:
+        text = files(__package__).joinpath(MANIFEST_NAME).read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        return {}
+    manifest: dict[str, dict] = json.loads(text)
+    return manifest
+
+
+def _expected(asset: Asset) -> Optional[dict]:
+    """Return the manifest's ``{"size", "sha256"}`` for ``asset``, if it has one."""
+    return _manifest().get(asset.filename)
+
+
 class AssetError(Exception):
     """Raised for asset-related errors (unknown slug, download failure, etc.)."""
 
 
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections shared by download threads, one set per host.
+
+    Failures are raised as ``urllib.error.URLError`` / ``HTTPError`` so that
+    callers handle pooled and ``urllib.request`` downloads the same way.
+    """
+
+    def __init__(self, timeout: float = _TIMEOUT) -> None:
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> ConnectionPool:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    @contextmanager
+    def open(self, url: str, headers: Optional[dict[str, str]] = None) -> Iterator[http.client.HTTPResponse]:
+        """GET ``url`` on a pooled connection, following redirects."""
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme not in ("http", "https"):
+                raise urllib.error.URLError(f"unsupported URL scheme {parts.scheme!r}")
+            key = (parts.scheme, parts.netloc)
+            target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            conn, response = self._request(key, target, headers or {})
+            if response.status in _REDIRECTS and response.getheader("Location"):
+                response.read()
+                self._finish(key, conn, response)
+                url = urllib.parse.urljoin(url, response.getheader("Location"))
+                continue
+            if response.status >= 400:
+                response.read()
+                self._finish(key, conn, response)
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            try:
+                yield response
+            finally:
+                self._finish(key, conn, response)
+            return
+        raise urllib.error.URLError(f"too many redirects for {url}")
+
+    def _request(
+        self, key: tuple[str, str], target: str, headers: dict[str, str]
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                conn = idle.pop() if idle else None
+            reused = conn is not None
+            if conn is None:
+                cls = http.client.HTTPSConnection if key[0] == "https" else http.client.HTTPConnection
+                conn = cls(key[1], timeout=self.timeout)
+                with self._lock:
+                    self.connections_opened += 1
+            try:
+                conn.request("GET", target, headers=headers)
+                return conn, conn.getresponse()
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                # An idle connection may have been closed by the server; retry
+                # on a fresh one, but report failures of fresh connections.
+                if not reused:
+                    raise urllib.error.URLError(exc) from exc
+
+    def _finish(
+        self,
+        key: tuple[str, str],
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> None:
+        if response.isclosed() and not response.will_close:
+            with self._lock:
+                self._idle.setdefault(key, []).append(conn)
+        else:
+            conn.close()
+
+
 def default_downloads_dir() -> Path:
     """Return the user's Downloads directory — works on macOS, Linux, and Windows."""
     return Path.home() / "Downloads"
 
 
-def asset_url(slug: str) -> str:
+def cache_dir() -> Path:
+    """Return the per-user cache directory (``$XDG_CACHE_HOME/phonetic``)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "phonetic"
+
+
+def asset_url(slug: str, base: Optional[str] = None) -> str:
     asset = _resolve(slug)
-    return RAW_BASE + urllib.parse.quote(asset.filename)
+    return (base or RAW_BASE) + urllib.parse.quote(asset.filename)
+
+
+def configured_mirrors(extra: Iterable[str] = ()) -> list[str]:
+    """Return the base URLs to download from, in configured order.
+
+    ``extra`` comes first, then the mirrors listed in ``$PHONETIC_MIRRORS``,
+    then :data:`RAW_BASE`. Local directories are turned into ``file://``
+    URLs, so a directory can stand in for a mirror.
+    """
+    configured = [*extra, *os.environ.get(MIRRORS_ENV, "").replace(",", " ").split(), RAW_BASE]
+    bases = []
+    for base in configured:
+        if "://" not in base:
+            base = Path(base).expanduser().resolve().as_uri()
+        bases.append(base if base.endswith("/") else base + "/")
+    return list(dict.fromkeys(bases))
+
+
+def is_offline() -> bool:
+    """Whether ``$PHONETIC_OFFLINE`` asks for local copies only."""
+    return os.environ.get(OFFLINE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
 
 
 def list_assets(console: Console) -> None:
+    from rich.box import ROUNDED
+    from rich.table import Table
+
     table = Table(title="Available Assets", box=ROUNDED)
     table.add_column("Slug", style="cyan", no_wrap=True)
     table.add_column("Description", style="white")
@@ -77,45 +276,476 @@ def download_asset(
     *,
     force: bool = False,
     console: Optional[Console] = None,
+    mirrors: Sequence[str] = (),
+    offline: Optional[bool] = None,
 ) -> Path:
     """Download an asset to ``dest_dir`` (defaults to ~/Downloads). Returns the file path.
 
-    Reuses an existing file at the destination unless ``force`` is True.
+    An existing file whose SHA-256 matches the asset manifest is reused
+    without contacting the server: assets are fetched from this release's
+    tag, whose files cannot change. A file this tool downloaded before is
+    revalidated with a conditional GET (``If-None-Match`` /
+    ``If-Modified-Since``) and kept if the server answers 304, or if the
+    server cannot be reached. ``force`` always fetches the whole file.
+
+    Data is streamed into ``<dest>.part``, hashed as it arrives, checked
+    against the manifest and renamed into place; an interrupted download
+    resumes from the partial file.
+
+    The fastest of the configured mirrors (see :func:`configured_mirrors`)
+    is tried first and the others in turn if it fails; ``mirrors`` adds to
+    that list. If none can be reached, or with ``offline`` (default:
+    ``$PHONETIC_OFFLINE``), the asset is copied from ``$PHONETIC_ASSET_DIR``
+    or the copies bundled with the package instead.
     """
+    from rich.console import Console
+
     asset = _resolve(slug)
     console = console or Console()
+    dest = _destination(asset, dest_dir)
+    offline = is_offline() if offline is None else offline
+
+    record = None if force else _cached(dest, console, _expected(asset))
+    if record is not None and (offline or not _conditional_headers(record)):
+        _print_reused(console, dest)
+        return dest
+
+    bases = [] if offline else _rank(configured_mirrors(mirrors), asset)
+    with _progress(console) as progress:
+        try:
+            fetched = _fetch(asset, dest, progress, revalidate=record is not None, bases=bases)
+        except AssetError as exc:
+            if record is None:
+                raise
+            console.print(f"[yellow]Could not check for updates:[/yellow] {exc}")
+            _print_reused(console, dest)
+            return dest
+
+    _print_fetched(console, dest, fetched)
+    return dest
+
+
+def download_assets(
+    slugs: Iterable[str],
+    dest_dir: Optional[Path] = None,
+    *,
+    force: bool = False,
+    console: Optional[Console] = None,
+    workers: int = DEFAULT_WORKERS,
+    mirrors: Sequence[str] = (),
+    offline: Optional[bool] = None,
+) -> list[Path]:
+    """Download several assets concurrently. Returns the file paths in ``slugs`` order.
+
+    Downloads share a pool of keep-alive connections and one progress display.
+    Existing files are revalidated or reused, and mirrors and local copies
+    chosen, as by :func:`download_asset`. Every download is attempted before
+    failures are reported together.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.console import Console
+
+    assets = [_resolve(slug) for slug in dict.fromkeys(slugs)]
+    console = console or Console()
+    dests = {asset.slug: _destination(asset, dest_dir) for asset in assets}
+    offline = is_offline() if offline is None else offline
+    pending = []
+    for asset in assets:
+        record = None if force else _cached(dests[asset.slug], console, _expected(asset))
+        if record is not None and (offline or not _conditional_headers(record)):
+            _print_reused(console, dests[asset.slug])
+        else:
+            pending.append((asset, record is not None))
+
+    failures: list[str] = []
+    if pending:
+        bases = [] if offline else _rank(configured_mirrors(mirrors), pending[0][0])
+        with ConnectionPool() as pool, _progress(console) as progress:
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                futures = [
+                    executor.submit(
+                        _fetch,
+                        asset,
+                        dests[asset.slug],
+                        progress,
+                        pool,
+                        revalidate=cached,
+                        bases=bases,
+                    )
+                    for asset, cached in pending
+                ]
+            for (asset, cached), future in zip(pending, futures):
+                dest = dests[asset.slug]
+                exc = future.exception()
+                if exc is not None and not cached:
+                    failures.append(str(exc))
+                elif exc is not None:
+                    console.print(f"[yellow]Could not check for updates:[/yellow] {exc}")
+                    _print_reused(console, dest)
+                else:
+                    _print_fetched(console, dest, future.result())
+    if failures:
+        raise AssetError("\n".join(failures))
+    return [dests[asset.slug] for asset in assets]
+
+
+def _destination(asset: Asset, dest_dir: Optional[Path]) -> Path:
     dest_dir = (dest_dir or default_downloads_dir()).expanduser()
     dest_dir.mkdir(parents=True, exist_ok=True)
-    dest = dest_dir / asset.filename
+    return dest_dir / asset.filename
 
-    if dest.exists() and not force:
-        console.print(f"[green]Reusing[/green] [dim]{dest}[/dim] (pass [cyan]--force[/cyan] to re-download)")
-        return dest
 
-    url = asset_url(slug)
+def _print_reused(console: Console, dest: Path) -> None:
+    console.print(f"[green]Reusing[/green] [dim]{dest}[/dim] (pass [cyan]--force[/cyan] to re-download)")
+
+
+def _print_fetched(console: Console, dest: Path, fetched: bool) -> None:
+    if fetched:
+        console.print(f"[green]Saved[/green] [dim]{dest}[/dim]")
+    else:
+        console.print(f"[green]Up to date[/green] [dim]{dest}[/dim]")
+
+
+def _progress(console: Console) -> Progress:
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        TextColumn,
+        TimeRemainingColumn,
+        TransferSpeedColumn,
+    )
+
+    return Progress(
+        TextColumn("[cyan]{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+    )
+
+
+def _open(
+    url: str, pool: Optional[ConnectionPool], headers: Optional[dict[str, str]] = None
+) -> ContextManager[http.client.HTTPResponse]:
+    if pool is not None and not url.startswith("file:"):
+        return pool.open(url, headers)
+    request = urllib.request.Request(url, headers=headers or {})
+    response: http.client.HTTPResponse = urllib.request.urlopen(  # noqa: S310
+        request, timeout=_TIMEOUT
+    )
+    return response
+
+
+def _rank(bases: Sequence[str], asset: Asset) -> list[str]:
+    """Move the mirror that answers a HEAD request for ``asset`` first to the front.
+
+    The order is remembered for the rest of the process. Mirrors that fail
+    the probe keep their place; they are still tried if the fastest fails.
+    """
+    if len(bases) < 2:
+        return list(bases)
+    key = tuple(bases)
+    with _RANKINGS_LOCK:
+        ranked = _RANKINGS.get(key)
+    if ranked is not None:
+        return ranked
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    def probe(base: str) -> str:
+        request = urllib.request.Request(asset_url(asset.slug, base), method="HEAD")
+        with urllib.request.urlopen(request, timeout=_PROBE_TIMEOUT):  # noqa: S310
+            return base
+
+    ranked = list(bases)
+    executor = ThreadPoolExecutor(max_workers=len(bases))
+    try:
+        for future in as_completed([executor.submit(probe, base) for base in bases]):
+            if future.exception() is None:
+                fastest = future.result()
+                ranked.remove(fastest)
+                ranked.insert(0, fastest)
+                break
+    finally:
+        # Slower probes finish in the background.
+        executor.shutdown(wait=False)
+    with _RANKINGS_LOCK:
+        _RANKINGS[key] = ranked
+    return ranked
+
+
+def _fetch(
+    asset: Asset,
+    dest: Path,
+    progress: Progress,
+    pool: Optional[ConnectionPool] = None,
+    *,
+    revalidate: bool = False,
+    bases: Sequence[str] = (),
+) -> bool:
+    """Fetch ``asset`` from the first of ``bases`` that works, else a local copy.
+
+    :data:`FALLBACK_BASE` is tried after ``bases``, so a checksum mismatch
+    or a missing release tag falls over to ``main``. With no ``bases`` the
+    asset is only copied from a local directory.
+    When only revalidating a verified ``dest``, local copies are not used:
+    if every mirror fails, ``dest`` is kept as it is. Returns False if a
+    mirror reported ``dest`` unchanged.
+    """
+    errors = []
+    if bases and FALLBACK_BASE and FALLBACK_BASE not in bases:
+        bases = [*bases, FALLBACK_BASE]
+    for base in bases:
+        try:
+            return _download(asset, asset_url(asset.slug, base), dest, progress, pool, revalidate)
+        except AssetError as exc:
+            errors.append(exc)
+    source = None if revalidate else _local_source(asset)
+    if source is not None:
+        _copy_local(asset, source, dest)
+        return True
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        reasons = "\n  ".join(str(exc) for exc in errors)
+        raise AssetError(f"Every mirror failed for {asset.filename}:\n  {reasons}")
+    raise AssetError(f"{asset.filename} is not available offline; put a copy in ${ASSET_DIR_ENV}")
+
+
+def _local_source(asset: Asset) -> Optional[Traversable]:
+    """Return a local copy of ``asset``: pre-seeded directory first, then the package."""
+    from importlib.resources import files
+
+    candidates: list[Traversable] = []
+    if seeded := os.environ.get(ASSET_DIR_ENV):
+        candidates.append(Path(seeded).expanduser() / asset.filename)
+    candidates.append(files(__package__).joinpath(BUNDLED_DIR, asset.filename))
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _copy_local(asset: Asset, source: Traversable, dest: Path) -> None:
+    part = dest.with_name(dest.name + PART_SUFFIX)
+    digest = hashlib.sha256()
+    size = 0
+    with source.open("rb") as src, part.open("wb") as fh:
+        while chunk := src.read(_CHUNK):
+            fh.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+        fh.flush()
+        os.fsync(fh.fileno())
+    _install(asset, part, dest, {"size": size, "sha256": digest.hexdigest()})
+
+
+def _download(
+    asset: Asset,
+    url: str,
+    dest: Path,
+    progress: Progress,
+    pool: Optional[ConnectionPool],
+    revalidate: bool,
+) -> bool:
+    """Stream ``url`` into ``<dest>.part``, then move it to ``dest``.
+
+    A partial file left by an interrupted download is resumed with a
+    ``Range`` request guarded by ``If-Range``, so a file that changed on
+    the server in the meantime is fetched from the start instead. With
+    ``revalidate``, the request is conditional on the validators recorded
+    for ``dest``. Returns False if the server reported ``dest`` unchanged.
+    """
+    part = dest.with_name(dest.name + PART_SUFFIX)
+    conditional = _conditional_headers(_index_get(dest)) if revalidate else {}
     try:
-        with urllib.request.urlopen(url) as response:  # noqa: S310 - controlled URL
-            total = int(response.headers.get("Content-Length") or 0) or None
-            with Progress(
-                TextColumn("[cyan]{task.description}"),
-                BarColumn(),
-                DownloadColumn(),
-                TransferSpeedColumn(),
-                TimeRemainingColumn(),
-                console=console,
-            ) as progress:
-                task_id = progress.add_task(asset.filename, total=total)
-                with dest.open("wb") as fh:
-                    while chunk := response.read(64 * 1024):
-                        fh.write(chunk)
-                        progress.update(task_id, advance=len(chunk))
-    except urllib.error.URLError as exc:
-        if dest.exists():
-            dest.unlink(missing_ok=True)
+        for attempt in range(2):
+            validator: Optional[str] = (
+                _index_get(part).get("validator") if part.exists() else None
+            )
+            offset = part.stat().st_size if validator else 0
+            if validator and offset:
+                headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+            else:
+                headers = conditional
+            try:
+                with _open(url, pool, headers) as response:
+                    if getattr(response, "status", 200) == 304:
+                        response.read()
+                        return False
+                    size, sha256 = _receive(asset, response, part, offset, progress)
+                    validators = _validators(response.headers)
+                break
+            except urllib.error.HTTPError as exc:
+                # urllib reports 304 as an error; the pool returns it.
+                if exc.code == 304 and headers is conditional:
+                    return False
+                # 416: the partial file is no prefix of the current file.
+                if exc.code != 416 or attempt:
+                    raise
+                _index_pop(part)
+                part.unlink(missing_ok=True)
+    except (urllib.error.URLError, http.client.HTTPException, ConnectionError, TimeoutError) as exc:
         raise AssetError(f"Failed to download {asset.filename}: {exc}") from exc
+    _install(asset, part, dest, {"size": size, "sha256": sha256, **validators})
+    return True
+
+
+def _install(asset: Asset, part: Path, dest: Path, record: dict) -> None:
+    """Check the finished ``part`` against the manifest and move it to ``dest``."""
+    expected = _expected(asset)
+    size, sha256 = record["size"], record["sha256"]
+    if expected is not None and (size, sha256) != (expected["size"], expected["sha256"]):
+        _index_pop(part)
+        part.unlink(missing_ok=True)
+        raise AssetError(
+            f"Checksum mismatch for {asset.filename}: expected {expected['sha256']} "
+            f"({expected['size']} bytes), got {sha256} ({size} bytes); "
+            "the copy is corrupt or this version's manifest is out of date"
+        )
+    os.replace(part, dest)
+    _index_pop(part)
+    _index_set(dest, record)
+
+
+def _receive(
+    asset: Asset,
+    response: http.client.HTTPResponse,
+    part: Path,
+    offset: int,
+    progress: Progress,
+) -> tuple[int, str]:
+    """Write ``response`` to ``part``; return the final size and SHA-256."""
+    headers = response.headers
+    digest = hashlib.sha256()
+    if offset and getattr(response, "status", 200) == 206 and _range_start(headers) == offset:
+        mode = "ab"
+        with part.open("rb") as fh:
+            while chunk := fh.read(_CHUNK):
+                digest.update(chunk)
+    else:
+        offset, mode = 0, "wb"
+        validators = _validators(headers)
+        validator = validators.get("etag") or validators.get("last_modified")
+        _index_set(part, {"validator": validator} if validator else {})
+    length = int(headers.get("Content-Length") or 0) or None
+    total = offset + length if length is not None else None
+    task_id = progress.add_task(asset.filename, total=total, completed=offset)
+    size = offset
+    with part.open(mode) as fh:
+        while chunk := response.read(_CHUNK):
+            fh.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+            progress.update(task_id, advance=len(chunk))
+        fh.flush()
+        os.fsync(fh.fileno())
+    if total is not None and size != total:
+        raise AssetError(
+            f"Failed to download {asset.filename}: received {size} of {total} bytes"
+        )
+    return size, digest.hexdigest()
+
+
+def _range_start(headers: http.client.HTTPMessage) -> Optional[int]:
+    # "bytes 1000-1999/2000" -> 1000
+    value = headers.get("Content-Range") or ""
+    unit, _, spec = value.partition(" ")
+    try:
+        return int(spec.split("-", 1)[0]) if unit == "bytes" else None
+    except ValueError:
+        return None
 
-    console.print(f"[green]Saved[/green] [dim]{dest}[/dim]")
-    return dest
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _validators(headers: http.client.HTTPMessage) -> dict[str, str]:
+    validators = {}
+    if etag := headers.get("ETag"):
+        validators["etag"] = etag
+    if last_modified := headers.get("Last-Modified"):
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def _conditional_headers(record: dict) -> dict[str, str]:
+    headers = {}
+    if "etag" in record:
+        headers["If-None-Match"] = record["etag"]
+    if "last_modified" in record:
+        headers["If-Modified-Since"] = record["last_modified"]
+    return headers
+
+
+def _cached(dest: Path, console: Console, expected: Optional[dict] = None) -> Optional[dict]:
+    """Return the index record of a usable ``dest``, or None if it must be fetched.
+
+    The record is empty, so that ``dest`` is used without revalidation, when
+    it matches the manifest entry ``expected`` or when there is nothing to
+    check it against (neither a manifest entry nor a download record).
+    """
+    if not dest.exists():
+        return None
+    record = _index_get(dest)
+    if expected is None and "size" not in record:
+        return {}
+    size = dest.stat().st_size
+    sizes = {record.get("size"), expected and expected["size"]}
+    sha256 = _sha256_file(dest) if size in sizes else None
+    if expected is not None and sha256 == expected["sha256"]:
+        return {}
+    if "size" in record and sha256 == record["sha256"]:
+        return record
+    console.print(f"[yellow]Re-downloading[/yellow] [dim]{dest}[/dim] (failed verification)")
+    return None
+
+
+def _index_path() -> Path:
+    return cache_dir() / "downloads.json"
+
+
+def _index_load() -> dict[str, dict]:
+    try:
+        index: dict[str, dict] = json.loads(_index_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return index
+
+
+def _index_get(path: Path) -> dict:
+    with _INDEX_LOCK:
+        return _index_load().get(str(path.resolve()), {})
+
+
+def _index_set(path: Path, record: dict) -> None:
+    with _INDEX_LOCK:
+        index = _index_load()
+        index[str(path.resolve())] = record
+        _index_write(index)
+
+
+def _index_pop(path: Path) -> None:
+    with _INDEX_LOCK:
+        index = _index_load()
+        if index.pop(str(path.resolve()), None) is not None:
+            _index_write(index)
+
+
+def _index_write(index: dict[str, dict]) -> None:
+    target = _index_path()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(index, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, target)
 
 
 def open_asset(
@@ -124,15 +754,22 @@ def open_asset(
     *,
     force: bool = False,
     console: Optional[Console] = None,
+    mirrors: Sequence[str] = (),
+    offline: Optional[bool] = None,
 ) -> Path:
     """Download (or reuse) the asset, then open it with the OS default handler."""
-    path = download_asset(slug, dest_dir, force=force, console=console)
+    path = download_asset(
+        slug, dest_dir, force=force, console=console, mirrors=mirrors, offline=offline
+    )
     open_file(path)
     return path
 
 
 def open_file(path: Path) -> None:
     """Open ``path`` with the operating-system default handler."""
+    import platform
+    import subprocess
+
     system = platform.system()
     if system == "Darwin":
         subprocess.run(["open", str(path)], check=False)
@@ -0,0 +1,211 @@
+"""Standalone HTML, SVG and Markdown reference cards.
+
+These use the standard library only, so ``phonetic export`` renders in
+milliseconds without the ``build`` extra. The layout constants below are
+shared with the printable generators in ``scripts/build_assets``.
+"""
+
+from html import escape
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .alphabets import DEFAULT_ALPHABET, get_alphabet
+
+TITLE = "Nato Phonetic Alphabet"
+
+HEADER_FONT_NAME = "SourceCodePro"
+HEADER_FONT_SIZE = 32
+BODY_FONT_SIZE = 14
+ROW_HEIGHT = 28
+GRID_COLOR = "#cccccc"
+ZEBRA_COLOR = "#f4f4f4"
+LINK_COLOR = "#1f88c5"
+
+LICENSE_TEXT = "© 2024 by Matt Troutman is licensed under CC BY-SA 4.0"
+PROJECT_URL = "https://trtmn.io/nato-phonetic-alphabet"
+AUTHOR_URL = "https://trtmn.io"
+LICENSE_URL = "https://creativecommons.org/licenses/by-sa/4.0/"
+
+_FONT_FAMILY = "'Source Code Pro', monospace"
+# Advance width of a monospace glyph, as a fraction of the font size.
+_CHAR_WIDTH = 0.6
+_CELL_PADDING = 12
+
+Row = Tuple[str, str]
+
+
+def card_rows(alphabet: str = DEFAULT_ALPHABET) -> List[Row]:
+    """Return the ``(letter, word)`` rows of an alphabet's card (letters only)."""
+    letters = get_alphabet(alphabet).letters
+    return [(char, word) for char, word in letters.items() if char.isalpha()]
+
+
+def split_columns(rows: Sequence[Row]) -> List[Tuple[str, str, str, str]]:
+    """Split rows into two side-by-side columns, e.g. A-M beside N-Z."""
+    half = (len(rows) + 1) // 2
+    right = list(rows[half:]) + [("", "")] * (2 * half - len(rows))
+    return [(*left, *other) for left, other in zip(rows[:half], right)]
+
+
+def _footer_html() -> str:
+    return (
+        f'<a href="{PROJECT_URL}">{TITLE}</a> © 2024 by '
+        f'<a href="{AUTHOR_URL}">Matt Troutman</a> is licensed under '
+        f'<a href="{LICENSE_URL}">CC BY-SA 4.0</a>'
+    )
+
+
+def render_html(rows: Sequence[Row], title: str = TITLE) -> str:
+    """Render a self-contained HTML page with the rows in two columns."""
+    body = []
+    for left, left_word, right, right_word in split_columns(rows):
+        body.append(
+            f'<tr><td class="letter">{escape(left)}</td><td>{escape(left_word)}</td>'
+            f'<td class="letter">{escape(right)}</td><td>{escape(right_word)}</td></tr>'
+        )
+    table = "\n".join(body)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{escape(title)}</title>
+<style>
+body {{ font-family: {_FONT_FAMILY}; color: #111; margin: 2em auto; max-width: 40em; }}
+h1 {{ text-align: center; font-size: {HEADER_FONT_SIZE}px; font-weight: normal; }}
+table {{ width: 100%; border-collapse: collapse; font-size: {BODY_FONT_SIZE}px; }}
+td {{ border: 0.5px solid {GRID_COLOR}; height: {ROW_HEIGHT}px; text-align: center; }}
+td.letter {{ text-align: left; padding-left: 0.5em; width: 2em; }}
+tr:nth-child(even) td {{ background-color: {ZEBRA_COLOR}; }}
+footer {{ text-align: center; font-size: 10px; margin-top: 2em; }}
+footer a {{ color: {LINK_COLOR}; }}
+@media print {{ body {{ margin: 0 auto; }} }}
+</style>
+</head>
+<body>
+<h1>{escape(title)}</h1>
+<table>
+{table}
+</table>
+<footer>{_footer_html()}</footer>
+</body>
+</html>
+"""
+
+
+def render_svg(rows: Sequence[Row], title: str = TITLE) -> str:
+    """Render an SVG card with the same grid, zebra stripes and footer as the PDF."""
+    pairs = split_columns(rows)
+
+    def width(texts: Sequence[str]) -> int:
+        longest = max((len(text) for text in texts), default=1)
+        return round(longest * BODY_FONT_SIZE * _CHAR_WIDTH) + 2 * _CELL_PADDING
+
+    columns = [width([pair[i] for pair in pairs]) for i in range(4)]
+    table_width = sum(columns)
+    card_width = max(table_width, round(len(title) * HEADER_FONT_SIZE * _CHAR_WIDTH)) + 2 * 36
+    left = (card_width - table_width) // 2
+    top = 36 + HEADER_FONT_SIZE * 2
+    height = top + len(pairs) * ROW_HEIGHT + 72
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{card_width}" height="{height}" '
+        f'viewBox="0 0 {card_width} {height}" font-family="{_FONT_FAMILY}">',
+        f"<title>{escape(title)}</title>",
+        f'<rect width="{card_width}" height="{height}" fill="#ffffff"/>',
+        f'<text x="{card_width // 2}" y="{36 + HEADER_FONT_SIZE}" font-size="{HEADER_FONT_SIZE}" '
+        f'text-anchor="middle" fill="#111111">{escape(title)}</text>',
+    ]
+    for index, pair in enumerate(pairs):
+        y = top + index * ROW_HEIGHT
+        if index % 2:
+            parts.append(
+                f'<rect x="{left}" y="{y}" width="{table_width}" height="{ROW_HEIGHT}" '
+                f'fill="{ZEBRA_COLOR}"/>'
+            )
+        x = left
+        baseline = y + (ROW_HEIGHT + BODY_FONT_SIZE * 0.7) / 2
+        for column, text in zip(columns, pair):
+            if text:
+                parts.append(
+                    f'<text x="{x + _CELL_PADDING}" y="{baseline:g}" font-size="{BODY_FONT_SIZE}" '
+                    f'fill="#111111">{escape(text)}</text>'
+                )
+            x += column
+    grid = [f"M{left} {top + i * ROW_HEIGHT}h{table_width}" for i in range(len(pairs) + 1)]
+    x = left
+    for column in [0, *columns]:
+        x += column
+        grid.append(f"M{x} {top}v{len(pairs) * ROW_HEIGHT}")
+    parts.append(
+        f'<path d="{" ".join(grid)}" stroke="{GRID_COLOR}" stroke-width="0.5" fill="none"/>'
+    )
+    parts.append(
+        f'<a href="{LICENSE_URL}"><text x="{card_width // 2}" y="{height - 36}" font-size="10" '
+        f'text-anchor="middle" fill="{LINK_COLOR}">{escape(f"{TITLE} {LICENSE_TEXT}")}</text></a>'
+    )
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
+
+
+# Characters with inline meaning in Markdown, and ``|`` for table cells.
+_MD_SPECIAL = frozenset("\\`*_[]<>|")
+
+
+def _md_escape(text: str) -> str:
+    return "".join(f"\\{c}" if c in _MD_SPECIAL else c for c in text)
+
+
+def render_markdown(rows: Sequence[Row], title: str = TITLE) -> str:
+    """Render a Markdown card: a heading, a four-column table and the licence."""
+    lines = [
+        f"# {_md_escape(title)}",
+        "",
+        "| Letter | Word | Letter | Word |",
+        "| :-- | :-: | :-- | :-: |",
+    ]
+    for pair in split_columns(rows):
+        lines.append("| " + " | ".join(_md_escape(cell) for cell in pair) + " |")
+    lines += [
+        "",
+        f"[{TITLE}]({PROJECT_URL}) © 2024 by [Matt Troutman]({AUTHOR_URL}) "
+        f"is licensed under [CC BY-SA 4.0]({LICENSE_URL}).",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+RENDERERS: Dict[str, Callable[[Sequence[Row], str], str]] = {
+    "html": render_html,
+    "svg": render_svg,
+    "md": render_markdown,
+}
+
+FORMATS = tuple(RENDERERS)
+
+
+def render_card(
+    fmt: str,
+    alphabet: str = DEFAULT_ALPHABET,
+    *,
+    title: Optional[str] = None,
+    extra_rows: Sequence[Row] = (),
+) -> str:
+    """
+    Render a reference card for an alphabet.
+
+    Args:
+        fmt: One of :data:`FORMATS` (``"html"``, ``"svg"`` or ``"md"``)
+        alphabet: Name of a registered alphabet
+        title: Card title (default: ``"<Alphabet> Phonetic Alphabet"``,
+            or :data:`TITLE` for NATO)
+        extra_rows: Further ``(label, word)`` rows after the letters
+
+    Raises:
+        ValueError: If the format or alphabet is unknown
+    """
+    renderer = RENDERERS.get(fmt)
+    if renderer is None:
+        raise ValueError(f"Unknown card format {fmt!r}. Valid formats: {', '.join(FORMATS)}")
+    if title is None:
+        name = get_alphabet(alphabet)
+        title = TITLE if name.name == DEFAULT_ALPHABET else f"{name.title} Phonetic Alphabet"
+    return renderer([*card_rows(alphabet), *extra_rows], title)
@@ -1,19 +1,39 @@
-"""Command-line interface for the NATO phonetic alphabet."""
+"""Command-line interface for the NATO phonetic alphabet.
+
+Rich and the asset downloader are imported inside the functions that use
+them: most invocations only spell a word and should not pay for either.
+"""
+
+from __future__ import annotations
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.box import ROUNDED
-from rich.panel import Panel
-from rich.prompt import Prompt
 
+import sys
 from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterable, Optional
+
+from .alphabets import DEFAULT_ALPHABET, alphabet_names, get_alphabet, get_encoder
+from .core import spell_lines, spell_word, get_full_alphabet
+from .decoder import ERRORS as DECODE_ERRORS, DecodeError, decode
+from .encoder import SPECIAL
+from .formats import STREAM_FORMATS, render_word, write_records
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+_console: Optional[Console] = None
 
-from . import __version__ as PROJECT_VERSION
-from . import assets as _assets
-from .core import spell_word, get_full_alphabet
 
-console = Console()
+def get_console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
 
 PROJECT_NAME = "phonetic"
 PROJECT_DESC = (
@@ -22,16 +42,48 @@ PROJECT_DESC = (
 )
 PROJECT_AUTHOR = "trtmn <trtmn@trtmn.io>"
 
+alphabet_option = click.option(
+    '-a', '--alphabet',
+    type=click.Choice(alphabet_names(), case_sensitive=False),
+    default=DEFAULT_ALPHABET,
+    show_default=True,
+    help="Spelling alphabet to use.",
+)
+
+transliterate_option = click.option(
+    '-t', '--transliterate',
+    is_flag=True,
+    help="Romanize accented and non-Latin letters (É -> E, Ж -> ZH) before spelling.",
+)
+
+mirror_option = click.option(
+    '-m', '--mirror', 'mirrors',
+    multiple=True,
+    metavar='URL',
+    help="Extra asset mirror (base URL or directory) to try; repeatable. See also $PHONETIC_MIRRORS.",
+)
+
+offline_option = click.option(
+    '--offline/--online',
+    default=None,
+    help="Only use local copies ($PHONETIC_ASSET_DIR or bundled), no network. Default: $PHONETIC_OFFLINE.",
+)
+
 
 class PhoneticGroup(click.Group):
     def format_help(self, ctx: click.Context,
                    formatter: click.HelpFormatter) -> None:
+        from rich.panel import Panel
+
+        console = get_console()
         # Usage section
         console.print(Panel.fit(
-            f"{ctx.command_path} [OPTIONS] COMMAND [ARGS]...\n\n"
+            f"{ctx.command_path} [OPTIONS] COMMAND [ARGS]...\n"
+            f"{ctx.command_path} [OPTIONS] WORD [--format FORMAT]\n\n"
             "NATO Phonetic Alphabet CLI - Beautiful terminal interface.\n\n"
             "If a word is provided without a command, it will be spelled out using "
-            "the NATO phonetic alphabet.",
+            "the NATO phonetic alphabet. FORMAT is table, plain, tsv, json or csv "
+            "(default: table on a terminal, plain otherwise).",
             border_style="cyan",
             title="Usage"
         ))
@@ -40,6 +92,8 @@ class PhoneticGroup(click.Group):
         # Options section
         console.print(Panel.fit(
             "--version  Show the version and exit.\n"
+            f"--alphabet Spelling alphabet: {', '.join(alphabet_names())}.\n"
+            "--transliterate  Romanize accented and non-Latin letters first.\n"
             "--help     Show this message and exit.",
             border_style="green",
             title="Options"
@@ -50,6 +104,11 @@ class PhoneticGroup(click.Group):
         console.print(Panel.fit(
             "interactive  Enter interactive mode\n"
             "list         Show full alphabet\n"
+            "encode       Spell lines of text as plain, TSV or JSON lines\n"
+            "decode       Decode phonetic words back to text\n"
+            "serve        Keep a warm spelling server on a Unix socket\n"
+            "http         Serve /spell, /decode and /alphabet over HTTP\n"
+            "export       Write an HTML, SVG or Markdown reference card\n"
             "open         Open a printable asset (default: portrait PDF)\n"
             "download     Download a printable asset to ~/Downloads",
             border_style="yellow",
@@ -60,8 +119,12 @@ class PhoneticGroup(click.Group):
         # Examples section
         console.print(Panel.fit(
             "[cyan]phonetic 'HELLO'[/cyan]            # Spell out HELLO\n"
+            "[cyan]phonetic HELLO --format csv[/cyan]  # Machine-readable output\n"
+            "[cyan]phonetic HELLO -a icao[/cyan]       # Use the ICAO alphabet\n"
             "[cyan]phonetic interactive[/cyan]       # Interactive mode\n"
             "[cyan]phonetic list[/cyan]              # Show full alphabet\n"
+            "[cyan]phonetic decode Hotel Echo[/cyan] # Decode back to HE\n"
+            "[cyan]phonetic encode -s < ids.txt[/cyan] # Spell a file line by line\n"
             "[cyan]phonetic open[/cyan]              # Open printable PDF\n"
             "[cyan]phonetic download --list[/cyan]   # List downloadable assets",
             border_style="magenta",
@@ -71,15 +134,26 @@ class PhoneticGroup(click.Group):
 
 @click.group(cls=PhoneticGroup, invoke_without_command=True)
 @click.option('--version', is_flag=True, help='Show the version and exit.')
+@alphabet_option
+@transliterate_option
 @click.pass_context
-def main(ctx: click.Context, version: bool = False) -> None:
+def main(
+    ctx: click.Context,
+    version: bool = False,
+    alphabet: str = DEFAULT_ALPHABET,
+    transliterate: bool = False,
+) -> None:
     """NATO Phonetic Alphabet CLI - Beautiful terminal interface.
     
     If a word is provided without a command, it will be spelled out using 
     the NATO phonetic alphabet.
     """
     if version:
-        console.print(Panel.fit(
+        from rich.panel import Panel
+
+        from . import __version__ as PROJECT_VERSION
+
+        get_console().print(Panel.fit(
             f"[bold cyan]{PROJECT_NAME}[/bold cyan] [green]v{PROJECT_VERSION}[/green]",
             border_style="cyan",
             title="Version"
@@ -91,22 +165,157 @@ def main(ctx: click.Context, version: bool = False) -> None:
         if args:
             # Treat the first non-option argument as a word to spell
             word = args[0]
-            spell_word_command(word)
+            spell_word_command(word, alphabet=alphabet, transliterate=transliterate)
         else:
             # Show help if no arguments provided
             click.echo(ctx.get_help())
 
 
 @main.command('interactive', short_help="Enter interactive mode", help="Enter interactive mode for spelling words.")
-def interactive_cmd() -> None:
+@alphabet_option
+@transliterate_option
+def interactive_cmd(alphabet: str, transliterate: bool) -> None:
     """Enter interactive mode for spelling words."""
-    interactive_command()
+    interactive_command(alphabet, transliterate=transliterate)
 
 
 @main.command('list', short_help="Show full alphabet", help="Display the complete NATO phonetic alphabet.")
-def list_cmd() -> None:
+@alphabet_option
+def list_cmd(alphabet: str) -> None:
     """Display the complete NATO phonetic alphabet."""
-    print_alphabet_command()
+    print_alphabet_command(alphabet)
+
+
+@main.command(
+    'encode',
+    short_help="Spell lines of text as plain, TSV or JSON lines",
+    help=(
+        "Spell each argument, or with --stream each line of --input/stdin, "
+        "writing one output line per input line."
+    ),
+)
+@click.argument('text', nargs=-1)
+@click.option('-s', '--stream', is_flag=True, help="Read lines incrementally from --input (default: stdin).")
+@click.option('-i', '--input', 'source', type=click.File('r', lazy=True), default='-', help="File to read with --stream.")
+@click.option('--format', 'fmt', type=click.Choice(STREAM_FORMATS), default='plain', show_default=True, help="Output format.")
+@click.option('-w', '--workers', type=click.IntRange(min=1), default=1, show_default=True, help="Spell batches in this many processes (for very large inputs).")
+@alphabet_option
+@transliterate_option
+def encode_cmd(
+    text: tuple[str, ...],
+    stream: bool,
+    source: IO[str] | None,
+    fmt: str,
+    workers: int,
+    alphabet: str,
+    transliterate: bool,
+) -> None:
+    if stream and text:
+        raise click.UsageError("Pass TEXT arguments or --stream, not both.")
+    lines: Iterable[str] = text if text and not stream else source or sys.stdin
+    out = sys.stdout
+    if workers == 1:
+        records = spell_lines(lines, alphabet=alphabet, transliterate=transliterate)
+        write_records(records, out, fmt)
+        return
+    from .parallel import format_lines
+
+    for block in format_lines(lines, fmt, workers, alphabet=alphabet, transliterate=transliterate):
+        out.write(block)
+
+
+@main.command(
+    'decode',
+    short_help="Decode phonetic words back to text",
+    help="Decode phonetic words back to text. Reads stdin line by line when no words are given.",
+)
+@click.argument('words', nargs=-1)
+@click.option('-e', '--errors', type=click.Choice(DECODE_ERRORS), default='strict', show_default=True, help="How to handle unknown words.")
+@click.option('-z', '--fuzzy', is_flag=True, help="Also resolve misspelled or split words (e.g. 'Charly', 'Fox trot').")
+@alphabet_option
+def decode_cmd(words: tuple[str, ...], errors: str, fuzzy: bool, alphabet: str) -> None:
+    try:
+        if words:
+            decode_command(" ".join(words), errors, fuzzy=fuzzy, alphabet=alphabet)
+        else:
+            for line in sys.stdin:
+                click.echo(decode(line, errors, fuzzy=fuzzy, alphabet=alphabet))  # type: ignore[arg-type]
+    except DecodeError as exc:
+        raise click.ClickException(str(exc))
+
+
+@main.command(
+    'serve',
+    short_help="Keep a warm spelling server on a Unix socket",
+    help=(
+        "Listen on a Unix domain socket so that 'phonetic WORD' can hand its "
+        "request to this process instead of starting up from scratch. Runs "
+        "until interrupted. Set PHONETIC_NO_SERVER=1 to make clients ignore it."
+    ),
+)
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False), help="Socket path (default: $PHONETIC_SOCKET or $XDG_RUNTIME_DIR/phonetic.sock).")
+def serve_cmd(socket_path: str | None) -> None:
+    from . import daemon
+
+    path = socket_path or daemon.default_socket_path()
+    try:
+        daemon.serve(
+            path,
+            ready=lambda _: get_console().print(
+                f"[green]Listening[/green] on [dim]{path}[/dim] (Ctrl+C to stop)"
+            ),
+        )
+    except daemon.DaemonError as exc:
+        raise click.ClickException(str(exc))
+    except KeyboardInterrupt:
+        get_console().print("\n[yellow]Stopped.[/yellow]")
+
+
+@main.command(
+    'http',
+    short_help="Serve /spell, /decode and /alphabet over HTTP",
+    help=(
+        "Run a small HTTP/1.1 service: GET /spell?text=..., GET /decode?text=..."
+        "&fuzzy=1 and GET /alphabet (POST bodies are accepted too). Responses "
+        "are JSON unless format=plain or Accept: text/plain."
+    ),
+)
+@click.option('--host', default="127.0.0.1", show_default=True, help="Interface to bind.")
+@click.option('-p', '--port', type=int, default=8080, show_default=True, help="Port to bind.")
+def http_cmd(host: str, port: int) -> None:
+    from . import http_server
+
+    try:
+        http_server.run(
+            host,
+            port,
+            ready=lambda server: get_console().print(
+                f"[green]Listening[/green] on [cyan]http://{host}:{server.port}/[/cyan] (Ctrl+C to stop)"
+            ),
+        )
+    except OSError as exc:
+        raise click.ClickException(str(exc))
+    except KeyboardInterrupt:
+        get_console().print("\n[yellow]Stopped.[/yellow]")
+
+
+@main.command(
+    'export',
+    short_help="Write an HTML, SVG or Markdown reference card",
+    help="Render a standalone reference card of the alphabet to --output (default: stdout).",
+)
+@click.option('--format', 'fmt', type=click.Choice(('html', 'svg', 'md')), default='html', show_default=True, help="Card format.")
+@click.option('--title', help="Card title (default: the alphabet's name).")
+@click.option('-o', '--output', type=click.Path(dir_okay=False, path_type=Path), help="File to write (default: stdout).")
+@alphabet_option
+def export_cmd(fmt: str, title: str | None, output: Path | None, alphabet: str) -> None:
+    from .cards import render_card
+
+    card = render_card(fmt, alphabet, title=title)
+    if output is None:
+        click.echo(card, nl=False)
+    else:
+        output.write_text(card, encoding='utf-8')
 
 
 @main.command(
@@ -114,12 +323,25 @@ def list_cmd() -> None:
     short_help="Open a printable asset (default: portrait PDF)",
     help="Download (or reuse) an asset and open it with your OS default handler.",
 )
-@click.argument('slug', required=False, default=_assets.DEFAULT_SLUG)
+@click.argument('slug', required=False)
 @click.option('-o', '--output', type=click.Path(file_okay=False, path_type=Path), help="Directory to save into (default: ~/Downloads).")
-@click.option('-f', '--force', is_flag=True, help="Re-download even if the file already exists.")
-def open_cmd(slug: str, output: Path | None, force: bool) -> None:
+@click.option('-f', '--force', is_flag=True, help="Re-download even if an up-to-date copy exists.")
+@mirror_option
+@offline_option
+def open_cmd(
+    slug: str | None, output: Path | None, force: bool, mirrors: tuple[str, ...], offline: bool | None
+) -> None:
+    from . import assets as _assets
+
     try:
-        _assets.open_asset(slug, output, force=force, console=console)
+        _assets.open_asset(
+            slug or _assets.DEFAULT_SLUG,
+            output,
+            force=force,
+            console=get_console(),
+            mirrors=mirrors,
+            offline=offline,
+        )
     except _assets.AssetError as exc:
         raise click.ClickException(str(exc))
 
@@ -127,29 +349,68 @@ def open_cmd(slug: str, output: Path | None, force: bool) -> None:
 @main.command(
     'download',
     short_help="Download a printable asset to ~/Downloads",
-    help="Download an asset without opening it.",
+    help="Download an asset without opening it, or every asset with --all.",
 )
 @click.argument('slug', required=False)
 @click.option('-o', '--output', type=click.Path(file_okay=False, path_type=Path), help="Directory to save into (default: ~/Downloads).")
-@click.option('-f', '--force', is_flag=True, help="Re-download even if the file already exists.")
+@click.option('-f', '--force', is_flag=True, help="Re-download even if an up-to-date copy exists.")
 @click.option('-l', '--list', 'list_only', is_flag=True, help="List available assets and exit.")
-def download_cmd(slug: str | None, output: Path | None, force: bool, list_only: bool) -> None:
+@click.option('-a', '--all', 'all_assets', is_flag=True, help="Download every asset concurrently.")
+@click.option('-j', '--jobs', type=click.IntRange(min=1), default=4, show_default=True, help="Concurrent downloads with --all.")
+@mirror_option
+@offline_option
+def download_cmd(
+    slug: str | None,
+    output: Path | None,
+    force: bool,
+    list_only: bool,
+    all_assets: bool,
+    jobs: int,
+    mirrors: tuple[str, ...],
+    offline: bool | None,
+) -> None:
+    from . import assets as _assets
+
+    console = get_console()
+    if all_assets and not list_only:
+        try:
+            _assets.download_assets(
+                _assets.ASSETS,
+                output,
+                force=force,
+                console=console,
+                workers=jobs,
+                mirrors=mirrors,
+                offline=offline,
+            )
+        except _assets.AssetError as exc:
+            raise click.ClickException(str(exc))
+        return
     if list_only or slug is None:
         _assets.list_assets(console)
         if not list_only and slug is None:
             console.print(
-                "\nPass a slug to download, e.g. [cyan]phonetic download pdf[/cyan].",
+                "\nPass a slug to download, e.g. [cyan]phonetic download pdf[/cyan], "
+                "or [cyan]--all[/cyan] for every asset.",
             )
         return
     try:
-        _assets.download_asset(slug, output, force=force, console=console)
+        _assets.download_asset(
+            slug, output, force=force, console=console, mirrors=mirrors, offline=offline
+        )
     except _assets.AssetError as exc:
         raise click.ClickException(str(exc))
 
 
 # Internal functions
-def interactive_command() -> None:
+def interactive_command(
+    alphabet: str = DEFAULT_ALPHABET, *, transliterate: bool = False
+) -> None:
     """Internal function for interactive mode."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    console = get_console()
     console.print(
         Panel.fit(
             "[bold blue]NATO Phonetic Alphabet - Interactive Mode[/bold blue]\n"
@@ -169,20 +430,46 @@ def interactive_command() -> None:
             if not word.strip():
                 continue
 
-            spell_word_command(word)
+            spell_word_command(word, alphabet=alphabet, transliterate=transliterate)
 
         except KeyboardInterrupt:
             console.print("\n[yellow]Goodbye![/yellow]")
             break
 
 
-def spell_word_command(word: str) -> None:
-    """Internal function to spell a word."""
-    result = spell_word(word)
+def spell_word_command(
+    word: str,
+    fmt: Optional[str] = None,
+    alphabet: str = DEFAULT_ALPHABET,
+    *,
+    transliterate: bool = False,
+) -> None:
+    """Internal function to spell a word.
+
+    ``fmt`` is ``"table"`` or one of ``WORD_FORMATS``. When omitted, the Rich
+    table is drawn for terminals and plain text is written otherwise.
+    """
+    if transliterate:
+        word = get_encoder(alphabet).transliterate(word)
+    if fmt is None:
+        fmt = "table" if sys.stdout.isatty() else "plain"
+    if fmt != "table":
+        sys.stdout.write(render_word(word, spell_word(word, alphabet), fmt))
+        return
+
+    get_console().print(build_word_table(word, alphabet))
+
+
+def build_word_table(word: str, alphabet: str = DEFAULT_ALPHABET) -> Table:
+    """Internal function to build the Rich table for a spelled word."""
+    from rich.box import ROUNDED
+    from rich.table import Table
+
+    result = spell_word(word, alphabet)
 
     # Create a table for beautiful output with rounded corners
     table = Table(
-        title=f"NATO Phonetic Spelling: {word.upper()}", 
+        title=f"{get_alphabet(alphabet).title} Phonetic Spelling: {word.upper()}", 
         box=ROUNDED
     )
     table.add_column("Letter", style="cyan", justify="center")
@@ -191,21 +478,44 @@ def spell_word_command(word: str) -> None:
     for letter, phonetic in result:
         if letter.isspace():
             table.add_row(letter, "[dim]Space[/dim]")
-        elif not letter.isalnum():
+        elif phonetic == SPECIAL:
             table.add_row(letter, "[dim]Special Character[/dim]")
+        elif not letter.isalnum():
+            table.add_row(letter, f"[dim]{phonetic}[/dim]")
         else:
             table.add_row(letter, phonetic)
 
-    console.print(table)
+    return table
 
 
-def print_alphabet_command() -> None:
+def decode_command(
+    text: str,
+    errors: str = "strict",
+    *,
+    fuzzy: bool = False,
+    alphabet: str = DEFAULT_ALPHABET,
+) -> None:
+    """Internal function to decode phonetic words."""
+    from rich.panel import Panel
+
+    decoded = decode(text, errors, fuzzy=fuzzy, alphabet=alphabet)  # type: ignore[arg-type]
+    get_console().print(Panel.fit(
+        f"[bold green]{decoded}[/bold green]",
+        border_style="green",
+        title="Decoded",
+    ))
+
+
+def print_alphabet_command(name: str = DEFAULT_ALPHABET) -> None:
     """Internal function to print the alphabet."""
-    alphabet = get_full_alphabet()
+    from rich.box import ROUNDED
+    from rich.table import Table
+
+    alphabet = get_full_alphabet(name)
 
     # Create a table for beautiful output with rounded corners
     table = Table(
-        title="NATO Phonetic Alphabet", 
+        title=f"{get_alphabet(name).title} Phonetic Alphabet", 
         box=ROUNDED
     )
     table.add_column("Letter", style="cyan", justify="center")
@@ -215,7 +525,7 @@ def print_alphabet_command() -> None:
     for letter in sorted(alphabet.keys()):
         table.add_row(letter, alphabet[letter])
 
-    console.print(table)
+    get_console().print(table)
 
 
 if __name__ == "__main__":
@@ -1,104 +1,214 @@
 """Core functionality for the NATO phonetic alphabet."""
 
-from typing import Dict, List, Optional
-
-# NATO Phonetic Alphabet mapping
-NATO_PHONETIC_ALPHABET: Dict[str, str] = {
-    "A": "Alpha",
-    "B": "Bravo",
-    "C": "Charlie",
-    "D": "Delta",
-    "E": "Echo",
-    "F": "Foxtrot",
-    "G": "Golf",
-    "H": "Hotel",
-    "I": "India",
-    "J": "Juliet",
-    "K": "Kilo",
-    "L": "Lima",
-    "M": "Mike",
-    "N": "November",
-    "O": "Oscar",
-    "P": "Papa",
-    "Q": "Quebec",
-    "R": "Romeo",
-    "S": "Sierra",
-    "T": "Tango",
-    "U": "Uniform",
-    "V": "Victor",
-    "W": "Whiskey",
-    "X": "X-ray",
-    "Y": "Yankee",
-    "Z": "Zulu",
-    "0": "Zero",
-    "1": "One",
-    "2": "Two",
-    "3": "Three",
-    "4": "Four",
-    "5": "Five",
-    "6": "Six",
-    "7": "Seven",
-    "8": "Eight",
-    "9": "Nine",
-}
-
-
-def lookup_letter(letter: str) -> Optional[str]:
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Union
+
+from .alphabets import (  # noqa: F401 - NATO_PHONETIC_ALPHABET is re-exported
+    DEFAULT_ALPHABET,
+    NATO_PHONETIC_ALPHABET,
+    get_alphabet,
+    get_encoder,
+)
+from .encoder import OUTPUTS, CompactSpelling, FlatSpelling
+
+
+def lookup_letter(letter: str, alphabet: str = DEFAULT_ALPHABET) -> Optional[str]:
     """
     Look up the NATO phonetic equivalent for a single letter.
 
     Args:
         letter: The letter to look up (case-insensitive)
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
 
     Returns:
         The NATO phonetic equivalent or None if not found
     """
-    return NATO_PHONETIC_ALPHABET.get(letter.upper())
+    return get_alphabet(alphabet).letters.get(letter.upper())
 
 
-def spell_word(word: str) -> List[tuple[str, str]]:
+def spell_word(
+    word: str, alphabet: str = DEFAULT_ALPHABET, *, transliterate: bool = False
+) -> List[tuple[str, str]]:
     """
     Spell out a word using the NATO phonetic alphabet.
 
     Args:
         word: The word to spell out
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+        transliterate: Romanize accented and non-Latin characters first
+            (``"É"`` -> ``"E"``, ``"Ж"`` -> ``"ZH"``) instead of spelling
+            them as ``"Unknown"``
 
     Returns:
         List of tuples containing (letter, phonetic_equivalent)
+
+    Raises:
+        ValueError: If ``alphabet`` is not registered
+    """
+    encoder = get_encoder(alphabet)
+    if transliterate:
+        word = encoder.transliterate(word)
+    return encoder.spell(word)
+
+
+def spell_string(
+    word: str,
+    sep: str = " ",
+    alphabet: str = DEFAULT_ALPHABET,
+    *,
+    transliterate: bool = False,
+) -> str:
+    """
+    Spell out a word as a single string of NATO phonetic words.
+
+    Args:
+        word: The word to spell out
+        sep: Separator placed between phonetic words
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+        transliterate: Romanize accented and non-Latin characters first
+            (``"É"`` -> ``"E"``, ``"Ж"`` -> ``"ZH"``) instead of spelling
+            them as ``"Unknown"``
+
+    Returns:
+        The phonetic words joined by ``sep``, e.g. ``"Alpha Bravo One"``
+    """
+    encoder = get_encoder(alphabet)
+    if transliterate:
+        word = encoder.transliterate(word)
+    return encoder.spell_string(word, sep)
+
+
+def spell_compact(
+    word: str, alphabet: str = DEFAULT_ALPHABET, *, transliterate: bool = False
+) -> CompactSpelling:
+    """
+    Spell out a word into a compact, token-id backed result.
+
+    Args:
+        word: The word to spell out
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+        transliterate: Romanize accented and non-Latin characters first
+            (``"É"`` -> ``"E"``, ``"Ж"`` -> ``"ZH"``) instead of spelling
+            them as ``"Unknown"``
+
+    Returns:
+        A ``CompactSpelling`` that iterates as (letter, phonetic_equivalent)
+        tuples but stores one byte per character
     """
-    result = []
-    for char in word.upper():
-        if char.isalnum():
-            phonetic = NATO_PHONETIC_ALPHABET.get(char)
-            if phonetic:
-                result.append((char, phonetic))
-            else:
-                result.append((char, "Unknown"))
-        elif char.isspace():
-            result.append((char, "Space"))
-        else:
-            result.append((char, "Special"))
-    return result
+    encoder = get_encoder(alphabet)
+    if transliterate:
+        word = encoder.transliterate(word)
+    return encoder.spell_compact(word)
+
+
+def spell_many(
+    words: Iterable[str],
+    *,
+    output: Literal["tuples", "strings", "compact", "flat"] = "tuples",
+    workers: Optional[int] = None,
+    alphabet: str = DEFAULT_ALPHABET,
+    transliterate: bool = False,
+) -> Union[
+    List[List[tuple[str, str]]], List[str], List[CompactSpelling], FlatSpelling
+]:
+    """
+    Spell out many words using the NATO phonetic alphabet in one call.
 
+    Args:
+        words: The words to spell out
+        output: ``"tuples"`` for a list of ``spell_word`` results,
+            ``"strings"`` for a list of ``spell_string`` results,
+            ``"compact"`` for a list of ``spell_compact`` results, or
+            ``"flat"`` for a compact ``FlatSpelling`` of offsets and token ids
+        workers: Spell in this many worker processes (only worth it for
+            hundreds of thousands of words); None or 1 spells in-process
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+        transliterate: Romanize accented and non-Latin characters first;
+            see :func:`spell_word`
 
-def get_full_alphabet() -> Dict[str, str]:
+    Returns:
+        The spellings in input order, shaped according to ``output``
+
+    Raises:
+        ValueError: If ``output`` is not one of the supported shapes
+    """
+    encoder = get_encoder(alphabet)
+    if transliterate:
+        words = map(encoder.transliterate, words)
+    if workers is None or workers <= 1:
+        return encoder.spell_many(words, output=output)
+    if output not in OUTPUTS:
+        raise ValueError(
+            f"Unknown output {output!r}. Valid outputs: {', '.join(OUTPUTS)}"
+        )
+
+    from .parallel import spell_many_flat
+
+    flat = spell_many_flat(words, workers, alphabet)
+    if output == "flat":
+        return flat
+    if output == "strings":
+        return [flat.spelled(i) for i in range(len(flat))]
+    if output == "compact":
+        return [flat.compact(i) for i in range(len(flat))]
+    return list(flat)
+
+
+def spell_lines(
+    lines: Iterable[str],
+    *,
+    batch_size: int = 1024,
+    alphabet: str = DEFAULT_ALPHABET,
+    transliterate: bool = False,
+) -> Iterator[tuple[str, CompactSpelling]]:
+    """
+    Lazily spell a stream of lines using the NATO phonetic alphabet.
+
+    Lines are pulled from ``lines`` (e.g. an open file or ``sys.stdin``)
+    ``batch_size`` at a time and spelled with ``spell_many``, so memory
+    stays bounded no matter how long the input is.
+
+    Args:
+        lines: The lines to spell; trailing newlines are stripped
+        batch_size: How many lines to spell per batch
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+        transliterate: Romanize accented and non-Latin characters before
+            spelling; the yielded ``line`` is left as it was read
+
+    Yields:
+        ``(line, spelling)`` pairs in input order
+    """
+    encoder = get_encoder(alphabet)
+    iterator = iter(lines)
+    while batch := [line.rstrip("\r\n") for line in islice(iterator, batch_size)]:
+        words = list(map(encoder.transliterate, batch)) if transliterate else batch
+        flat = encoder.spell_flat(words)
+        for i, line in enumerate(batch):
+            yield line, flat.compact(i)
+
+
+def get_full_alphabet(alphabet: str = DEFAULT_ALPHABET) -> Dict[str, str]:
     """
     Get the complete NATO phonetic alphabet.
 
+    Args:
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+
     Returns:
         Dictionary of all NATO phonetic alphabet mappings
     """
-    return NATO_PHONETIC_ALPHABET.copy()
+    return get_alphabet(alphabet).letters.copy()
 
 
-def is_valid_letter(letter: str) -> bool:
+def is_valid_letter(letter: str, alphabet: str = DEFAULT_ALPHABET) -> bool:
     """
     Check if a letter has a NATO phonetic equivalent.
 
     Args:
         letter: The letter to check
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
 
     Returns:
         True if the letter has a NATO phonetic equivalent
     """
-    return letter.upper() in NATO_PHONETIC_ALPHABET
+    return letter.upper() in get_alphabet(alphabet).letters
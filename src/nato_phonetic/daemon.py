@@ -0,0 +1,199 @@
+"""Keep an encoder warm behind a Unix domain socket.
+
+``phonetic serve`` listens on a socket; ``phonetic WORD`` forwards its
+request there when the socket exists and falls back to spelling in-process
+otherwise. The protocol is deliberately tiny so the client needs nothing
+beyond ``socket``: the client sends a header line ``FORMAT WIDTH COLOR
+ALPHABET`` followed by the word, shuts down its write side, and reads the rendered
+output until the server closes the connection.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable, Optional
+
+from .alphabets import DEFAULT_ALPHABET
+
+SOCKET_ENV = "PHONETIC_SOCKET"
+DISABLE_ENV = "PHONETIC_NO_SERVER"
+
+# Client requests are a few bytes; anything larger is not ours.
+_MAX_REQUEST = 1 << 20
+_CLIENT_TIMEOUT = 2.0
+
+
+class DaemonError(Exception):
+    """Raised when the server cannot be started."""
+
+
+def default_socket_path() -> str:
+    """Return the socket path: ``$PHONETIC_SOCKET``, else a per-user runtime path."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return override
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "phonetic.sock")
+    import tempfile
+
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"phonetic-{uid}.sock")
+
+
+def _owned_socket(path: str) -> bool:
+    """Whether ``path`` is a socket owned by this user.
+
+    The fallback path in the shared temp directory is predictable, so
+    another user could create it first and answer in our place.
+    """
+    import stat
+
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    if not stat.S_ISSOCK(info.st_mode):
+        return False
+    return not hasattr(os, "getuid") or info.st_uid == os.getuid()
+
+
+def render(
+    word: str,
+    fmt: str,
+    width: int = 80,
+    color: bool = False,
+    alphabet: str = DEFAULT_ALPHABET,
+) -> str:
+    """Render ``word`` exactly as ``phonetic WORD --format FMT`` would."""
+    if fmt != "table":
+        from .core import spell_word
+        from .formats import render_word
+
+        return render_word(word, spell_word(word, alphabet), fmt)
+
+    import io
+
+    from rich.console import Console
+
+    from .cli import build_word_table
+
+    buffer = io.StringIO()
+    console = Console(file=buffer, width=width, force_terminal=color, no_color=not color)
+    console.print(build_word_table(word, alphabet))
+    return buffer.getvalue()
+
+
+def request(
+    word: str,
+    fmt: str,
+    *,
+    width: int = 80,
+    color: bool = False,
+    alphabet: str = DEFAULT_ALPHABET,
+    path: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Ask a running server to render ``word``.
+
+    Returns:
+        The rendered output, or None when no server answered, in which case
+        the caller should spell the word itself
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+    path = path or default_socket_path()
+    if not _owned_socket(path):
+        return None
+
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CLIENT_TIMEOUT)
+            sock.connect(path)
+            sock.sendall(f"{fmt} {width} {int(color)} {alphabet}\n{word}".encode())
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    return b"".join(chunks).decode() or None
+
+
+def serve(
+    path: Optional[str] = None,
+    *,
+    ready: Optional[Callable[[object], None]] = None,
+) -> None:
+    """
+    Serve spelling requests on a Unix domain socket until interrupted.
+
+    Args:
+        path: Socket path (default: :func:`default_socket_path`)
+        ready: Optional callback invoked with the server once it is listening
+
+    Raises:
+        DaemonError: If Unix sockets are unavailable or a server is running
+    """
+    import socket
+    import socketserver
+
+    from .formats import WORD_FORMATS
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("Unix domain sockets are not available on this platform")
+
+    path = path or default_socket_path()
+    formats = {"table", *WORD_FORMATS}
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            data = self.rfile.read(_MAX_REQUEST)
+            header, _, body = data.partition(b"\n")
+            try:
+                fmt, width, color, *rest = header.decode().split()
+                word = body.decode()
+                if fmt not in formats or not word or len(rest) > 1:
+                    return
+                alphabet = rest[0] if rest else DEFAULT_ALPHABET
+                output = render(word, fmt, int(width), color == "1", alphabet)
+            except ValueError:
+                return
+            self.wfile.write(output.encode())
+
+    if os.path.exists(path):
+        if _is_listening(path):
+            raise DaemonError(f"A server is already listening on {path}")
+        os.unlink(path)
+
+    # Build the tables and import the renderers before accepting requests.
+    render("warm up", "plain")
+    render("warm up", "table")
+
+    old_umask = os.umask(0o077)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+    try:
+        if ready is not None:
+            ready(server)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def _is_listening(path: str) -> bool:
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
@@ -0,0 +1,294 @@
+"""Decode phonetic words back to the text they spell."""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Literal, Mapping, Optional
+
+from .alphabets import DEFAULT_ALPHABET, NATO_VARIANTS, get_decoder
+from .encoder import SPACE
+from .fuzzy import FuzzyIndex
+
+ERRORS = ("strict", "ignore", "replace")
+REPLACEMENT = "?"
+
+# Default extra spellings; each registered alphabet carries its own.
+VARIANTS: Dict[str, tuple[str, ...]] = NATO_VARIANTS
+
+# A token is a run of letters/digits, optionally joined by hyphens ("X-ray").
+_TOKEN_RE = re.compile(r"[^\W_]+(?:-[^\W_]+)*")
+
+
+class DecodeError(ValueError):
+    """Raised when a token is not a phonetic word of the alphabet."""
+
+    def __init__(self, token: str, position: int) -> None:
+        super().__init__(f"Unknown phonetic word {token!r} at position {position}")
+        self.token = token
+        self.position = position
+
+
+@dataclass(frozen=True)
+class Match:
+    """
+    A token of a transcript and the character it was resolved to.
+
+    ``char`` is None when the token could not be resolved. ``confidence``
+    is 1.0 for an exact match and falls with the edit distance.
+    """
+
+    token: str
+    position: int
+    char: Optional[str]
+    distance: int
+    confidence: float
+
+
+def _normalize(word: str) -> str:
+    return word.casefold().replace("-", "")
+
+
+class Decoder:
+    """
+    Decode phonetic words using an index compiled once from an alphabet.
+
+    The index is a single dict keyed by the case-folded, hyphen-free form of
+    every word and variant, so each token costs one hash lookup and a whole
+    transcript is decoded in one pass over its tokens.
+
+    Args:
+        alphabet: Mapping of uppercase characters to phonetic words
+        variants: Extra spellings accepted for each character
+    """
+
+    def __init__(
+        self,
+        alphabet: Mapping[str, str],
+        variants: Mapping[str, Iterable[str]] = VARIANTS,
+    ) -> None:
+        index: Dict[str, str] = {_normalize(SPACE): " "}
+        for char, extra in variants.items():
+            for word in extra:
+                index[_normalize(word)] = char
+        for char, word in alphabet.items():
+            index[_normalize(word)] = char
+        self.index = index
+        self._fuzzy: Optional[FuzzyIndex] = None
+
+    @property
+    def fuzzy_index(self) -> FuzzyIndex:
+        """The near-miss index, built on first use."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex(self.index)
+        return self._fuzzy
+
+    def lookup(self, word: str) -> Optional[str]:
+        """
+        Look up the character a single phonetic word stands for.
+
+        Args:
+            word: The phonetic word (case-insensitive)
+
+        Returns:
+            The decoded character or None if the word is not recognised
+        """
+        return self.index.get(_normalize(word))
+
+    def match(self, token: str, position: int = 0) -> Match:
+        """
+        Resolve a single token, allowing near misses.
+
+        Args:
+            token: The (possibly misspelled) phonetic word
+            position: Offset of the token in its transcript
+
+        Returns:
+            The best :class:`Match`; ``char`` is None when nothing is close
+        """
+        key = _normalize(token)
+        found = self.fuzzy_index.lookup(key)
+        if found is None:
+            return Match(token, position, None, len(key), 0.0)
+        word, distance = found
+        confidence = 1.0 - distance / max(len(key), len(word))
+        return Match(token, position, self.index[word], distance, confidence)
+
+    def iter_matches(self, text: str, min_confidence: float = 0.0) -> Iterator[Match]:
+        """
+        Yield a :class:`Match` for every phonetic word in ``text``.
+
+        Tokens that fail to resolve on their own are also tried joined with
+        the next token, so split words such as ``"Fox trot"`` decode as one.
+
+        Args:
+            text: A possibly noisy transcript of phonetic words
+            min_confidence: Matches scoring lower are reported unresolved
+        """
+        index = self.index
+        tokens = [(m.group(), m.start()) for m in _TOKEN_RE.finditer(text)]
+        i = 0
+        while i < len(tokens):
+            token, position = tokens[i]
+            char = index.get(_normalize(token))
+            if char is not None:
+                yield Match(token, position, char, 0, 1.0)
+                i += 1
+                continue
+            parts = token.split("-")
+            if len(parts) > 1 and all(_normalize(p) in index for p in parts):
+                for part in parts:
+                    yield Match(part, position, index[_normalize(part)], 0, 1.0)
+                    position += len(part) + 1
+                i += 1
+                continue
+            best = self.match(token, position)
+            if i + 1 < len(tokens):
+                pair = f"{token} {tokens[i + 1][0]}"
+                joined = self.match(pair.replace(" ", ""), position)
+                if joined.char is not None and (
+                    best.char is None or joined.distance < best.distance
+                ):
+                    yield Match(
+                        pair, position, joined.char, joined.distance, joined.confidence
+                    )
+                    i += 2
+                    continue
+            if best.char is not None and best.confidence < min_confidence:
+                best = Match(token, position, None, best.distance, best.confidence)
+            yield best
+            i += 1
+
+    def iter_decode(
+        self,
+        text: str,
+        errors: Literal["strict", "ignore", "replace"] = "strict",
+        *,
+        fuzzy: bool = False,
+    ) -> Iterator[str]:
+        """
+        Yield the decoded character for every phonetic word in ``text``.
+
+        Args:
+            text: Phonetic words separated by whitespace or punctuation
+            errors: ``"strict"`` raises on an unknown word, ``"ignore"``
+                drops it and ``"replace"`` yields ``"?"`` in its place
+            fuzzy: Resolve misspelled and split words via :meth:`iter_matches`
+
+        Raises:
+            DecodeError: If ``errors`` is ``"strict"`` and a word is unknown
+        """
+        if errors not in ERRORS:
+            raise ValueError(
+                f"Unknown errors mode {errors!r}. Valid modes: {', '.join(ERRORS)}"
+            )
+        if fuzzy:
+            for match in self.iter_matches(text):
+                if match.char is not None:
+                    yield match.char
+                elif errors == "strict":
+                    raise DecodeError(match.token, match.position)
+                elif errors == "replace":
+                    yield REPLACEMENT
+            return
+        index = self.index
+        for m in _TOKEN_RE.finditer(text):
+            token = m.group()
+            char = index.get(_normalize(token))
+            if char is not None:
+                yield char
+                continue
+            # "Alpha-Bravo" is two words; only "X-ray" style tokens are one.
+            parts = token.split("-")
+            if len(parts) > 1 and all(_normalize(p) in index for p in parts):
+                for part in parts:
+                    yield index[_normalize(part)]
+                continue
+            if errors == "strict":
+                raise DecodeError(token, m.start())
+            if errors == "replace":
+                yield REPLACEMENT
+
+    def decode(
+        self,
+        text: str,
+        errors: Literal["strict", "ignore", "replace"] = "strict",
+        *,
+        fuzzy: bool = False,
+    ) -> str:
+        """
+        Decode a phonetic transcript back to text.
+
+        Args:
+            text: Phonetic words, e.g. ``"Hotel Echo Lima Lima Oscar"``
+            errors: How to handle unknown words; see :meth:`iter_decode`
+            fuzzy: Resolve misspelled and split words
+
+        Returns:
+            The decoded text, e.g. ``"HELLO"``
+        """
+        return "".join(self.iter_decode(text, errors, fuzzy=fuzzy))
+
+
+def decode(
+    text: str,
+    errors: Literal["strict", "ignore", "replace"] = "strict",
+    *,
+    fuzzy: bool = False,
+    alphabet: str = DEFAULT_ALPHABET,
+) -> str:
+    """
+    Decode NATO phonetic words back to the text they spell.
+
+    Args:
+        text: Phonetic words, e.g. ``"Hotel Echo Lima Lima Oscar"``
+        errors: ``"strict"`` raises on an unknown word, ``"ignore"`` drops
+            it and ``"replace"`` substitutes ``"?"``
+        fuzzy: Also resolve near misses such as ``"Charly"`` or ``"Fox trot"``
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+
+    Returns:
+        The decoded text, e.g. ``"HELLO"``
+
+    Raises:
+        DecodeError: If ``errors`` is ``"strict"`` and a word is unknown
+    """
+    return get_decoder(alphabet).decode(text, errors, fuzzy=fuzzy)
+
+
+def decode_many(
+    texts: Iterable[str],
+    errors: Literal["strict", "ignore", "replace"] = "strict",
+    *,
+    fuzzy: bool = False,
+    alphabet: str = DEFAULT_ALPHABET,
+) -> List[str]:
+    """
+    Decode many phonetic transcripts in one call.
+
+    Args:
+        texts: The transcripts to decode
+        errors: How to handle unknown words; see :func:`decode`
+        fuzzy: Also resolve near misses; see :func:`decode`
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+
+    Returns:
+        The decoded texts in input order
+    """
+    decoder = get_decoder(alphabet).decode
+    return [decoder(text, errors, fuzzy=fuzzy) for text in texts]
+
+
+def match_words(
+    text: str, min_confidence: float = 0.0, alphabet: str = DEFAULT_ALPHABET
+) -> List[Match]:
+    """
+    Resolve every word of a noisy transcript with a confidence score.
+
+    Args:
+        text: A possibly noisy transcript of NATO phonetic words
+        min_confidence: Matches scoring lower are reported unresolved
+        alphabet: Name of a registered alphabet, e.g. ``"icao"``
+
+    Returns:
+        One :class:`Match` per resolved or unresolved word
+    """
+    return list(get_decoder(alphabet).iter_matches(text, min_confidence))
@@ -0,0 +1,373 @@
+"""Precompiled per-codepoint encoder for phonetic spelling."""
+
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .translit import Transliterator
+
+SPACE = "Space"
+SPECIAL = "Special"
+UNKNOWN = "Unknown"
+
+OUTPUTS = ("tuples", "strings", "compact", "flat")
+
+# Token ids are stored one byte each.
+_MAX_VOCABULARY = 256
+
+# Codepoints below this bound are compiled eagerly; anything else is
+# classified the first time it is seen and cached in the same table.
+_EAGER_LIMIT = 128
+
+
+class _CharTable(dict):
+    """Character lookup table that classifies and caches unseen characters."""
+
+    def __init__(
+        self, classify: Callable[[str], object], eager: Dict[str, object]
+    ) -> None:
+        super().__init__(eager)
+        self._classify = classify
+
+    def __missing__(self, char: str) -> object:
+        value = self[char] = self._classify(char)
+        return value
+
+
+class _CodepointTable(dict):
+    """Codepoint-keyed ``str.translate`` table that fills itself on demand."""
+
+    def __init__(self, convert: Callable[[str], str], eager: Dict[int, str]) -> None:
+        super().__init__(eager)
+        self._convert = convert
+
+    def __missing__(self, codepoint: int) -> str:
+        value = self[codepoint] = self._convert(chr(codepoint))
+        return value
+
+
+class CompactSpelling(Sequence):
+    """
+    A spelled word stored as one byte per character.
+
+    Behaves like the ``List[tuple[str, str]]`` returned by ``spell_word``,
+    but keeps only the uppercased text and an ``array('B')`` of token ids
+    into a vocabulary shared by every result of the same encoder. Tuples
+    and strings are built on access.
+    """
+
+    __slots__ = ("text", "ids", "vocabulary")
+
+    def __init__(self, text: str, ids: array, vocabulary: tuple[str, ...]) -> None:
+        self.text = text
+        self.ids = ids
+        self.vocabulary = vocabulary
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[tuple[str, str], "CompactSpelling"]:
+        if isinstance(index, slice):
+            return CompactSpelling(self.text[index], self.ids[index], self.vocabulary)
+        return (self.text[index], self.vocabulary[self.ids[index]])
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return zip(self.text, map(self.vocabulary.__getitem__, self.ids))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactSpelling):
+            return self.text == other.text and self.words() == other.words()
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactSpelling({self.text!r}, {self.to_string()!r})"
+
+    def words(self) -> List[str]:
+        """Return the phonetic word for each character."""
+        return list(map(self.vocabulary.__getitem__, self.ids))
+
+    def to_tuples(self) -> List[tuple[str, str]]:
+        """Return the ``(letter, phonetic_equivalent)`` list ``spell_word`` gives."""
+        return list(self)
+
+    def to_string(self, sep: str = " ") -> str:
+        """Return the phonetic words joined by ``sep``."""
+        return sep.join(map(self.vocabulary.__getitem__, self.ids))
+
+
+class FlatSpelling:
+    """
+    A batch of spellings packed into two arrays.
+
+    ``text`` holds every uppercased input back to back, ``ids`` holds one
+    token id per character of ``text`` (an index into ``vocabulary``) and
+    word ``i`` spans ``offsets[i]:offsets[i + 1]``. Memory therefore grows
+    with the number of characters, not the number of Python objects.
+    """
+
+    __slots__ = ("text", "offsets", "ids", "vocabulary")
+
+    def __init__(
+        self, text: str, offsets: array, ids: array, vocabulary: tuple[str, ...]
+    ) -> None:
+        self.text = text
+        self.offsets = offsets
+        self.ids = ids
+        self.vocabulary = vocabulary
+
+    @classmethod
+    def concat(cls, parts: Iterable["FlatSpelling"]) -> "FlatSpelling":
+        """Join batches spelled by the same encoder into one, in order."""
+        texts: List[str] = []
+        offsets = array("Q", [0])
+        ids = array("B")
+        vocabulary: tuple[str, ...] = ()
+        for part in parts:
+            base = offsets[-1]
+            offsets.extend(base + offset for offset in part.offsets[1:])
+            texts.append(part.text)
+            ids.extend(part.ids)
+            vocabulary = part.vocabulary
+        return cls("".join(texts), offsets, ids, vocabulary)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> List[tuple[str, str]]:
+        start, stop = self._span(index)
+        vocabulary = self.vocabulary
+        return [
+            (self.text[i], vocabulary[self.ids[i]]) for i in range(start, stop)
+        ]
+
+    def __iter__(self) -> Iterator[List[tuple[str, str]]]:
+        return (self[i] for i in range(len(self)))
+
+    def spelled(self, index: int, sep: str = " ") -> str:
+        """Return word ``index`` as a joined phonetic string."""
+        return self.compact(index).to_string(sep)
+
+    def compact(self, index: int) -> CompactSpelling:
+        """Return word ``index`` as a :class:`CompactSpelling`."""
+        start, stop = self._span(index)
+        return CompactSpelling(
+            self.text[start:stop], self.ids[start:stop], self.vocabulary
+        )
+
+    def _span(self, index: int) -> tuple[int, int]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FlatSpelling index out of range")
+        return self.offsets[index], self.offsets[index + 1]
+
+
+class Encoder:
+    """
+    Spell text using lookup tables compiled once from an alphabet mapping.
+
+    Every character is resolved through a table that already holds the
+    ``(letter, phonetic)`` pair and the bare phonetic word, so spelling a
+    string costs one dict lookup per character instead of ``isalnum()``,
+    ``isspace()`` and a fresh tuple.
+
+    Args:
+        alphabet: Mapping of uppercase characters to phonetic words
+        symbols: Mapping of punctuation and other symbols to spoken names,
+            e.g. ``{"-": "Dash"}``; other symbols are spelled ``"Special"``
+    """
+
+    def __init__(
+        self, alphabet: Mapping[str, str], symbols: Optional[Mapping[str, str]] = None
+    ) -> None:
+        self.alphabet: Dict[str, str] = dict(alphabet)
+        self.symbols: Dict[str, str] = dict(symbols or {})
+        self.vocabulary: tuple[str, ...] = tuple(
+            dict.fromkeys(
+                [*self.alphabet.values(), *self.symbols.values(), SPACE, SPECIAL, UNKNOWN]
+            )
+        )
+        if len(self.vocabulary) > _MAX_VOCABULARY:
+            raise ValueError(
+                f"Alphabet has {len(self.vocabulary)} distinct words; "
+                f"at most {_MAX_VOCABULARY} are supported"
+            )
+        self._token_ids = {word: i for i, word in enumerate(self.vocabulary)}
+        eager = [chr(cp) for cp in range(_EAGER_LIMIT)]
+        self._words = _CharTable(
+            self._classify, {char: self._classify(char) for char in eager}
+        )
+        self._pairs = _CharTable(
+            self._pair, {char: (char, self._words[char]) for char in eager}
+        )
+        self._ids = _CodepointTable(
+            self._token_char, {ord(char): self._token_char(char) for char in eager}
+        )
+        self._transliterator: Optional[Transliterator] = None
+
+    def _classify(self, char: str) -> str:
+        word = self.alphabet.get(char) or self.symbols.get(char)
+        if word:
+            return word
+        if char.isalnum():
+            return UNKNOWN
+        if char.isspace():
+            return SPACE
+        return SPECIAL
+
+    def _pair(self, char: str) -> tuple[str, str]:
+        return (char, self._words[char])
+
+    def _token_char(self, char: str) -> str:
+        return chr(self._token_ids[self._words[char]])
+
+    def transliterate(self, text: str) -> str:
+        """
+        Romanize the characters of ``text`` that this alphabet has no word for.
+
+        Characters the alphabet spells itself (e.g. ``"Ä"`` in DIN 5009) are
+        kept; see :mod:`nato_phonetic.translit` for the conversions.
+
+        Args:
+            text: Text that may contain accented or non-Latin characters
+
+        Returns:
+            The text with convertible characters in Latin letters
+        """
+        if text.isascii():
+            return text
+        if self._transliterator is None:
+            from .translit import Transliterator
+
+            self._transliterator = Transliterator(self.alphabet)
+        return self._transliterator(text)
+
+    def spell(self, word: str) -> List[tuple[str, str]]:
+        """
+        Spell out a word as ``(letter, phonetic_equivalent)`` pairs.
+
+        Args:
+            word: The word to spell out
+
+        Returns:
+            List of tuples containing (letter, phonetic_equivalent)
+        """
+        pairs = self._pairs
+        return [pairs[char] for char in word.upper()]
+
+    def spell_string(self, word: str, sep: str = " ") -> str:
+        """
+        Spell out a word as a single string, e.g. ``"Alpha Bravo One"``.
+
+        Args:
+            word: The word to spell out
+            sep: Separator placed between phonetic words
+
+        Returns:
+            The phonetic words joined by ``sep``
+        """
+        return sep.join(map(self._words.__getitem__, word.upper()))
+
+    def spell_compact(self, word: str) -> CompactSpelling:
+        """
+        Spell out a word as a :class:`CompactSpelling`.
+
+        Args:
+            word: The word to spell out
+
+        Returns:
+            The spelling as token ids, decoded to tuples on access
+        """
+        text = word.upper()
+        return CompactSpelling(
+            text,
+            array("B", text.translate(self._ids).encode("latin-1")),
+            self.vocabulary,
+        )
+
+    def encode_ids(self, word: str) -> array:
+        """
+        Encode a word as token ids into :attr:`vocabulary`.
+
+        Args:
+            word: The word to encode
+
+        Returns:
+            An ``array('B')`` with one token id per uppercased character
+        """
+        return array("B", word.upper().translate(self._ids).encode("latin-1"))
+
+    def spell_many(
+        self,
+        words: Iterable[str],
+        *,
+        output: Literal["tuples", "strings", "compact", "flat"] = "tuples",
+    ) -> Union[
+        List[List[tuple[str, str]]], List[str], List[CompactSpelling], FlatSpelling
+    ]:
+        """
+        Spell every word of an iterable in one call.
+
+        Args:
+            words: The words to spell out
+            output: ``"tuples"`` for a list of :meth:`spell` results,
+                ``"strings"`` for a list of :meth:`spell_string` results,
+                ``"compact"`` for a list of :meth:`spell_compact` results, or
+                ``"flat"`` for a single :class:`FlatSpelling`
+
+        Returns:
+            The spellings in input order, shaped according to ``output``
+        """
+        upper = str.upper
+        if output == "tuples":
+            pairs = self._pairs
+            return [[pairs[char] for char in upper(word)] for word in words]
+        if output == "strings":
+            lookup = self._words.__getitem__
+            return [" ".join(map(lookup, upper(word))) for word in words]
+        if output == "compact":
+            return list(map(self.spell_compact, words))
+        if output == "flat":
+            return self.spell_flat(words)
+        raise ValueError(
+            f"Unknown output {output!r}. Valid outputs: {', '.join(OUTPUTS)}"
+        )
+
+    def spell_flat(self, words: Iterable[str]) -> FlatSpelling:
+        """
+        Spell every word into one :class:`FlatSpelling`.
+
+        The same as ``spell_many(words, output="flat")``, typed for callers
+        that need the flat result.
+
+        Args:
+            words: The words to spell out
+
+        Returns:
+            The spellings in input order
+        """
+        uppered = list(map(str.upper, words))
+        text = "".join(uppered)
+        return FlatSpelling(
+            text=text,
+            offsets=array("Q", accumulate(map(len, uppered), initial=0)),
+            ids=array("B", text.translate(self._ids).encode("latin-1")),
+            vocabulary=self.vocabulary,
+        )
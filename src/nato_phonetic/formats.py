@@ -0,0 +1,123 @@
+"""Plain-text and machine-readable renderings of spelled text.
+
+json and csv are imported by the formatters that need them, keeping the
+default plain output free of their import cost.
+"""
+
+from typing import Callable, Dict, Iterable, List, TextIO
+
+from .encoder import CompactSpelling
+
+STREAM_FORMATS = ("plain", "tsv", "jsonl")
+WORD_FORMATS = ("plain", "tsv", "json", "csv")
+
+# Input may itself contain tabs or newlines; escape them so every record
+# stays on one line with exactly one field separator.
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _plain(line: str, spelling: CompactSpelling) -> str:
+    return spelling.to_string()
+
+
+def _tsv(line: str, spelling: CompactSpelling) -> str:
+    return f"{line.translate(_TSV_ESCAPES)}\t{spelling.to_string()}"
+
+
+def _jsonl(line: str, spelling: CompactSpelling) -> str:
+    import json
+
+    return json.dumps({"input": line, "spelling": spelling.words()}, ensure_ascii=False)
+
+
+_RECORD_FORMATTERS: Dict[str, Callable[[str, CompactSpelling], str]] = {
+    "plain": _plain,
+    "tsv": _tsv,
+    "jsonl": _jsonl,
+}
+
+
+def write_records(
+    records: Iterable[tuple[str, CompactSpelling]],
+    out: TextIO,
+    fmt: str = "plain",
+) -> int:
+    """
+    Write one output line per ``(line, spelling)`` record.
+
+    Args:
+        records: Pairs as produced by ``core.spell_lines``
+        out: Text stream to write to
+        fmt: One of :data:`STREAM_FORMATS`
+
+    Returns:
+        The number of records written
+    """
+    try:
+        formatter = _RECORD_FORMATTERS[fmt]
+    except KeyError:
+        valid = ", ".join(STREAM_FORMATS)
+        raise ValueError(f"Unknown format {fmt!r}. Valid formats: {valid}") from None
+    count = 0
+    write = out.write
+    for line, spelling in records:
+        write(formatter(line, spelling))
+        write("\n")
+        count += 1
+    return count
+
+
+def _word_plain(word: str, pairs: List[tuple[str, str]]) -> str:
+    return " ".join(phonetic for _, phonetic in pairs) + "\n"
+
+
+def _word_tsv(word: str, pairs: List[tuple[str, str]]) -> str:
+    return "".join(
+        f"{letter.translate(_TSV_ESCAPES)}\t{phonetic}\n" for letter, phonetic in pairs
+    )
+
+
+def _word_json(word: str, pairs: List[tuple[str, str]]) -> str:
+    import json
+
+    spelling = [{"letter": letter, "phonetic": phonetic} for letter, phonetic in pairs]
+    return json.dumps({"word": word, "spelling": spelling}, ensure_ascii=False) + "\n"
+
+
+def _word_csv(word: str, pairs: List[tuple[str, str]]) -> str:
+    import csv
+    import io
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(("letter", "phonetic"))
+    writer.writerows(pairs)
+    return buffer.getvalue()
+
+
+_WORD_FORMATTERS: Dict[str, Callable[[str, List[tuple[str, str]]], str]] = {
+    "plain": _word_plain,
+    "tsv": _word_tsv,
+    "json": _word_json,
+    "csv": _word_csv,
+}
+
+
+def render_word(word: str, pairs: List[tuple[str, str]], fmt: str = "plain") -> str:
+    """
+    Render a single spelled word without any Rich objects.
+
+    Args:
+        word: The word as the user typed it
+        pairs: ``(letter, phonetic)`` pairs as returned by ``spell_word``
+        fmt: One of :data:`WORD_FORMATS`
+
+    Returns:
+        The complete output, ending in a newline
+    """
+    try:
+        formatter = _WORD_FORMATTERS[fmt]
+    except KeyError:
+        valid = ", ".join(WORD_FORMATS)
+        raise ValueError(f"Unknown format {fmt!r}. Valid formats: {valid}") from None
+    return formatter(word, pairs)
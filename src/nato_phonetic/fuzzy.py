@@ -0,0 +1,99 @@
+"""Approximate word matching over a small fixed vocabulary."""
+
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Set
+
+# Resolved terms are cached per index; ASR output repeats the same
+# near-misses constantly, so most lookups never reach the edit distance.
+_CACHE_SIZE = 4096
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Return the optimal string alignment distance between two strings.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each cost one.
+    """
+    if a == b:
+        return 0
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = ca != cb
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                value = min(value, previous2[j - 2] + 1)
+            current.append(value)
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _deletions(word: str, depth: int) -> Set[str]:
+    """Return ``word`` and every string made by deleting up to ``depth`` chars."""
+    result = {word}
+    for count in range(1, min(depth, len(word)) + 1):
+        for drop in combinations(range(len(word)), count):
+            result.add("".join(c for i, c in enumerate(word) if i not in drop))
+    return result
+
+
+class FuzzyIndex:
+    """
+    Deletion-neighbourhood index for near-miss lookups.
+
+    Every vocabulary word is stored under each string reachable by deleting
+    up to ``max_distance`` characters. A query generates its own deletions
+    and only the words sharing one of them are scored with
+    :func:`edit_distance`, so a lookup never compares against the whole
+    vocabulary.
+
+    Args:
+        words: The vocabulary, already normalised
+        max_distance: Largest edit distance a match may have
+    """
+
+    def __init__(self, words: Iterable[str], max_distance: int = 2) -> None:
+        self.max_distance = max_distance
+        self.words = frozenset(words)
+        self._longest = max(map(len, self.words), default=0)
+        self._neighbours: Dict[str, List[str]] = {}
+        for word in sorted(self.words):
+            for key in _deletions(word, max_distance):
+                self._neighbours.setdefault(key, []).append(word)
+        self.lookup = lru_cache(maxsize=_CACHE_SIZE)(self._lookup)
+
+    def budget(self, term: str) -> int:
+        """Return the edit distance allowed for ``term``; short words get less."""
+        return min(self.max_distance, 1 if len(term) <= 4 else 2)
+
+    def _lookup(self, term: str) -> Optional[tuple[str, int]]:
+        """
+        Find the closest vocabulary word to ``term``.
+
+        Returns:
+            ``(word, distance)`` or None when nothing is within budget
+        """
+        if term in self.words:
+            return term, 0
+        limit = self.budget(term)
+        # Deleting down to the longest word would already exceed the budget,
+        # and the neighbourhood grows as len(term) ** limit.
+        if len(term) > self._longest + limit:
+            return None
+        best: Optional[tuple[int, str]] = None
+        seen: Set[str] = set()
+        for key in _deletions(term, limit):
+            for word in self._neighbours.get(key, ()):
+                if word in seen:
+                    continue
+                seen.add(word)
+                distance = edit_distance(term, word)
+                if distance <= limit and (best is None or (distance, word) < best):
+                    best = (distance, word)
+        if best is None:
+            return None
+        return best[1], best[0]
@@ -0,0 +1,352 @@
+"""Minimal asyncio HTTP/1.1 service for spelling and decoding.
+
+Standard library only. Endpoints:
+
+- ``GET /spell?text=...`` (or ``POST /spell`` with the text as the body)
+- ``GET /decode?text=...&fuzzy=1&errors=replace`` (or ``POST /decode``)
+- ``GET /alphabet``
+
+Every endpoint takes an optional ``alphabet`` parameter (default ``nato``).
+Responses are JSON unless ``format=plain`` is given or the ``Accept``
+header prefers ``text/plain``. Connections are kept alive, and spell
+requests that arrive together are spelled in one ``spell_many`` call.
+Request bodies need a ``Content-Length``; chunked uploads are answered
+with 501.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from .alphabets import DEFAULT_ALPHABET, get_alphabet
+from .core import get_full_alphabet, spell_many
+from .decoder import ERRORS as DECODE_ERRORS, DecodeError, decode
+from .encoder import CompactSpelling
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+MAX_BATCH = 512
+_MAX_HEADER = 16 * 1024
+_MAX_BODY = 1024 * 1024
+
+_CONTENT_TYPES = {"json": "application/json", "plain": "text/plain"}
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    417: "Expectation Failed",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class Batcher:
+    """
+    Coalesce concurrent calls into a single batch call.
+
+    Each :meth:`submit` queues one item. The worker task takes whatever has
+    queued up by the time it runs (after yielding once to the event loop so
+    that other ready connections can add theirs) and calls ``func`` on the
+    whole batch.
+
+    Args:
+        func: Maps a list of items to a list of results of the same length
+        max_batch: Largest number of items passed to ``func`` at once
+    """
+
+    def __init__(
+        self, func: Callable[[List[Any]], List[Any]], max_batch: int = MAX_BATCH
+    ) -> None:
+        self.func = func
+        self.max_batch = max_batch
+        self.batches = 0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, item: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(0)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            self.batches += 1
+            try:
+                results = self.func([item for item, _ in batch])
+            except Exception as exc:  # noqa: BLE001 - reported to every waiter
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class PhoneticHTTPServer:
+    """
+    Serve ``/spell``, ``/decode`` and ``/alphabet`` over HTTP/1.1.
+
+    Args:
+        host: Interface to bind
+        port: TCP port to bind; 0 picks a free port
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        self.host = host
+        self.port = port
+        self.batcher: Optional[Batcher] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._alphabets: Dict[tuple[str, str], bytes] = {}
+
+    async def start(self) -> None:
+        self.batcher = Batcher(_spell_batch)
+        self.batcher.start()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=_MAX_HEADER
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self.batcher is not None:
+            await self.batcher.stop()
+
+    async def serve_forever(
+        self, ready: Optional[Callable[["PhoneticHTTPServer"], Any]] = None
+    ) -> None:
+        """Start, call ``ready(self)`` once listening, and serve until cancelled."""
+        await self.start()
+        assert self._server is not None
+        try:
+            if ready is not None:
+                ready(self)
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.LimitOverrunError:
+                    writer.write(_response(413, b"Header too large\n", "text/plain", False))
+                    return
+                keep_alive = await self._handle_request(head, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self,
+        head: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> bool:
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = request_line.split(" ", 2)
+        except ValueError:
+            writer.write(_response(400, b"Malformed request line\n", "text/plain", False))
+            return False
+        headers: Dict[str, str] = {}
+        for line in header_lines:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (
+            version == "HTTP/1.1" or connection == "keep-alive"
+        )
+
+        body = b""
+        if headers.get("transfer-encoding", "identity").lower() != "identity":
+            # The body framing is unknown, so the connection cannot be reused.
+            message = b"Transfer-Encoding is not supported; send Content-Length\n"
+            writer.write(_response(501, message, "text/plain", False))
+            return False
+        value = headers.get("content-length") or "0"
+        # int() would accept "-5", "+5" and " 5"; only plain digits frame a body.
+        if not value.isdigit() or not value.isascii():
+            writer.write(_response(400, b"Bad Content-Length\n", "text/plain", False))
+            return False
+        length = int(value)
+        if length > _MAX_BODY:
+            writer.write(_response(413, b"Body too large\n", "text/plain", False))
+            return False
+        expect = headers.get("expect", "").lower()
+        if expect:
+            if expect != "100-continue":
+                writer.write(_response(417, b"Unsupported Expect\n", "text/plain", False))
+                return False
+            if length:
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+        if length:
+            body = await reader.readexactly(length)
+
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        fmt = query.get("format") or _preferred_format(headers.get("accept", ""))
+        try:
+            if fmt not in _CONTENT_TYPES:
+                fmt = "json"
+                raise _HTTPError(400, "format must be 'json' or 'plain'")
+            if method not in ("GET", "POST"):
+                raise _HTTPError(405, f"Method {method} not allowed")
+            payload, content_type = await self._dispatch(url.path, query, body, fmt)
+            status = 200
+        except Exception as exc:  # noqa: BLE001 - answered with a 500
+            if not isinstance(exc, _HTTPError):
+                exc = _HTTPError(500, "Internal server error")
+            status = exc.status
+            if fmt == "plain":
+                payload, content_type = f"{exc}\n".encode(), "text/plain"
+            else:
+                payload, content_type = _json_bytes({"error": str(exc)}), "application/json"
+        writer.write(_response(status, payload, content_type, keep_alive))
+        return keep_alive
+
+    async def _dispatch(
+        self, path: str, query: Dict[str, str], body: bytes, fmt: str
+    ) -> tuple[bytes, str]:
+        if path not in ("/spell", "/decode", "/alphabet"):
+            raise _HTTPError(404, f"No endpoint at {path}")
+        try:
+            alphabet = get_alphabet(query.get("alphabet") or DEFAULT_ALPHABET).name
+        except ValueError as exc:
+            raise _HTTPError(400, str(exc)) from None
+        if path == "/alphabet":
+            return self._alphabet_body(alphabet, fmt), _CONTENT_TYPES[fmt]
+        try:
+            text = body.decode() if body else query.get("text")
+        except UnicodeDecodeError:
+            raise _HTTPError(400, "Request body must be UTF-8") from None
+        if text is None:
+            raise _HTTPError(400, "Missing 'text' query parameter or request body")
+
+        if path == "/spell":
+            assert self.batcher is not None
+            spelling = await self.batcher.submit((text, alphabet))
+            if fmt == "plain":
+                return f"{spelling.to_string()}\n".encode(), "text/plain"
+            return _json_bytes({"text": text, "spelling": spelling.words()}), "application/json"
+
+        errors = query.get("errors", "strict")
+        if errors not in DECODE_ERRORS:
+            raise _HTTPError(400, f"Unknown errors mode {errors!r}")
+        fuzzy = query.get("fuzzy", "") not in ("", "0", "false")
+        run = partial(decode, text, errors, fuzzy=fuzzy, alphabet=alphabet)  # type: ignore[arg-type]
+        try:
+            if fuzzy:
+                # Fuzzy matching costs far more per token; keep it off the loop
+                # so one large body does not stall every other connection.
+                decoded = await asyncio.get_running_loop().run_in_executor(None, run)
+            else:
+                decoded = run()
+        except DecodeError as exc:
+            raise _HTTPError(400, str(exc)) from None
+        if fmt == "plain":
+            return f"{decoded}\n".encode(), "text/plain"
+        return _json_bytes({"text": text, "decoded": decoded}), "application/json"
+
+    def _alphabet_body(self, alphabet: str, fmt: str) -> bytes:
+        body = self._alphabets.get((alphabet, fmt))
+        if body is None:
+            letters = get_full_alphabet(alphabet)
+            if fmt == "plain":
+                body = "".join(f"{k}\t{v}\n" for k, v in letters.items()).encode()
+            else:
+                body = _json_bytes(letters)
+            self._alphabets[alphabet, fmt] = body
+        return body
+
+
+def _spell_batch(items: List[tuple[str, str]]) -> List[CompactSpelling]:
+    """Spell ``(text, alphabet)`` pairs with one ``spell_many`` call per alphabet."""
+    alphabets = {alphabet for _, alphabet in items}
+    if len(alphabets) == 1:
+        return spell_many(  # type: ignore[return-value]
+            [text for text, _ in items], output="compact", alphabet=alphabets.pop()
+        )
+    results: List[Any] = [None] * len(items)
+    for alphabet in alphabets:
+        indexes = [i for i, (_, a) in enumerate(items) if a == alphabet]
+        spelled = spell_many([items[i][0] for i in indexes], output="compact", alphabet=alphabet)
+        for i, spelling in zip(indexes, spelled):
+            results[i] = spelling
+    return results
+
+
+def _preferred_format(accept: str) -> str:
+    if "text/plain" in accept and "application/json" not in accept:
+        return "plain"
+    return "json"
+
+
+def _json_bytes(value: object) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode() + b"\n"
+
+
+def _response(status: int, payload: bytes, content_type: str, keep_alive: bool) -> bytes:
+    return (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        f"Content-Type: {content_type}; charset=utf-8\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    ).encode() + payload
+
+
+def run(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    ready: Optional[Callable[[PhoneticHTTPServer], Any]] = None,
+) -> None:
+    """
+    Run the HTTP service until interrupted.
+
+    Args:
+        host: Interface to bind
+        port: TCP port to bind
+        ready: Optional callback invoked with the server once it is listening
+    """
+    asyncio.run(PhoneticHTTPServer(host, port).serve_forever(ready))
@@ -0,0 +1,162 @@
+"""Spread spelling of large inputs across worker processes.
+
+Workers receive plain lists of strings and send back either a
+:class:`~nato_phonetic.encoder.FlatSpelling` (whose arrays pickle as raw
+bytes) or preformatted output text, never lists of tuples. Results are
+always returned in input order.
+
+The alphabet's definition is sent to each worker once, in the pool
+initializer, so alphabets registered at runtime work under every start
+method (``spawn`` workers do not inherit the parent's registry).
+"""
+
+from __future__ import annotations
+
+import io
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.context import BaseContext
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from .alphabets import (
+    DEFAULT_ALPHABET,
+    Alphabet,
+    get_alphabet,
+    get_encoder,
+    register_alphabet,
+)
+from .encoder import FlatSpelling
+
+# Shards per worker: enough to even out uneven inputs without paying the
+# per-task pickling overhead too many times.
+_SHARDS_PER_WORKER = 4
+
+
+def _install_alphabet(definition: Alphabet) -> None:
+    """Pool initializer: make ``definition`` available under its name."""
+    try:
+        current = get_alphabet(definition.name)
+    except ValueError:
+        current = None
+    if current != definition:
+        register_alphabet(
+            definition.name,
+            definition.letters,
+            title=definition.title,
+            variants=definition.variants,
+            symbols=definition.symbols,
+            replace=True,
+        )
+
+
+def _pool(
+    workers: int, alphabet: str, mp_context: Optional[BaseContext]
+) -> tuple[ProcessPoolExecutor, str]:
+    definition = get_alphabet(alphabet)
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_install_alphabet,
+        initargs=(definition,),
+    )
+    return pool, definition.name
+
+
+def _spell_shard(words: List[str], alphabet: str) -> FlatSpelling:
+    return get_encoder(alphabet).spell_flat(words)
+
+
+def _format_shard(
+    lines: List[str], fmt: str, alphabet: str, transliterate: bool
+) -> str:
+    from .core import spell_lines
+    from .formats import write_records
+
+    out = io.StringIO()
+    records = spell_lines(
+        lines,
+        batch_size=len(lines) or 1,
+        alphabet=alphabet,
+        transliterate=transliterate,
+    )
+    write_records(records, out, fmt)
+    return out.getvalue()
+
+
+def _shards(words: Sequence[str], count: int) -> List[Sequence[str]]:
+    size = max(1, -(-len(words) // count))
+    return [words[i:i + size] for i in range(0, len(words), size)]
+
+
+def spell_many_flat(
+    words: Iterable[str],
+    workers: int,
+    alphabet: str = DEFAULT_ALPHABET,
+    *,
+    mp_context: Optional[BaseContext] = None,
+) -> FlatSpelling:
+    """
+    Spell ``words`` in ``workers`` processes into one :class:`FlatSpelling`.
+
+    Args:
+        words: The words to spell out
+        workers: Number of worker processes
+        alphabet: Name of a registered alphabet
+        mp_context: Multiprocessing context for the pool (default: the
+            platform's start method)
+
+    Returns:
+        The combined spelling, in input order
+    """
+    words = list(words)
+    shards = _shards(words, workers * _SHARDS_PER_WORKER)
+    if len(shards) <= 1:
+        return _spell_shard(words, alphabet)
+    pool, name = _pool(workers, alphabet, mp_context)
+    with pool:
+        return FlatSpelling.concat(pool.map(_spell_shard, shards, [name] * len(shards)))
+
+
+def format_lines(
+    lines: Iterable[str],
+    fmt: str,
+    workers: int,
+    *,
+    batch_size: int = 4096,
+    alphabet: str = DEFAULT_ALPHABET,
+    transliterate: bool = False,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[str]:
+    """
+    Spell and format ``lines`` in worker processes, yielding output blocks.
+
+    At most ``2 * workers`` batches are in flight, so memory stays bounded
+    however long ``lines`` is.
+
+    Args:
+        lines: Input lines, e.g. an open file
+        fmt: One of ``formats.STREAM_FORMATS``
+        workers: Number of worker processes
+        batch_size: Lines handed to a worker at a time
+        alphabet: Name of a registered alphabet
+        transliterate: Romanize accented and non-Latin characters first
+        mp_context: Multiprocessing context for the pool (default: the
+            platform's start method)
+
+    Yields:
+        Formatted text for consecutive batches, in input order
+    """
+    iterator = iter(lines)
+    pending: deque[Future[str]] = deque()
+    pool, name = _pool(workers, alphabet, mp_context)
+    with pool:
+        while True:
+            while len(pending) < 2 * workers:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+                pending.append(pool.submit(_format_shard, batch, fmt, name, transliterate))
+            if not pending:
+                return
+            yield pending.popleft().result()
@@ -0,0 +1,200 @@
+"""Romanize accented and non-Latin text before spelling.
+
+Characters are converted one codepoint at a time: German and Scandinavian
+letters are expanded (``"Ä"`` -> ``"AE"``, ``"Ø"`` -> ``"OE"``), Cyrillic and
+Greek are romanized, and anything else is NFKD-decomposed with its
+combining marks dropped (``"É"`` -> ``"E"``, ``"ﬁ"`` -> ``"fi"``). Characters
+with no Latin form are left as they are.
+
+Conversions are memoised in a bounded LRU cache, and each
+:class:`Transliterator` keeps a bounded ``str.translate`` table on top of
+it, so text in a handful of scripts is converted at ``str.translate`` speed.
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable
+
+# Upper bound on distinct codepoints remembered by the shared cache and by
+# each transliterator's translate table.
+CACHE_SIZE = 4096
+
+_LATIN: Dict[str, str] = {
+    "Ä": "AE",
+    "Ö": "OE",
+    "Ü": "UE",
+    "ẞ": "SS",
+    "ß": "ss",
+    "Æ": "AE",
+    "Ø": "OE",
+    "Å": "AA",
+    "Œ": "OE",
+    "Þ": "TH",
+    "Ð": "D",
+    "Đ": "D",
+    "Ł": "L",
+    "Ħ": "H",
+    "ı": "i",
+}
+
+_CYRILLIC: Dict[str, str] = {
+    "А": "A",
+    "Б": "B",
+    "В": "V",
+    "Г": "G",
+    "Ґ": "G",
+    "Д": "D",
+    "Е": "E",
+    "Ё": "YO",
+    "Є": "YE",
+    "Ж": "ZH",
+    "З": "Z",
+    "И": "I",
+    "І": "I",
+    "Ї": "YI",
+    "Й": "Y",
+    "К": "K",
+    "Л": "L",
+    "М": "M",
+    "Н": "N",
+    "О": "O",
+    "П": "P",
+    "Р": "R",
+    "С": "S",
+    "Т": "T",
+    "У": "U",
+    "Ў": "U",
+    "Ф": "F",
+    "Х": "KH",
+    "Ц": "TS",
+    "Ч": "CH",
+    "Ш": "SH",
+    "Щ": "SHCH",
+    "Ъ": "",
+    "Ы": "Y",
+    "Ь": "",
+    "Э": "E",
+    "Ю": "YU",
+    "Я": "YA",
+}
+
+_GREEK: Dict[str, str] = {
+    "Α": "A",
+    "Β": "V",
+    "Γ": "G",
+    "Δ": "D",
+    "Ε": "E",
+    "Ζ": "Z",
+    "Η": "I",
+    "Θ": "TH",
+    "Ι": "I",
+    "Κ": "K",
+    "Λ": "L",
+    "Μ": "M",
+    "Ν": "N",
+    "Ξ": "X",
+    "Ο": "O",
+    "Π": "P",
+    "Ρ": "R",
+    "Σ": "S",
+    "Τ": "T",
+    "Υ": "Y",
+    "Φ": "F",
+    "Χ": "CH",
+    "Ψ": "PS",
+    "Ω": "O",
+}
+
+
+def _build_expansions() -> Dict[str, str]:
+    expansions = {"ς": "s"}
+    for table in (_LATIN, _CYRILLIC, _GREEK):
+        for char, latin in table.items():
+            expansions.setdefault(char, latin)
+            # Lowercase letters get lowercase output: "ж" -> "zh", "ä" -> "ae".
+            expansions.setdefault(char.lower(), latin.lower())
+    return expansions
+
+
+_EXPANSIONS = _build_expansions()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def transliterate_char(char: str) -> str:
+    """
+    Return the Latin form of a single character.
+
+    Args:
+        char: A single character
+
+    Returns:
+        The romanized text (possibly several letters or empty), or ``char``
+        itself when it has no Latin form
+    """
+    if char.isascii():
+        return char
+    latin = _EXPANSIONS.get(char)
+    if latin is not None:
+        return latin
+    parts = []
+    for part in unicodedata.normalize("NFKD", char):
+        if unicodedata.combining(part):
+            continue
+        part = _EXPANSIONS.get(part, part)
+        if not part.isascii():
+            return char
+        parts.append(part)
+    return "".join(parts) or char
+
+
+class _TranslateTable(dict):
+    """``str.translate`` table filled from the LRU cache, cleared when full."""
+
+    def __init__(self, keep: Iterable[str]) -> None:
+        super().__init__()
+        self._keep = {ord(char): char for char in keep}
+        self.update(self._keep)
+
+    def __missing__(self, codepoint: int) -> str:
+        if len(self) >= CACHE_SIZE:
+            self.clear()
+            self.update(self._keep)
+        value = self[codepoint] = transliterate_char(chr(codepoint))
+        return value
+
+
+class Transliterator:
+    """
+    Romanize text, leaving characters an alphabet can already spell alone.
+
+    Args:
+        keep: Characters to pass through unchanged, e.g. the ``"Ä"`` of an
+            alphabet that has its own word for it; lowercase forms are kept
+            as well
+    """
+
+    def __init__(self, keep: Iterable[str] = ()) -> None:
+        chars = {char for key in keep for char in (key, key.lower()) if not char.isascii()}
+        self._table = _TranslateTable(chars)
+
+    def __call__(self, text: str) -> str:
+        if text.isascii():
+            return text
+        return text.translate(self._table)
+
+
+_DEFAULT = Transliterator()
+
+
+def transliterate(text: str) -> str:
+    """
+    Romanize accented and non-Latin characters in ``text``.
+
+    Args:
+        text: Any text, e.g. ``"Müller"`` or ``"Москва"``
+
+    Returns:
+        The text with every convertible character in Latin letters, e.g.
+        ``"Mueller"`` or ``"Moskva"``
+    """
+    return _DEFAULT(text)
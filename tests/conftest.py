@@ -0,0 +1,113 @@
+"""Shared fixtures."""
+
+import functools
+import hashlib
+import re
+import threading
+import urllib.parse
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from nato_phonetic import assets
+
+
+class _AssetServer:
+    """A local stand-in for ``RAW_BASE`` serving files from a directory."""
+
+    def __init__(self, root):
+        self.root = root
+        self.connections = 0
+        self.requests = []
+        self.ranges = True
+        server = self
+
+        class Handler(SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                server.connections += 1
+
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                path = root / urllib.parse.unquote(self.path.lstrip("/"))
+                if not path.is_file():
+                    super().do_GET()
+                    return
+                data = path.read_bytes()
+                etag = f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                start = 0
+                match = re.fullmatch(r"bytes=(\d+)-", self.headers.get("Range", ""))
+                if (
+                    server.ranges
+                    and match
+                    and self.headers.get("If-Range", etag) == etag
+                ):
+                    start = int(match.group(1))
+                    if start >= len(data):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(data)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+                    )
+                else:
+                    self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", self.date_time_string(path.stat().st_mtime))
+                self.send_header("Content-Length", str(len(data) - start))
+                self.end_headers()
+                self.wfile.write(data[start:])
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(
+            ("127.0.0.1", 0), functools.partial(Handler, directory=str(root))
+        )
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/"
+
+    def add(self, slug, payload):
+        path = self.root / assets.ASSETS[slug].filename
+        path.write_bytes(payload)
+        return path
+
+
+@pytest.fixture(autouse=True)
+def _cache_home(tmp_path, monkeypatch):
+    """Keep the download index out of the real user cache and ignore local asset settings."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(assets, "FALLBACK_BASE", None)
+    for name in (assets.MIRRORS_ENV, assets.OFFLINE_ENV, assets.ASSET_DIR_ENV):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def manifest(monkeypatch):
+    """The asset manifest, empty unless a test adds entries (keyed by filename)."""
+    entries = {}
+    monkeypatch.setattr(assets, "_manifest", lambda: entries)
+    return entries
+
+
+@pytest.fixture
+def asset_server(tmp_path, monkeypatch):
+    """Serve assets over HTTP from ``tmp_path / "remote"`` and point RAW_BASE at it."""
+    root = tmp_path / "remote"
+    root.mkdir()
+    server = _AssetServer(root)
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(assets, "RAW_BASE", server.url)
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
@@ -0,0 +1,89 @@
+"""Tests for the alphabet registry in nato_phonetic.alphabets."""
+
+import pytest
+
+from nato_phonetic import alphabets
+from nato_phonetic.alphabets import (
+    alphabet_names,
+    get_alphabet,
+    get_decoder,
+    get_encoder,
+    register_alphabet,
+)
+from nato_phonetic.core import get_full_alphabet, lookup_letter, spell_string, spell_word
+from nato_phonetic.decoder import decode
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Restore the registry and compiled tables after the test."""
+    for name in ("_REGISTRY", "_ALIASES", "_ENCODERS", "_DECODERS"):
+        monkeypatch.setattr(alphabets, name, dict(getattr(alphabets, name)))
+
+
+def test_builtin_alphabets():
+    assert alphabet_names() == ["nato", "icao", "lapd", "din5009"]
+    assert spell_string("AJ39", alphabet="icao") == "Alfa Juliett Tree Niner"
+    assert spell_string("Adam", alphabet="lapd") == "Adam David Adam Mary"
+    assert spell_string("Kö", alphabet="din5009") == "Köln Umlaut-Offenbach"
+
+
+def test_aliases_and_case_resolve_to_one_encoder():
+    assert get_alphabet("APCO").name == "lapd"
+    assert get_encoder("itu") is get_encoder("icao")
+    assert get_decoder("din") is get_decoder("din5009")
+
+
+def test_encoder_is_compiled_once():
+    assert get_encoder("lapd") is get_encoder("lapd")
+
+
+def test_unknown_alphabet():
+    with pytest.raises(ValueError, match="Valid alphabets: nato"):
+        spell_word("a", alphabet="klingon")
+
+
+@pytest.mark.parametrize("name", ["nato", "icao", "lapd", "din5009"])
+def test_round_trip(name):
+    text = "HÄLLO 123" if name == "din5009" else "HELLO 123"
+    assert decode(spell_string(text, alphabet=name), alphabet=name) == text
+
+
+def test_icao_decoder_accepts_nato_spellings():
+    assert decode("Alpha Alfa Nine Niner", alphabet="icao") == "AA99"
+
+
+def test_lookup_and_full_alphabet():
+    assert lookup_letter("w", alphabet="lapd") == "William"
+    assert get_full_alphabet("icao")["A"] == "Alfa"
+
+
+def test_register_custom_alphabet(registry):
+    register_alphabet("acme", {"a": "Anvil", "b": "Bomb"}, title="ACME", aliases=("wile",))
+    assert spell_word("ab!", alphabet="wile") == [("A", "Anvil"), ("B", "Bomb"), ("!", "Exclamation")]
+    assert decode("anvil bomb", alphabet="acme") == "AB"
+
+
+def test_symbols_are_configurable_per_alphabet(registry):
+    register_alphabet("plain", {"A": "Apple"}, symbols={})
+    register_alphabet("dotty", {"A": "Apple"}, symbols={".": "Stop"})
+    assert spell_string("a.", alphabet="plain") == "Apple Special"
+    assert spell_string("a.-", alphabet="dotty") == "Apple Stop Special"
+    assert spell_string("a.", alphabet="din5009") == "Aachen Punkt"
+    assert decode("Apple Stop", alphabet="dotty") == "A."
+    with pytest.raises(ValueError, match="Invalid symbol entry"):
+        register_alphabet("bad", {"A": "Apple"}, symbols={"x": "Ex"})
+
+
+def test_register_rejects_duplicates_and_bad_keys(registry):
+    with pytest.raises(ValueError, match="already registered"):
+        register_alphabet("nato", {"A": "Apple"})
+    with pytest.raises(ValueError, match="Invalid alphabet entry"):
+        register_alphabet("bad", {"AB": "Apple"})
+
+
+def test_replace_invalidates_compiled_tables(registry):
+    old = get_encoder("lapd")
+    register_alphabet("lapd", {"A": "Apple"}, replace=True)
+    assert get_encoder("lapd") is not old
+    assert spell_string("A", alphabet="lapd") == "Apple"
@@ -1,6 +1,7 @@
 """Tests for the downloadable-assets module."""
 
 from pathlib import Path
+from urllib.parse import quote
 from unittest.mock import patch
 
 import pytest
@@ -36,6 +37,12 @@ def test_asset_url_uses_codeberg_raw_and_encodes_spaces():
     assert " " not in url
 
 
+def test_release_base_pins_released_versions_to_their_tag():
+    assert assets.release_base("0.4.1") == assets.REPO_URL + "raw/tag/v0.4.1/"
+    assert assets.release_base("0.0.0+local").endswith("/raw/branch/main/")
+    assert assets.release_base("0.5.0.dev1+g1234").endswith("/raw/branch/main/")
+
+
 def test_asset_url_handles_parentheses():
     url = assets.asset_url("pdf-landscape")
     assert "%28" in url and "%29" in url, "parens must be URL-encoded"
@@ -83,3 +90,333 @@ def _fake_http_response(payload: bytes):
             return False
 
     return _Resp(payload)
+
+
+def _quiet_console():
+    from io import StringIO
+
+    from rich.console import Console
+
+    return Console(file=StringIO())
+
+
+def test_download_assets_fetches_all_over_shared_connections(asset_server, tmp_path):
+    payloads = {slug: slug.encode() * 50_000 for slug in assets.ASSETS}
+    for slug, payload in payloads.items():
+        asset_server.add(slug, payload)
+    dest = tmp_path / "out"
+
+    paths = assets.download_assets(assets.ASSETS, dest, console=_quiet_console(), workers=2)
+
+    assert [p.name for p in paths] == [a.filename for a in assets.ASSETS.values()]
+    for slug, path in zip(assets.ASSETS, paths):
+        assert path.read_bytes() == payloads[slug]
+    assert len(asset_server.requests) == 4
+    assert asset_server.connections <= 2
+
+
+def test_download_assets_reuses_and_reports_failures(asset_server, tmp_path):
+    asset_server.add("pdf", b"remote")
+    (tmp_path / assets.ASSETS["epub"].filename).write_bytes(b"local")
+
+    with pytest.raises(assets.AssetError) as excinfo:
+        assets.download_assets(["pdf", "epub", "docx"], tmp_path, console=_quiet_console())
+
+    assert "docx" in str(excinfo.value).lower() and "404" in str(excinfo.value)
+    assert (tmp_path / assets.ASSETS["pdf"].filename).read_bytes() == b"remote"
+    assert (tmp_path / assets.ASSETS["epub"].filename).read_bytes() == b"local"
+    assert not (tmp_path / assets.ASSETS["docx"].filename).exists()
+
+
+def test_connection_pool_follows_redirects_and_reuses(asset_server):
+    asset_server.add("pdf", b"pdf bytes")
+    url = assets.asset_url("pdf")
+    with assets.ConnectionPool() as pool:
+        for _ in range(3):
+            with pool.open(url) as response:
+                assert response.read() == b"pdf bytes"
+        # SimpleHTTPRequestHandler redirects "/sub" to "/sub/".
+        (asset_server.root / "sub").mkdir()
+        with pool.open(asset_server.url + "sub") as response:
+            response.read()
+            assert response.status == 200
+    assert [path for path, _ in asset_server.requests][-2:] == ["/sub", "/sub/"]
+    assert pool.connections_opened == 1
+
+
+def _part(dest_dir, slug):
+    return dest_dir / (assets.ASSETS[slug].filename + assets.PART_SUFFIX)
+
+
+def test_interrupted_download_keeps_partial_and_leaves_dest_alone(tmp_path):
+    target = tmp_path / assets.ASSETS["pdf"].filename
+
+    class _Broken:
+        status = 200
+        headers = {"Content-Length": "10", "ETag": '"v1"'}
+        _chunks = [b"hello", ConnectionResetError("reset")]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_):
+            return False
+
+        def read(self, _size):
+            chunk = self._chunks.pop(0)
+            if isinstance(chunk, Exception):
+                raise chunk
+            return chunk
+
+    with patch("nato_phonetic.assets.urllib.request.urlopen", return_value=_Broken()):
+        with pytest.raises(assets.AssetError, match="reset"):
+            assets.download_asset("pdf", tmp_path, console=_quiet_console())
+
+    assert not target.exists()
+    assert _part(tmp_path, "pdf").read_bytes() == b"hello"
+
+
+def test_download_resumes_from_partial_file(asset_server, tmp_path):
+    payload = b"0123456789" * 10_000
+    asset_server.add("pdf", payload)
+    with assets.ConnectionPool() as pool:
+        with pool.open(assets.asset_url("pdf")) as response:
+            etag = response.headers["ETag"]
+            response.read()
+    part = _part(tmp_path, "pdf")
+    part.write_bytes(payload[:4000])
+    assets._index_set(part, {"validator": etag})
+
+    path = assets.download_asset("pdf", tmp_path, console=_quiet_console())
+
+    assert path.read_bytes() == payload
+    assert not part.exists()
+    headers = {k.lower(): v for k, v in asset_server.requests[-1][1].items()}
+    assert headers["range"] == "bytes=4000-" and headers["if-range"] == etag
+
+
+def test_download_restarts_when_server_ignores_range(asset_server, tmp_path):
+    payload = b"fresh" * 1000
+    asset_server.add("pdf", payload)
+    asset_server.ranges = False
+    part = _part(tmp_path, "pdf")
+    part.write_bytes(b"old partial bytes")
+    assets._index_set(part, {"validator": '"stale"'})
+
+    path = assets.download_asset("pdf", tmp_path, console=_quiet_console())
+
+    assert path.read_bytes() == payload
+    assert not part.exists()
+
+
+def test_corrupted_download_is_fetched_again(asset_server, tmp_path):
+    asset_server.add("pdf", b"remote bytes")
+    console = _quiet_console()
+    path = assets.download_asset("pdf", tmp_path, console=console)
+
+    path.write_bytes(b"remote bytez")
+    assets.download_asset("pdf", tmp_path, console=console)
+
+    assert path.read_bytes() == b"remote bytes"
+    assert "failed verification" in console.file.getvalue()
+    # The corrupted copy was not revalidated, just fetched again.
+    assert "If-None-Match" not in asset_server.requests[-1][1]
+
+
+def test_unchanged_download_is_revalidated_with_304(asset_server, tmp_path):
+    asset_server.add("pdf", b"remote bytes")
+    console = _quiet_console()
+    path = assets.download_asset("pdf", tmp_path, console=console)
+    mtime = path.stat().st_mtime_ns
+
+    assets.download_asset("pdf", tmp_path, console=console)
+
+    headers = {k.lower(): v for k, v in asset_server.requests[-1][1].items()}
+    assert "if-none-match" in headers and "if-modified-since" in headers
+    assert path.stat().st_mtime_ns == mtime
+    assert "Up to date" in console.file.getvalue()
+
+
+def test_changed_download_is_replaced_on_revalidation(asset_server, tmp_path):
+    asset_server.add("pdf", b"version one")
+    path = assets.download_asset("pdf", tmp_path, console=_quiet_console())
+    asset_server.add("pdf", b"version two")
+
+    paths = assets.download_assets(["pdf"], tmp_path, console=_quiet_console())
+
+    assert paths == [path]
+    assert path.read_bytes() == b"version two"
+
+
+def test_cached_download_is_kept_when_server_is_unreachable(asset_server, tmp_path, monkeypatch):
+    asset_server.add("pdf", b"remote bytes")
+    path = assets.download_asset("pdf", tmp_path, console=_quiet_console())
+    monkeypatch.setattr(assets, "RAW_BASE", "http://127.0.0.1:9/")
+    console = _quiet_console()
+
+    assert assets.download_asset("pdf", tmp_path, console=console) == path
+
+    assert path.read_bytes() == b"remote bytes"
+    assert "Could not check for updates" in console.file.getvalue()
+
+
+def test_revalidation_failure_keeps_cache_over_local_copies(asset_server, tmp_path, monkeypatch):
+    asset_server.add("pdf", b"remote bytes")
+    path = assets.download_asset("pdf", tmp_path, console=_quiet_console())
+    seeded = tmp_path / "seeded"
+    seeded.mkdir()
+    (seeded / assets.ASSETS["pdf"].filename).write_bytes(b"seeded copy")
+    monkeypatch.setenv(assets.ASSET_DIR_ENV, str(seeded))
+    monkeypatch.setattr(assets, "RAW_BASE", "http://127.0.0.1:9/")
+
+    assert assets.download_assets(["pdf"], tmp_path, console=_quiet_console()) == [path]
+    assert assets.download_asset("pdf", tmp_path, console=_quiet_console()) == path
+    assert path.read_bytes() == b"remote bytes"
+
+
+def test_stalled_mirror_times_out(monkeypatch):
+    seen = {}
+
+    def urlopen(request, timeout=None):
+        seen["timeout"] = timeout
+        raise TimeoutError("timed out")
+
+    monkeypatch.setattr(assets.urllib.request, "urlopen", urlopen)
+    with pytest.raises(TimeoutError):
+        assets._open("file:///nowhere", None)
+    assert seen["timeout"] == assets._TIMEOUT
+
+
+def _digest(payload):
+    import hashlib
+
+    return {"size": len(payload), "sha256": hashlib.sha256(payload).hexdigest()}
+
+
+def test_packaged_manifest_covers_every_asset():
+    import json
+    from importlib.resources import files
+
+    entries = json.loads(files("nato_phonetic").joinpath(assets.MANIFEST_NAME).read_text())
+    for asset in assets.ASSETS.values():
+        assert len(entries[asset.filename]["sha256"]) == 64
+
+
+def test_file_matching_manifest_is_reused_without_request(asset_server, tmp_path, manifest):
+    payload = b"published bytes"
+    manifest[assets.ASSETS["pdf"].filename] = _digest(payload)
+    (tmp_path / assets.ASSETS["pdf"].filename).write_bytes(payload)
+    (tmp_path / assets.ASSETS["epub"].filename).write_bytes(b"corrupted")
+    manifest[assets.ASSETS["epub"].filename] = _digest(b"epub bytes")
+    asset_server.add("epub", b"epub bytes")
+
+    assets.download_assets(["pdf", "epub"], tmp_path, console=_quiet_console())
+
+    assert [path for path, _ in asset_server.requests] == ["/" + quote(assets.ASSETS["epub"].filename)]
+    assert (tmp_path / assets.ASSETS["epub"].filename).read_bytes() == b"epub bytes"
+
+
+def test_download_not_matching_manifest_is_rejected(asset_server, tmp_path, manifest):
+    manifest[assets.ASSETS["pdf"].filename] = _digest(b"published bytes")
+    asset_server.add("pdf", b"tampered bytes!")
+
+    with pytest.raises(assets.AssetError, match="Checksum mismatch"):
+        assets.download_asset("pdf", tmp_path, console=_quiet_console())
+
+    assert not (tmp_path / assets.ASSETS["pdf"].filename).exists()
+    assert not _part(tmp_path, "pdf").exists()
+
+
+def test_manifest_drift_keeps_verified_copy_and_rejects_drifted_download(
+    asset_server, tmp_path, manifest
+):
+    released = b"released bytes"
+    manifest[assets.ASSETS["pdf"].filename] = _digest(released)
+    asset_server.add("pdf", b"bytes changed after the release")
+    kept = tmp_path / "kept"
+    kept.mkdir()
+    (kept / assets.ASSETS["pdf"].filename).write_bytes(released)
+
+    assert assets.download_asset("pdf", kept, console=_quiet_console()).read_bytes() == released
+    assert asset_server.requests == []
+    with pytest.raises(assets.AssetError, match="manifest is out of date"):
+        assets.download_asset("pdf", tmp_path / "fresh", console=_quiet_console())
+
+
+def test_stale_or_missing_release_tag_falls_back_to_main(
+    asset_server, tmp_path, manifest, monkeypatch
+):
+    rebuilt = b"rebuilt without a version bump"
+    manifest[assets.ASSETS["pdf"].filename] = _digest(rebuilt)
+    manifest[assets.ASSETS["epub"].filename] = _digest(b"epub bytes")
+    (asset_server.root / "tag").mkdir()
+    (asset_server.root / "tag" / assets.ASSETS["pdf"].filename).write_bytes(b"tagged")
+    asset_server.add("pdf", rebuilt)
+    asset_server.add("epub", b"epub bytes")
+    monkeypatch.setattr(assets, "RAW_BASE", asset_server.url + "tag/")
+    monkeypatch.setattr(assets, "FALLBACK_BASE", asset_server.url)
+
+    paths = assets.download_assets(["pdf", "epub"], tmp_path, console=_quiet_console())
+
+    assert [path.read_bytes() for path in paths] == [rebuilt, b"epub bytes"]
+
+
+_DEAD = "http://127.0.0.1:9/"
+
+
+def test_configured_mirrors_order_and_local_directories(tmp_path, monkeypatch):
+    monkeypatch.setenv(assets.MIRRORS_ENV, "https://a.example/assets, https://b.example/")
+
+    bases = assets.configured_mirrors([str(tmp_path)])
+
+    assert bases == [
+        tmp_path.as_uri() + "/",
+        "https://a.example/assets/",
+        "https://b.example/",
+        assets.RAW_BASE,
+    ]
+
+
+def test_rank_puts_responding_mirror_first(tmp_path):
+    (tmp_path / assets.ASSETS["pdf"].filename).write_bytes(b"pdf")
+    local = tmp_path.as_uri() + "/"
+
+    assert assets._rank([_DEAD, local], assets.ASSETS["pdf"]) == [local, _DEAD]
+
+
+def test_download_fails_over_to_next_mirror(asset_server, tmp_path, monkeypatch):
+    asset_server.add("pdf", b"from the origin")
+    monkeypatch.setattr(assets, "_rank", lambda bases, asset: list(bases))
+
+    path = assets.download_asset("pdf", tmp_path / "out", console=_quiet_console(), mirrors=[_DEAD])
+
+    assert path.read_bytes() == b"from the origin"
+
+
+def test_download_falls_back_to_seeded_directory(asset_server, tmp_path, monkeypatch):
+    seeded = tmp_path / "seeded"
+    seeded.mkdir()
+    (seeded / assets.ASSETS["pdf"].filename).write_bytes(b"seeded copy")
+    monkeypatch.setenv(assets.ASSET_DIR_ENV, str(seeded))
+
+    path = assets.download_asset("pdf", tmp_path / "out", console=_quiet_console())
+
+    assert path.read_bytes() == b"seeded copy"
+    assert [p for p, _ in asset_server.requests] == ["/" + quote(assets.ASSETS["pdf"].filename)]
+
+
+def test_offline_makes_no_network_calls(asset_server, tmp_path, monkeypatch):
+    seeded = tmp_path / "seeded"
+    seeded.mkdir()
+    for slug in ("pdf", "epub"):
+        (seeded / assets.ASSETS[slug].filename).write_bytes(slug.encode())
+    monkeypatch.setenv(assets.ASSET_DIR_ENV, str(seeded))
+    monkeypatch.setenv(assets.OFFLINE_ENV, "1")
+
+    paths = assets.download_assets(["pdf", "epub"], tmp_path / "out", console=_quiet_console())
+    assets.download_asset("pdf", tmp_path / "out", console=_quiet_console())
+
+    assert [p.read_bytes() for p in paths] == [b"pdf", b"epub"]
+    assert asset_server.requests == [] and asset_server.connections == 0
+    with pytest.raises(assets.AssetError, match="not available offline"):
+        assets.download_asset("docx", tmp_path / "out", console=_quiet_console())
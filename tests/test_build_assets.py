@@ -5,7 +5,9 @@ from pathlib import Path
 
 import pytest
 
-from scripts.build_assets import build_docx, build_epub, build_pdf
+from nato_phonetic import cards
+from scripts.build_assets import batch, build_docx, build_epub, build_pdf, graph
+from scripts.build_assets.sheet import Sheet
 
 
 def test_build_pdf_portrait_writes_valid_pdf(tmp_path: Path) -> None:
@@ -41,3 +43,162 @@ def test_build_epub_writes_valid_epub(tmp_path: Path) -> None:
         names = zf.namelist()
         assert "mimetype" in names
         assert zf.read("mimetype").strip() == b"application/epub+zip"
+
+
+def test_fingerprint_tracks_config_and_target(monkeypatch: pytest.MonkeyPatch) -> None:
+    portrait, landscape = graph.TARGETS[:2]
+    before = graph.fingerprint(portrait)
+    assert graph.fingerprint(portrait) == before
+    assert graph.fingerprint(landscape) != before
+
+    monkeypatch.setattr(graph.config, "TITLE", "Spelling Alphabet")
+    assert graph.fingerprint(portrait) != before
+
+
+def test_fingerprint_covers_the_package_card_layout() -> None:
+    # config and sheet import their layout from nato_phonetic.cards.
+    assert Path(cards.__file__) in graph._SHARED_SOURCES
+
+
+def test_incremental_build_skips_unchanged_targets(tmp_path: Path) -> None:
+    targets = [t for t in graph.TARGETS if t.module in ("docx", "pdf")]
+    state: dict = {}
+    stale = graph.stale_targets(tmp_path, state, targets)
+    assert [t for t, _ in stale] == targets
+
+    built = []
+    graph.build(stale, tmp_path, state, jobs=2, on_built=built.append)
+
+    assert built == [tmp_path / t.filename for t in targets]
+    assert graph.stale_targets(tmp_path, state, targets) == []
+    assert len(graph.stale_targets(tmp_path, state, targets, force=True)) == len(targets)
+
+    (tmp_path / targets[0].filename).write_bytes(b"edited by hand")
+    assert [t for t, _ in graph.stale_targets(tmp_path, state, targets)] == [targets[0]]
+
+
+def test_copy_zip_is_deterministic_single_pass(tmp_path: Path) -> None:
+    from scripts.build_assets._zip_util import copy_zip
+
+    source = tmp_path / "src.zip"
+    with zipfile.ZipFile(source, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("content.opf", b"<modified>now</modified>")
+        zf.writestr("mimetype", b"application/epub+zip")
+        zf.writestr("big.bin", b"x" * 300_000)
+
+    outputs = []
+    for name in ("a.zip", "b.zip"):
+        with source.open("rb") as fh:
+            copy_zip(fh, tmp_path / name, {".opf": lambda data: data.replace(b"now", b"then")})
+        outputs.append((tmp_path / name).read_bytes())
+
+    assert outputs[0] == outputs[1]
+    with zipfile.ZipFile(tmp_path / "a.zip") as zf:
+        infos = zf.infolist()
+        assert infos[0].filename == "mimetype"
+        assert infos[0].compress_type == zipfile.ZIP_STORED
+        assert {info.date_time for info in infos} == {(2024, 1, 1, 0, 0, 0)}
+        assert zf.read("content.opf") == b"<modified>then</modified>"
+        assert zf.read("big.bin") == b"x" * 300_000
+
+
+def test_build_epub_is_byte_deterministic(tmp_path: Path) -> None:
+    build_epub(tmp_path / "a.epub")
+    build_epub(tmp_path / "b.epub")
+    assert (tmp_path / "a.epub").read_bytes() == (tmp_path / "b.epub").read_bytes()
+
+
+def test_sheet_pairs_split_rows_into_two_columns() -> None:
+    sheet = Sheet(alphabet={"A": "Alpha", "B": "Bravo", "1": "One"}, extra_rows=(("Ch", "Channel"),))
+
+    assert sheet.rows() == [("A", "Alpha"), ("B", "Bravo"), ("Ch", "Channel")]
+    assert sheet.pairs() == [("A", "Alpha", "Ch", "Channel"), ("B", "Bravo", "", "")]
+    assert len(Sheet().pairs()) == 13
+
+
+def test_generate_writes_variants_to_zip_and_directory(tmp_path: Path) -> None:
+    variants = [
+        batch.Variant("blue", Sheet(title="Team <Blue>", extra_rows=(("Ch", "Channel 7"),))),
+        batch.Variant("red", Sheet(title="Team Red")),
+    ]
+
+    names: list[str] = []
+    count = batch.generate(
+        variants, tmp_path / "sheets.zip", formats=("pdf", "epub"), jobs=1, on_output=names.append
+    )
+
+    assert count == 4
+    assert names == ["blue.pdf", "blue.epub", "red.pdf", "red.epub"]
+    with zipfile.ZipFile(tmp_path / "sheets.zip") as zf:
+        assert zf.read("red.pdf")[:5] == b"%PDF-"
+        with zipfile.ZipFile(zf.open("blue.epub")) as book:
+            assert b"Team &lt;Blue&gt;" in book.read("EPUB/alphabet.xhtml")
+
+    assert batch.generate(variants, tmp_path / "out", formats=("docx",), jobs=2) == 2
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["blue.docx", "red.docx"]
+
+
+def test_card_formats_render_sheet_without_build_extra(tmp_path: Path) -> None:
+    from scripts.build_assets import build_svg
+
+    build_svg(tmp_path / "card.svg")
+    assert (tmp_path / "card.svg").read_text(encoding="utf-8").startswith("<svg ")
+
+    variants = [batch.Variant("blue", Sheet(title="Team Blue", extra_rows=(("Ch", "Channel 7"),)))]
+    assert batch.generate(variants, tmp_path / "out", formats=("html", "md"), jobs=1) == 2
+    assert "| Ch | Channel 7 |" in (tmp_path / "out" / "blue.md").read_text(encoding="utf-8")
+
+
+def test_variant_names_cannot_escape_output_directory() -> None:
+    with pytest.raises(ValueError):
+        batch.Variant("../evil", Sheet())
+
+
+def test_subset_font_keeps_only_used_glyphs_and_is_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from io import BytesIO
+
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    from scripts.build_assets import fonts
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    fonts._subset.cache_clear()
+
+    data = fonts.subset_font("Alpha Bravo")
+
+    assert len(data) < fonts.config.FONT_PATH.stat().st_size // 4
+    cmap = TTFont(BytesIO(data)).getBestCmap()
+    assert {ord(c) for c in "Alph Bravo"} <= set(cmap) and ord("Z") not in cmap
+    assert len(list((tmp_path / "phonetic" / "fonts").iterdir())) == 1
+
+    fonts._subset.cache_clear()
+    monkeypatch.setattr(subset, "Subsetter", None)  # a cache miss would fail
+    assert fonts.subset_font("Bravo Alpha") == data
+    fonts._subset.cache_clear()
+
+
+def test_subset_cache_key_covers_fonttools_version_and_options(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import fontTools
+
+    from scripts.build_assets import fonts
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = tmp_path / "phonetic" / "fonts"
+
+    def subset_once() -> None:
+        fonts._subset.cache_clear()
+        fonts.subset_font("Alpha")
+
+    subset_once()
+    monkeypatch.setattr(fontTools, "version", fontTools.version + ".post1")
+    subset_once()
+    monkeypatch.setattr(fonts, "_OPTIONS", {**fonts._OPTIONS, "notdef_outline": False})
+    subset_once()
+    fonts._subset.cache_clear()
+
+    assert len(list(cache.iterdir())) == 3
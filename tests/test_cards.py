@@ -0,0 +1,61 @@
+"""Tests for the stdlib HTML, SVG and Markdown reference cards."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+from click.testing import CliRunner
+
+from nato_phonetic.cards import FORMATS, TITLE, card_rows, render_card, split_columns
+from nato_phonetic.cli import main
+
+
+def test_card_rows_keep_letters_only() -> None:
+    rows = card_rows()
+    assert len(rows) == 26
+    assert rows[0] == ("A", "Alpha")
+    assert all(letter.isalpha() for letter, _ in rows)
+
+
+def test_split_columns_pads_the_right_column() -> None:
+    rows = [("A", "Alpha"), ("B", "Bravo"), ("C", "Charlie")]
+    assert split_columns(rows) == [("A", "Alpha", "C", "Charlie"), ("B", "Bravo", "", "")]
+
+
+def test_svg_card_is_well_formed_and_escaped() -> None:
+    svg = render_card("svg", title="Team <Blue> & Co")
+    root = ET.fromstring(svg)
+    texts = [el.text for el in root.iter("{http://www.w3.org/2000/svg}text")]
+    assert texts[0] == "Team <Blue> & Co"
+    assert "Zulu" in texts
+
+
+def test_html_and_markdown_cards() -> None:
+    html = render_card("html", "din5009", extra_rows=[("Ch", "Kanal|7")])
+    assert html.startswith("<!DOCTYPE html>")
+    assert "<title>DIN 5009 Phonetic Alphabet</title>" in html
+    assert "Aachen" in html and "Kanal|7" in html
+
+    md = render_card("md", extra_rows=[("Ch", "Kanal|7")])
+    assert md.startswith(f"# {TITLE}\n")
+    assert "| Ch | Kanal\\|7 |" in md
+    assert md.count("\n| ") == 2 + 14
+    heading = render_card("md", title="Team *Blue* | <1>").splitlines()[0]
+    assert heading == "# Team \\*Blue\\* \\| \\<1\\>"
+
+
+def test_unknown_format_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Valid formats: html, svg, md"):
+        render_card("pdf")
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_export_command(fmt: str, tmp_path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(main, ["export", "--format", fmt, "--title", "Call signs"])
+    assert result.exit_code == 0, result.output
+    assert "Call signs" in result.output and "November" in result.output
+
+    dest = tmp_path / f"card.{fmt}"
+    result = runner.invoke(main, ["export", "--format", fmt, "-o", str(dest)])
+    assert result.exit_code == 0 and result.output == ""
+    assert dest.read_text(encoding="utf-8") == render_card(fmt)
@@ -0,0 +1,52 @@
+"""Tests for the click commands in nato_phonetic.cli."""
+
+import json
+
+from click.testing import CliRunner
+
+from nato_phonetic.cli import main
+
+
+def test_encode_arguments_and_options():
+    runner = CliRunner()
+
+    plain = runner.invoke(main, ["encode", "ab", "c1"])
+    icao = runner.invoke(main, ["encode", "--format", "tsv", "-a", "icao", "a9"])
+
+    assert plain.exit_code == 0 and plain.output == "Alpha Bravo\nCharlie One\n"
+    assert icao.exit_code == 0 and icao.output == "a9\tAlfa Niner\n"
+
+
+def test_encode_stream_reads_stdin_and_input_file(tmp_path):
+    runner = CliRunner()
+    source = tmp_path / "ids.txt"
+    source.write_text("ab\nz\n", encoding="utf-8")
+
+    stdin = runner.invoke(main, ["encode", "--stream", "--format", "jsonl"], input="hi\n")
+    from_file = runner.invoke(main, ["encode", "-s", "-i", str(source)])
+
+    assert stdin.exit_code == 0
+    assert json.loads(stdin.output)["spelling"] == ["Hotel", "India"]
+    assert from_file.exit_code == 0 and from_file.output == "Alpha Bravo\nZulu\n"
+
+
+def test_encode_rejects_stream_with_text():
+    result = CliRunner().invoke(main, ["encode", "--stream", "ab"], input="cd\n")
+
+    assert result.exit_code == 2
+    assert "not both" in result.output
+
+
+def test_help_lists_every_command():
+    result = CliRunner().invoke(main, ["--help"])
+
+    assert result.exit_code == 0
+    for name in main.commands:
+        assert f"│ {name} " in result.output, name
+
+
+def test_help_lists_format_only_with_a_word():
+    output = CliRunner().invoke(main, ["--help"]).output
+
+    assert "WORD [--format FORMAT]" in output
+    assert "│ --format" not in output
@@ -6,6 +6,10 @@ from nato_phonetic.core import (
     NATO_PHONETIC_ALPHABET,
     lookup_letter,
     spell_word,
+    spell_string,
+    spell_many,
+    spell_compact,
+    spell_lines,
     get_full_alphabet,
     is_valid_letter,
 )
@@ -102,14 +106,21 @@ class TestSpellWord:
 
     def test_spell_word_with_special_characters(self):
         """Test spelling a word with special characters."""
-        result = spell_word("A!B")
+        result = spell_word("A!B§")
         expected = [
             ("A", "Alpha"),
-            ("!", "Special"),
+            ("!", "Exclamation"),
             ("B", "Bravo"),
+            ("§", "Special"),
         ]
         assert result == expected
 
+    def test_spell_word_with_symbols(self):
+        """Test that punctuation is read out by name."""
+        assert spell_string("a-b.c@d/e_f") == (
+            "Alpha Dash Bravo Dot Charlie At Delta Slash Echo Underscore Foxtrot"
+        )
+
     def test_spell_empty_word(self):
         """Test spelling an empty word."""
         result = spell_word("")
@@ -161,3 +172,82 @@ class TestIsValidLetter:
     def test_empty_string(self):
         """Test an empty string."""
         assert is_valid_letter("") is False
+
+
+class TestSpellString:
+    """Test the spell_string function."""
+
+    def test_spell_string_simple_word(self):
+        """Test spelling a word into a joined string."""
+        assert spell_string("ab1") == "Alpha Bravo One"
+
+    def test_spell_string_with_space_and_special(self):
+        """Test that spaces and special characters keep their labels."""
+        assert spell_string("A B§") == "Alpha Space Bravo Special"
+
+    def test_spell_string_custom_separator(self):
+        """Test joining with a custom separator."""
+        assert spell_string("OK", sep="-") == "Oscar-Kilo"
+
+    def test_spell_string_empty_word(self):
+        """Test spelling an empty word."""
+        assert spell_string("") == ""
+
+
+class TestSpellMany:
+    """Test the spell_many function."""
+
+    def test_spell_many_tuples(self):
+        """Test the default tuple output."""
+        assert spell_many(["ab", "1"]) == [spell_word("ab"), spell_word("1")]
+
+    def test_spell_many_strings(self):
+        """Test the joined-string output."""
+        assert spell_many(["ab", "1"], output="strings") == ["Alpha Bravo", "One"]
+
+    def test_spell_many_flat(self):
+        """Test the flat offsets/token-id output."""
+        flat = spell_many(["ab", "1"], output="flat")
+        assert len(flat) == 2
+        assert flat[0] == spell_word("ab")
+        assert flat.spelled(1) == "One"
+
+    def test_spell_many_empty(self):
+        """Test spelling an empty batch."""
+        assert spell_many([]) == []
+        assert len(spell_many([], output="flat")) == 0
+
+
+class TestSpellCompact:
+    """Test the spell_compact function."""
+
+    def test_spell_compact_matches_spell_word(self):
+        """Test that the compact result decodes to the spell_word tuples."""
+        assert spell_compact("Hi 5!") == spell_word("Hi 5!")
+
+    def test_spell_compact_to_string(self):
+        """Test decoding the compact result to a string."""
+        assert spell_compact("ab").to_string() == "Alpha Bravo"
+
+
+class TestSpellLines:
+    """Test the spell_lines generator."""
+
+    def test_spell_lines_strips_newlines(self):
+        """Test that line endings are removed and records keep their order."""
+        records = list(spell_lines(["ab\n", "\r\n", "1"]))
+        assert [line for line, _ in records] == ["ab", "", "1"]
+        assert [s.to_string() for _, s in records] == ["Alpha Bravo", "", "One"]
+
+    def test_spell_lines_is_lazy(self):
+        """Test that lines are pulled one batch at a time."""
+        pulled = []
+
+        def source():
+            for i in range(10):
+                pulled.append(i)
+                yield "a"
+
+        records = spell_lines(source(), batch_size=3)
+        next(records)
+        assert pulled == [0, 1, 2]
@@ -0,0 +1,93 @@
+"""Tests for the warm spelling server and its client."""
+
+import threading
+
+import pytest
+
+from nato_phonetic import daemon
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(__import__("socket"), "AF_UNIX"), reason="needs Unix sockets"
+)
+
+
+def _start(path):
+    """Run ``daemon.serve`` on a thread; return a callable that stops it."""
+    started = threading.Event()
+    holder = {}
+
+    def ready(srv):
+        holder["server"] = srv
+        started.set()
+
+    thread = threading.Thread(target=daemon.serve, args=(path,), kwargs={"ready": ready})
+    thread.start()
+    assert started.wait(10), "server did not start"
+
+    def stop():
+        holder["server"].shutdown()
+        thread.join(10)
+
+    return stop
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+    path = str(tmp_path / "p.sock")
+    stop = _start(path)
+    yield path
+    stop()
+
+
+def test_request_matches_local_render(server):
+    for fmt in ("plain", "tsv", "json", "csv", "table"):
+        assert daemon.request("N12 AB", fmt, path=server) == daemon.render("N12 AB", fmt)
+
+
+def test_request_passes_alphabet(server):
+    assert daemon.request("A9", "plain", alphabet="icao", path=server) == "Alfa Niner\n"
+
+
+def test_request_without_server_falls_back(tmp_path, monkeypatch):
+    monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+    assert daemon.request("HI", "plain", path=str(tmp_path / "missing.sock")) is None
+
+
+def test_request_ignores_foreign_or_non_socket_paths(server, tmp_path, monkeypatch):
+    regular = tmp_path / "not-a.sock"
+    regular.write_text("")
+    assert daemon.request("HI", "plain", path=str(regular)) is None
+
+    uid = daemon.os.getuid()
+    monkeypatch.setattr(daemon.os, "getuid", lambda: uid + 1)
+    assert daemon.request("HI", "plain", path=server) is None
+
+
+def test_request_disabled_by_environment(server, monkeypatch):
+    monkeypatch.setenv(daemon.DISABLE_ENV, "1")
+    assert daemon.request("HI", "plain", path=server) is None
+
+
+def test_unknown_format_gets_no_answer(server):
+    assert daemon.request("HI", "xml", path=server) is None
+
+
+def test_second_server_refuses_to_start(server):
+    with pytest.raises(daemon.DaemonError, match="already listening"):
+        daemon.serve(server)
+
+
+def test_stale_socket_file_is_replaced(tmp_path):
+    import socket
+
+    path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    _start(path)()
+
+
+def test_default_socket_path_honours_override(monkeypatch):
+    monkeypatch.setenv(daemon.SOCKET_ENV, "/tmp/custom.sock")
+    assert daemon.default_socket_path() == "/tmp/custom.sock"
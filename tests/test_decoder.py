@@ -0,0 +1,63 @@
+"""Tests for decoding phonetic words back to text."""
+
+import pytest
+
+from nato_phonetic.core import NATO_PHONETIC_ALPHABET, spell_string
+from nato_phonetic.decoder import DecodeError, Decoder, decode, decode_many
+
+
+def test_decode_simple_word():
+    assert decode("Hotel Echo Lima Lima Oscar") == "HELLO"
+
+
+def test_decode_is_case_insensitive():
+    assert decode("hotel ECHO lImA") == "HEL"
+
+
+def test_decode_accepts_variants():
+    assert decode("Xray X-ray X-RAY Whisky Juliett Alfa Niner") == "XXXWJA9"
+
+
+def test_decode_ignores_punctuation_between_words():
+    assert decode("Alpha, Bravo. Charlie!\nDelta") == "ABCD"
+
+
+def test_decode_splits_hyphenated_words():
+    assert decode("Alpha-Bravo") == "AB"
+
+
+def test_decode_round_trips_spell_string():
+    text = "N123 AB"
+    assert decode(spell_string(text)) == text
+
+
+def test_decode_unknown_word_strict():
+    with pytest.raises(DecodeError, match="'Foo' at position 6") as exc:
+        decode("Alpha Foo")
+    assert exc.value.token == "Foo"
+
+
+def test_decode_unknown_word_ignore_and_replace():
+    assert decode("Alpha Foo Bravo", errors="ignore") == "AB"
+    assert decode("Alpha Foo Bravo", errors="replace") == "A?B"
+
+
+def test_decode_rejects_unknown_errors_mode():
+    with pytest.raises(ValueError, match="Unknown errors mode"):
+        decode("Alpha", errors="loud")
+
+
+def test_decode_many():
+    assert decode_many(["Alpha", "Bravo Two"]) == ["A", "B2"]
+
+
+def test_decoder_lookup():
+    decoder = Decoder(NATO_PHONETIC_ALPHABET)
+    assert decoder.lookup("x-ray") == "X"
+    assert decoder.lookup("nope") is None
+
+
+def test_symbols_round_trip():
+    text = "USER_1@MAIL.EXAMPLE/A-B"
+    assert decode(spell_string(text)) == text
+    assert decode("Alpha Hyphen Bravo Period") == "A-B."
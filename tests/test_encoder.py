@@ -0,0 +1,111 @@
+"""Tests for the precompiled encoder tables."""
+
+import pytest
+
+from nato_phonetic.core import NATO_PHONETIC_ALPHABET
+from nato_phonetic.encoder import SPACE, SPECIAL, UNKNOWN, Encoder
+
+
+def _reference_spell(word):
+    """The original per-character loop the encoder replaces."""
+    result = []
+    for char in word.upper():
+        if char.isalnum():
+            result.append((char, NATO_PHONETIC_ALPHABET.get(char) or UNKNOWN))
+        elif char.isspace():
+            result.append((char, SPACE))
+        else:
+            result.append((char, SPECIAL))
+    return result
+
+
+def test_spell_matches_reference_loop():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    for word in ["", "N123AB", "hello world", "a-b_c.d@e", "tab\there", "Ωmega", "straße"]:
+        assert encoder.spell(word) == _reference_spell(word)
+
+
+def test_spell_string_matches_spell():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    word = "Flight 42 / É"
+    assert encoder.spell_string(word) == " ".join(p for _, p in encoder.spell(word))
+
+
+def test_non_ascii_characters_are_cached():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    assert encoder.spell("é") == [("É", UNKNOWN)]
+    assert "É" in encoder._pairs
+    assert encoder.spell("é")[0] is encoder.spell("é")[0]
+
+
+def test_encoder_uses_its_own_alphabet():
+    encoder = Encoder({"A": "Adam"})
+    assert encoder.spell_string("ab") == f"Adam {UNKNOWN}"
+
+
+def test_spell_many_outputs_agree():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    words = ["N123AB", "", "a b!", "straße", "é"]
+    tuples = encoder.spell_many(words)
+    strings = encoder.spell_many(iter(words), output="strings")
+    flat = encoder.spell_many(words, output="flat")
+
+    assert tuples == [encoder.spell(w) for w in words]
+    assert strings == [encoder.spell_string(w) for w in words]
+    assert len(flat) == len(words)
+    assert list(flat) == tuples
+    assert [flat.spelled(i) for i in range(len(flat))] == strings
+    assert flat[-1] == tuples[-1]
+    assert list(encoder.spell_flat(iter(words))) == tuples
+
+
+def test_flat_output_is_array_backed():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    flat = encoder.spell_many(["ab", "c"], output="flat")
+    assert flat.text == "ABC"
+    assert list(flat.offsets) == [0, 2, 3]
+    assert flat.ids.typecode == "B"
+    assert [flat.vocabulary[i] for i in flat.ids] == ["Alpha", "Bravo", "Charlie"]
+
+
+def test_flat_index_out_of_range():
+    flat = Encoder(NATO_PHONETIC_ALPHABET).spell_many(["a"], output="flat")
+    with pytest.raises(IndexError):
+        flat[1]
+
+
+def test_encode_ids_round_trip():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    ids = encoder.encode_ids("a?")
+    assert [encoder.vocabulary[i] for i in ids] == ["Alpha", SPECIAL]
+
+
+def test_spell_many_rejects_unknown_output():
+    with pytest.raises(ValueError, match="Unknown output"):
+        Encoder(NATO_PHONETIC_ALPHABET).spell_many(["a"], output="nope")
+
+
+def test_compact_spelling_decodes_lazily():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    compact = encoder.spell_compact("a b!")
+    assert compact.ids.typecode == "B"
+    assert len(compact) == 4
+    assert compact[0] == ("A", "Alpha")
+    assert compact[-1] == ("!", SPECIAL)
+    assert compact == encoder.spell("a b!")
+    assert compact.to_tuples() == encoder.spell("a b!")
+    assert compact.words() == ["Alpha", SPACE, "Bravo", SPECIAL]
+    assert compact.to_string() == encoder.spell_string("a b!")
+
+
+def test_compact_spellings_share_vocabulary():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    first, second = encoder.spell_many(["ab", "cd"], output="compact")
+    assert first.vocabulary is second.vocabulary is encoder.vocabulary
+    assert first[1:] == [("B", "Bravo")]
+
+
+def test_flat_compact_matches_spell_compact():
+    encoder = Encoder(NATO_PHONETIC_ALPHABET)
+    flat = encoder.spell_many(["xy", "z9"], output="flat")
+    assert flat.compact(1) == encoder.spell_compact("z9")
@@ -0,0 +1,67 @@
+"""Tests for the plain and machine-readable output formats."""
+
+import io
+import json
+
+import pytest
+
+from nato_phonetic.core import spell_lines, spell_word
+from nato_phonetic.formats import render_word, write_records
+
+
+def _render(lines, fmt):
+    out = io.StringIO()
+    count = write_records(spell_lines(lines), out, fmt)
+    return count, out.getvalue()
+
+
+def test_plain_format_one_line_per_record():
+    assert _render(["ab", "", "1"], "plain") == (3, "Alpha Bravo\n\nOne\n")
+
+
+def test_tsv_format_escapes_tabs():
+    _, text = _render(["a\tb"], "tsv")
+    assert text == "a\\tb\tAlpha Space Bravo\n"
+
+
+def test_jsonl_format():
+    _, text = _render(["hi", "É"], "jsonl")
+    records = [json.loads(line) for line in text.splitlines()]
+    assert records == [
+        {"input": "hi", "spelling": ["Hotel", "India"]},
+        {"input": "É", "spelling": ["Unknown"]},
+    ]
+
+
+def test_unknown_format_raises():
+    with pytest.raises(ValueError, match="Unknown format"):
+        _render(["a"], "xml")
+
+
+def test_render_word_plain():
+    assert render_word("Hi", spell_word("Hi")) == "Hotel India\n"
+
+
+def test_render_word_tsv():
+    assert render_word("a b", spell_word("a b"), "tsv") == "A\tAlpha\n \tSpace\nB\tBravo\n"
+
+
+def test_render_word_csv_quotes_commas():
+    text = render_word("a,", spell_word("a,"), "csv")
+    assert text == 'letter,phonetic\nA,Alpha\n",",Comma\n'
+
+
+def test_render_word_json():
+    record = json.loads(render_word("ok", spell_word("ok"), "json"))
+    assert record == {
+        "word": "ok",
+        "spelling": [
+            {"letter": "O", "phonetic": "Oscar"},
+            {"letter": "K", "phonetic": "Kilo"},
+        ],
+    }
+
+
+def test_render_word_unknown_format():
+    with pytest.raises(ValueError, match="Unknown format"):
+        render_word("a", spell_word("a"), "table")
@@ -0,0 +1,76 @@
+"""Tests for near-miss matching of phonetic words."""
+
+import time
+
+import pytest
+
+from nato_phonetic.decoder import DecodeError, decode, match_words
+from nato_phonetic.fuzzy import FuzzyIndex, edit_distance
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        ("kilo", "kilo", 0),
+        ("kilow", "kilo", 1),
+        ("novembre", "november", 1),
+        ("charly", "charlie", 2),
+        ("", "abc", 3),
+    ],
+)
+def test_edit_distance(a, b, expected):
+    assert edit_distance(a, b) == expected
+
+
+def test_index_finds_closest_word():
+    index = FuzzyIndex(["kilo", "lima", "charlie"])
+    assert index.lookup("kilow") == ("kilo", 1)
+    assert index.lookup("charly") == ("charlie", 2)
+    assert index.lookup("zzzzzz") is None
+
+
+def test_index_agrees_with_brute_force():
+    words = ["alpha", "bravo", "charlie", "delta", "echo", "one", "two", "six"]
+    index = FuzzyIndex(words)
+    for term in ["alpa", "bravvo", "charli", "dleta", "eco", "on", "tw", "sx", "xyz"]:
+        limit = index.budget(term)
+        scored = sorted((edit_distance(term, w), w) for w in words)
+        expected = (scored[0][1], scored[0][0]) if scored[0][0] <= limit else None
+        assert index.lookup(term) == expected
+
+
+def test_fuzzy_decode_noisy_transcript():
+    assert decode("Charly Fox trot Kilow Novembre", fuzzy=True) == "CFKN"
+
+
+def test_fuzzy_decode_keeps_exact_behaviour():
+    assert decode("Hotel Echo Alpha-Bravo", fuzzy=True) == "HEAB"
+
+
+def test_fuzzy_decode_unknown_word():
+    with pytest.raises(DecodeError):
+        decode("Alpha xyzzy", fuzzy=True)
+    assert decode("Alpha xyzzy", "replace", fuzzy=True) == "A?"
+
+
+def test_fuzzy_decode_long_garbage_token_is_fast():
+    start = time.perf_counter()
+    assert decode("x" * 5000, "replace", fuzzy=True) == "?"
+    assert time.perf_counter() - start < 0.5
+
+
+def test_exact_decode_rejects_near_misses():
+    with pytest.raises(DecodeError):
+        decode("Charly")
+
+
+def test_match_words_scores_confidence():
+    exact, near, split = match_words("Alpha Kilow Fox trot")
+    assert (exact.char, exact.confidence) == ("A", 1.0)
+    assert near.char == "K" and 0 < near.confidence < 1
+    assert (split.token, split.char) == ("Fox trot", "F")
+
+
+def test_match_words_min_confidence():
+    (match,) = match_words("Charly", min_confidence=0.9)
+    assert match.char is None
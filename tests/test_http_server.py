@@ -0,0 +1,197 @@
+"""Tests for the asyncio HTTP service."""
+
+import asyncio
+import json
+
+from nato_phonetic.http_server import PhoneticHTTPServer
+
+
+async def _request(reader, writer, target, method="GET", body=b"", headers=""):
+    writer.write(
+        f"{method} {target} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n"
+        f"{headers}\r\n".encode()
+        + body
+    )
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    status = int(lines[0].split()[1])
+    fields = dict(line.split(": ", 1) for line in lines[1:] if ": " in line)
+    payload = await reader.readexactly(int(fields["Content-Length"]))
+    return status, fields, payload
+
+
+def _with_server(scenario):
+    async def main():
+        server = PhoneticHTTPServer(port=0)
+        await server.start()
+        try:
+            return await scenario(server)
+        finally:
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_endpoints_over_one_keep_alive_connection():
+    async def scenario(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        spell = await _request(reader, writer, "/spell?text=ab%201")
+        plain = await _request(reader, writer, "/spell?text=ab", headers="Accept: text/plain\r\n")
+        decode = await _request(reader, writer, "/decode?fuzzy=1", "POST", b"Hotel Charly")
+        alphabet = await _request(reader, writer, "/alphabet")
+        writer.close()
+        return spell, plain, decode, alphabet
+
+    spell, plain, decode, alphabet = _with_server(scenario)
+    assert spell[0] == 200 and spell[1]["Connection"] == "keep-alive"
+    assert json.loads(spell[2]) == {
+        "text": "ab 1",
+        "spelling": ["Alpha", "Bravo", "Space", "One"],
+    }
+    assert plain[2] == b"Alpha Bravo\n"
+    assert json.loads(decode[2])["decoded"] == "HC"
+    assert json.loads(alphabet[2])["Z"] == "Zulu"
+
+
+def test_errors_are_reported_with_status_codes():
+    async def scenario(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        results = [
+            await _request(reader, writer, "/nope"),
+            await _request(reader, writer, "/spell"),
+            await _request(reader, writer, "/decode?text=Foo"),
+            await _request(reader, writer, "/spell?text=a", "DELETE"),
+            await _request(reader, writer, "/spell?text=a&format=xml"),
+        ]
+        writer.close()
+        return results
+
+    statuses = [status for status, _, _ in _with_server(scenario)]
+    assert statuses == [404, 400, 400, 405, 400]
+
+
+def test_concurrent_spell_requests_are_batched():
+    async def scenario(server):
+        async def one(i):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            result = await _request(reader, writer, f"/spell?text={i}&format=plain")
+            writer.close()
+            return result[2]
+
+        results = await asyncio.gather(*(one(i) for i in range(50)))
+        return results, server.batcher.batches
+
+    results, batches = _with_server(scenario)
+    assert results[7] == b"Seven\n"
+    assert results[42] == b"Four Two\n"
+    assert batches < 50
+
+
+def test_connection_close_is_honoured():
+    async def scenario(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        status, fields, _ = await _request(
+            reader, writer, "/alphabet", headers="Connection: close\r\n"
+        )
+        return status, fields["Connection"], await reader.read()
+
+    assert _with_server(scenario) == (200, "close", b"")
+
+
+def test_alphabet_parameter_selects_alphabet():
+    async def scenario(server):
+        async def one(target):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            result = await _request(reader, writer, target)
+            writer.close()
+            return result
+
+        return await asyncio.gather(
+            one("/spell?text=a9&format=plain&alphabet=icao"),
+            one("/spell?text=a9&format=plain"),
+            one("/decode?text=Adam&alphabet=lapd&format=plain"),
+            one("/alphabet?alphabet=din5009"),
+            one("/alphabet?alphabet=klingon"),
+        )
+
+    icao, nato, lapd, din, unknown = _with_server(scenario)
+    assert icao[2] == b"Alfa Niner\n"
+    assert nato[2] == b"Alpha Nine\n"
+    assert lapd[2] == b"A\n"
+    assert json.loads(din[2])["K"] == "Köln"
+    assert unknown[0] == 400
+
+
+def test_chunked_bodies_are_rejected_and_expect_continue_is_answered():
+    async def scenario(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(
+            b"POST /decode HTTP/1.1\r\nHost: x\r\nContent-Length: 11\r\n"
+            b"Expect: 100-continue\r\n\r\n"
+        )
+        interim = await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"Hotel Kilow")
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+        decoded = json.loads(await reader.readexactly(length))
+        writer.write(
+            b"POST /spell HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"2\r\nab\r\n0\r\n\r\n"
+        )
+        chunked = await reader.read()
+        writer.close()
+        return interim, head, decoded, chunked
+
+    interim, head, decoded, chunked = _with_server(scenario)
+    assert interim == b"HTTP/1.1 100 Continue\r\n\r\n"
+    assert head.startswith(b"HTTP/1.1 400") and "Kilow" in decoded["error"]
+    assert chunked.startswith(b"HTTP/1.1 501 ") and b"Connection: close" in chunked
+
+
+def test_unexpected_errors_return_500():
+    async def scenario(server):
+        def broken(items):
+            raise RuntimeError("boom")
+
+        server.batcher.func = broken
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        failed = await _request(reader, writer, "/spell?text=a")
+        alphabet = await _request(reader, writer, "/alphabet")
+        writer.close()
+        return failed, alphabet
+
+    failed, alphabet = _with_server(scenario)
+    assert failed[0] == 500 and json.loads(failed[2]) == {"error": "Internal server error"}
+    assert alphabet[0] == 200
+
+
+def test_fuzzy_decode_runs_off_the_event_loop():
+    async def scenario(server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        result = await _request(
+            reader, writer, "/decode?fuzzy=1&errors=replace", "POST", b"Hotel Charly " * 2000
+        )
+        writer.close()
+        return result
+
+    status, _, payload = _with_server(scenario)
+    assert status == 200 and json.loads(payload)["decoded"] == "HC" * 2000
+
+
+def test_oversized_and_invalid_content_length_are_rejected():
+    async def send(server, length):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        head = f"POST /spell HTTP/1.1\r\nHost: x\r\nContent-Length: {length}\r\n\r\n"
+        writer.write(head.encode())
+        response = await reader.read()
+        writer.close()
+        return response
+
+    async def scenario(server):
+        return [await send(server, length) for length in (2 * 1024 * 1024, -5, "1x", "+3")]
+
+    oversized, *invalid = _with_server(scenario)
+    assert oversized.startswith(b"HTTP/1.1 413 ") and b"Connection: close" in oversized
+    for response in invalid:
+        assert response.startswith(b"HTTP/1.1 400 ")
+        assert response.endswith(b"Bad Content-Length\n")
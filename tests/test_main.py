@@ -0,0 +1,69 @@
+"""Tests for the fast word-spelling path in nato_phonetic.__main__."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from nato_phonetic import __main__ as entry
+from nato_phonetic.daemon import DISABLE_ENV
+
+
+@pytest.fixture(autouse=True)
+def _no_daemon(monkeypatch):
+    monkeypatch.setenv(DISABLE_ENV, "1")
+
+
+def _spell(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["phonetic", *args])
+    entry.main()
+    return capsys.readouterr().out
+
+
+def test_piped_output_defaults_to_plain():
+    result = subprocess.run(
+        [sys.executable, "-m", "nato_phonetic", "Ab1"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, DISABLE_ENV: "1"},
+    )
+    assert result.stdout == "Alpha Bravo One\n"
+
+
+@pytest.mark.parametrize("option", [["--format", "json"], ["--format=json"]])
+def test_format_json(monkeypatch, capsys, option):
+    out = _spell(monkeypatch, capsys, "Ab1", *option)
+    assert json.loads(out)["spelling"][2] == {"letter": "1", "phonetic": "One"}
+
+
+@pytest.mark.parametrize(
+    "fmt, expected",
+    [
+        ("tsv", "A\tAlpha\nB\tBravo\n1\tOne\n"),
+        ("csv", "letter,phonetic\nA,Alpha\nB,Bravo\n1,One\n"),
+    ],
+)
+def test_format_tsv_and_csv(monkeypatch, capsys, fmt, expected):
+    assert _spell(monkeypatch, capsys, "--format", fmt, "Ab1") == expected
+
+
+def test_transliterate_flag_is_stripped_and_applied(monkeypatch, capsys):
+    assert _spell(monkeypatch, capsys, "-t", "Émil") == "Echo Mike India Lima\n"
+    assert _spell(monkeypatch, capsys, "Émil", "--transliterate", "-a", "icao") == (
+        "Echo Mike India Lima\n"
+    )
+
+
+def test_invalid_format_exits_with_choices(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["phonetic", "Ab", "--format", "xml"])
+    with pytest.raises(SystemExit, match="Choose from: table, plain"):
+        entry.main()
+
+
+def test_pop_option_handles_both_spellings():
+    assert entry._pop_option(["-a", "icao", "x"], "-a", "--alphabet") == ("icao", ["x"])
+    assert entry._pop_option(["x", "--alphabet=lapd"], "-a", "--alphabet") == ("lapd", ["x"])
+    assert entry._pop_option(["x"], "--format") == (None, ["x"])
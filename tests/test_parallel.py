@@ -0,0 +1,68 @@
+"""Tests for process-pool spelling in nato_phonetic.parallel."""
+
+import io
+from multiprocessing import get_context
+
+import pytest
+
+from nato_phonetic import alphabets
+
+from nato_phonetic.core import spell_lines, spell_many
+from nato_phonetic.encoder import FlatSpelling
+from nato_phonetic.formats import write_records
+from nato_phonetic.parallel import format_lines, spell_many_flat
+
+WORDS = [f"N{i}AB-{i % 7}!" for i in range(200)] + ["", "héllo", "  "]
+
+
+def test_concat_shifts_offsets():
+    left = spell_many(["ab", "c"], output="flat")
+    right = spell_many(["", "1"], output="flat")
+    joined = FlatSpelling.concat([left, right])
+    assert list(joined) == spell_many(["ab", "c", "", "1"])
+    assert len(FlatSpelling.concat([])) == 0
+
+
+@pytest.mark.parametrize("output", ["tuples", "strings", "compact"])
+def test_spell_many_workers_matches_serial(output):
+    assert spell_many(WORDS, output=output, workers=2) == spell_many(WORDS, output=output)
+
+
+def test_spell_many_flat_preserves_order():
+    flat = spell_many_flat(WORDS, workers=2)
+    assert [flat.spelled(i) for i in range(len(flat))] == spell_many(WORDS, output="strings")
+
+
+def test_spell_many_workers_rejects_unknown_output():
+    with pytest.raises(ValueError):
+        spell_many(WORDS, output="bogus", workers=2)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("fmt", ["plain", "tsv", "jsonl"])
+def test_format_lines_matches_serial(fmt):
+    lines = [f"{word}\n" for word in WORDS]
+    serial = io.StringIO()
+    write_records(spell_lines(lines), serial, fmt)
+    assert "".join(format_lines(lines, fmt, workers=2, batch_size=16)) == serial.getvalue()
+
+
+def test_runtime_alphabet_reaches_spawned_workers(monkeypatch):
+    for name in ("_REGISTRY", "_ALIASES", "_ENCODERS", "_DECODERS"):
+        monkeypatch.setattr(alphabets, name, dict(getattr(alphabets, name)))
+    alphabets.register_alphabet("fruit", {"A": "Apple", "B": "Banana"}, symbols={})
+    spawn = get_context("spawn")
+    words = ["ab", "ba!"] * 8
+
+    flat = spell_many_flat(words, workers=2, alphabet="fruit", mp_context=spawn)
+    lines = format_lines(
+        [f"{word}\n" for word in words],
+        "plain",
+        2,
+        batch_size=4,
+        alphabet="fruit",
+        mp_context=spawn,
+    )
+
+    expected = spell_many(words, output="strings", alphabet="fruit")
+    assert [flat.spelled(i) for i in range(len(flat))] == expected
+    assert "".join(lines).splitlines()[:2] == ["Apple Banana", "Banana Apple Special"]
@@ -0,0 +1,76 @@
+"""Guard the import cost of the ``phonetic`` entry point."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that spelling a word must not import.
+HEAVY_MODULES = (
+    "click",
+    "rich",
+    "urllib.request",
+    "importlib.metadata",
+    "nato_phonetic.cli",
+    "nato_phonetic.assets",
+)
+
+# Generous ceiling for the cumulative ``-X importtime`` of the entry point;
+# it sits well under this today and several times above it with Rich loaded.
+IMPORT_BUDGET_US = 150_000
+
+_SPELL = (
+    "import sys; sys.argv = ['phonetic', 'HELLO']; "
+    "from nato_phonetic.__main__ import main; main()"
+)
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def test_spelling_a_word_skips_heavy_imports():
+    check = "; ".join(
+        [_SPELL, f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules], file=sys.stderr)"]
+    )
+    result = _run("-c", check)
+    assert result.stdout == "Hotel Echo Lima Lima Oscar\n"
+    assert result.stderr.strip() == "[]"
+
+
+def test_entry_point_import_time_budget():
+    result = _run("-X", "importtime", "-c", _SPELL)
+    cumulative = {
+        line.rsplit("|", 1)[1].strip(): int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+    assert cumulative["nato_phonetic.__main__"] < IMPORT_BUDGET_US
+
+
+def test_known_commands_match_cli():
+    from nato_phonetic.__main__ import COMMANDS
+    from nato_phonetic.cli import main
+
+    assert COMMANDS == set(main.commands)
+
+
+def test_every_command_is_routed_to_the_cli(monkeypatch):
+    from nato_phonetic import __main__ as entry
+    from nato_phonetic.cli import main
+
+    routed = []
+    monkeypatch.setattr(entry, "_run_cli", lambda: routed.append(sys.argv[1]))
+    for name in main.commands:
+        monkeypatch.setattr(sys, "argv", ["phonetic", name])
+        entry.main()
+    assert sorted(routed) == sorted(main.commands)
+
+
+@pytest.mark.parametrize("name", ["decode", "DecodeError", "__version__"])
+def test_lazy_package_attributes(name):
+    import nato_phonetic
+
+    assert getattr(nato_phonetic, name)
@@ -0,0 +1,63 @@
+"""Tests for transliteration in nato_phonetic.translit."""
+
+import pytest
+
+from nato_phonetic import translit
+from nato_phonetic.core import spell_lines, spell_many, spell_string, spell_word
+from nato_phonetic.translit import Transliterator, transliterate, transliterate_char
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("N123AB", "N123AB"),
+        ("Émile Zoë", "Emile Zoe"),
+        ("Müller STRAẞE", "Mueller STRASSE"),
+        ("Ørsted Åse Æbelø", "OErsted AAse AEbeloe"),
+        ("Москва", "Moskva"),
+        ("Щука", "SHCHuka"),
+        ("Αθήνα", "Athina"),
+        ("ﬁx Ａ１ x²", "fix A1 x2"),
+        ("Łódź", "Lodz"),
+        ("東京", "東京"),
+    ],
+)
+def test_transliterate(text, expected):
+    assert transliterate(text) == expected
+
+
+def test_transliterate_char_is_cached():
+    transliterate_char.cache_clear()
+    transliterate_char("é")
+    transliterate_char("é")
+    assert transliterate_char.cache_info().hits == 1
+
+
+def test_keep_leaves_alphabet_letters_alone():
+    assert Transliterator(keep="Ä")("Ärger ö") == "Ärger oe"
+
+
+def test_translate_table_stays_bounded(monkeypatch):
+    monkeypatch.setattr(translit, "CACHE_SIZE", 8)
+    convert = Transliterator(keep="Ä")
+    convert("".join(chr(cp) for cp in range(0x430, 0x450)))
+    assert len(convert._table) <= 8
+    assert convert("Ä") == "Ä"
+
+
+def test_spelling_with_transliteration():
+    assert spell_word("é") == [("É", "Unknown")]
+    assert spell_word("é", transliterate=True) == [("E", "Echo")]
+    assert spell_string("Жук", transliterate=True) == "Zulu Hotel Uniform Kilo"
+    assert spell_many(["Ø"], output="strings", transliterate=True) == ["Oscar Echo"]
+
+
+def test_alphabet_letters_are_not_transliterated():
+    assert spell_string("Ä", alphabet="din5009", transliterate=True) == "Umlaut-Aachen"
+    assert spell_string("Ä", transliterate=True) == "Alpha Echo"
+
+
+def test_spell_lines_keeps_original_line():
+    [(line, spelling)] = spell_lines(["Zoë\n"], transliterate=True)
+    assert line == "Zoë"
+    assert spelling.to_string() == "Zulu Oscar Echo"